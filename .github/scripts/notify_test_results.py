@@ -4,12 +4,44 @@ Test Results Notification Script
 Sends notifications about test results to configured channels.
 """
 
+import atexit
 import json
 import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional
 
+# Connect/read timeouts for webhook calls (seconds)
+SLACK_TIMEOUT = (2, 5)
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Background executor so webhook I/O does not block the calling step
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notify")
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
+
+def get_session() -> requests.Session:
+    """Return the shared keep-alive session used for webhook calls."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=4,
+                    max_retries=Retry(total=3, backoff_factor=0.2)
+                ))
+                atexit.register(session.close)
+                _SESSION = session
+    return _SESSION
+
 
 def send_slack_notification(webhook_url: str, message: str, color: str = "good"):
     """Send notification to Slack."""
@@ -23,34 +55,44 @@ def send_slack_notification(webhook_url: str, message: str, color: str = "good")
         ]
     }
     
-    response = requests.post(webhook_url, json=payload)
+    response = get_session().post(webhook_url, json=payload, timeout=SLACK_TIMEOUT)
     response.raise_for_status()
 
 
+def send_slack_notification_async(webhook_url: str, message: str, color: str = "good") -> Future:
+    """Queue a Slack notification; the process waits for it at exit."""
+    return _EXECUTOR.submit(send_slack_notification, webhook_url, message, color)
+
+
+def _report_notification_result(future: Future):
+    """Print the outcome of a background notification."""
+    error = future.exception()
+    if error is None:
+        print("Notification sent successfully")
+    else:
+        print(f"Failed to send notification: {error}")
+
+
+# Slack attachment color and header per workflow result
+_HEADER = {
+    "success": ("good", "✅ E2E Tests Passed"),
+    "failure": ("danger", "❌ E2E Tests Failed"),
+}
+_DEFAULT_HEADER = ("warning", "⚠️ E2E Tests Completed with Issues")
+
+# Status emoji per individual test result
+_EMOJI = {"success": "✅", "failure": "❌"}
+_DEFAULT_EMOJI = "⚠️"
+
+
 def generate_test_summary(workflow_result: str, test_results: Dict) -> tuple[str, str]:
     """Generate test summary message and determine color."""
-    if workflow_result == "success":
-        color = "good"
-        message = "✅ E2E Tests Passed"
-    elif workflow_result == "failure":
-        color = "danger"
-        message = "❌ E2E Tests Failed"
-    else:
-        color = "warning"
-        message = "⚠️ E2E Tests Completed with Issues"
-    
-    details = []
-    for test_type, result in test_results.items():
-        if result == "success":
-            details.append(f"• {test_type}: ✅")
-        elif result == "failure":
-            details.append(f"• {test_type}: ❌")
-        else:
-            details.append(f"• {test_type}: ⚠️")
-    
-    if details:
-        message += "\n" + "\n".join(details)
-    
+    color, header = _HEADER.get(workflow_result, _DEFAULT_HEADER)
+    details = [
+        f"• {test_type}: {_EMOJI.get(result, _DEFAULT_EMOJI)}"
+        for test_type, result in test_results.items()
+    ]
+    message = "\n".join([header, *details])
     return message, color
 
 
@@ -82,11 +124,8 @@ def main():
     
     # Send notification if webhook is configured
     if webhook_url:
-        try:
-            send_slack_notification(webhook_url, message, color)
-            print("Notification sent successfully")
-        except Exception as e:
-            print(f"Failed to send notification: {e}")
+        future = send_slack_notification_async(webhook_url, message, color)
+        future.add_done_callback(_report_notification_result)
     else:
         print("No webhook URL configured, skipping notification")
         print(f"Message would be: {message}")
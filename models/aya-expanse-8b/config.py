@@ -6,10 +6,42 @@ the Aya Expanse 8B model in the single-model architecture.
 """
 
 import os
-from typing import Dict, List, Any, Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# Supported languages (Aya Expanse supports 114 languages), deduplicated in order
+_SUPPORTED_LANGS_TUPLE: Tuple[str, ...] = tuple(dict.fromkeys([
+    "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
+    "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
+    "fi", "hu", "cs", "sk", "sl", "hr", "sr", "bg", "ro", "uk",
+    "be", "lt", "lv", "et", "mt", "ga", "cy", "eu", "ca", "gl",
+    "ast", "an", "oc", "rm", "la", "el", "mk", "sq", "bs", "me",
+    "is", "fo", "kl", "gd", "gv", "br", "co", "sc", "nap", "scn",
+    "vec", "lij", "pms", "lmo", "eml", "rgn", "fur", "lld", "rm",
+    "he", "yi", "ar", "fa", "ur", "ps", "ku", "ckb", "az", "tk",
+    "ky", "kk", "uz", "tg", "mn", "bo", "my", "km", "lo", "si",
+    "bn", "gu", "pa", "ne", "mr", "mai", "bho", "mag", "awa", "bpy",
+    "as", "or", "ml", "kn", "te", "ta", "hy", "ka", "ab", "os",
+    "ce", "av", "lez", "lbe", "kbd", "ady", "krc", "uby", "inh",
+    "bua", "sah", "tyv", "chv", "udm", "komi", "mhr", "mrj", "mdf"
+]))
+_SUPPORTED_LANGS_SET: FrozenSet[str] = frozenset(_SUPPORTED_LANGS_TUPLE)
+
+
+@lru_cache(maxsize=1)
+def _cached_env_overrides() -> Mapping[str, Any]:
+    """Read environment overrides once per process (read-only view)."""
+    return MappingProxyType(AyaExpanse8BConfig._read_env_overrides())
+
+
+def invalidate_env_cache() -> None:
+    """Drop cached environment overrides (e.g. after tests mutate os.environ)."""
+    _cached_env_overrides.cache_clear()
+
+
 @dataclass
 class AyaExpanse8BConfig:
     """Configuration for Aya Expanse 8B model."""
@@ -28,6 +60,12 @@ class AyaExpanse8BConfig:
     gguf_filename: str = "aya-expanse-8b-Q4_K_M.gguf"  # Medium quantization
     n_ctx: int = 8192  # Full Aya context window
     n_gpu_layers: int = 20  # Optimal GPU layers
+    n_threads: Optional[int] = None  # None = physical cores minus one
+    numa: bool = False  # Enable llama.cpp NUMA-aware allocation on multi-socket hosts
+    use_mlock: bool = True  # Pin weights in RAM so pages are not evicted mid-generation
+    flash_attn: bool = True  # Fused attention kernels when llama-cpp supports them
+    n_batch: int = 1024  # Prompt-processing batch size (logical)
+    n_ubatch: int = 512  # Physical micro-batch size for prompt processing
     
     # Model parameters
     max_length: int = 3072  # Increased for longer translations
@@ -43,26 +81,14 @@ class AyaExpanse8BConfig:
     batch_size: int = 1
     num_beams: int = 1
     use_cache: bool = True
+    translation_cache_size: int = 1024  # In-process LRU of recent translations (0 disables)
+    health_check_interval: float = 300.0  # Seconds between deep (inference) health checks
     
     # Resource requirements
     memory_requirements: str = "8GB RAM + 4GB VRAM (recommended)"
     
     # Supported languages (Aya Expanse supports 114 languages)
-    supported_languages: List[str] = field(default_factory=lambda: [
-        "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
-        "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
-        "fi", "hu", "cs", "sk", "sl", "hr", "sr", "bg", "ro", "uk",
-        "be", "lt", "lv", "et", "mt", "ga", "cy", "eu", "ca", "gl",
-        "ast", "an", "oc", "rm", "la", "el", "mk", "sq", "bs", "me",
-        "is", "fo", "kl", "gd", "gv", "br", "co", "sc", "nap", "scn",
-        "vec", "lij", "pms", "lmo", "eml", "rgn", "fur", "lld", "rm",
-        "he", "yi", "ar", "fa", "ur", "ps", "ku", "ckb", "az", "tk",
-        "ky", "kk", "uz", "tg", "mn", "bo", "my", "km", "lo", "si",
-        "bn", "gu", "pa", "ne", "mr", "mai", "bho", "mag", "awa", "bpy",
-        "as", "or", "ml", "kn", "te", "ta", "hy", "ka", "ab", "os",
-        "ce", "av", "lez", "lbe", "kbd", "ady", "krc", "uby", "inh",
-        "bua", "sah", "tyv", "chv", "udm", "komi", "mhr", "mrj", "mdf"
-    ])
+    supported_languages: Tuple[str, ...] = _SUPPORTED_LANGS_TUPLE
     
     # Model-specific options
     model_options: Dict[str, Any] = field(default_factory=dict)
@@ -71,25 +97,31 @@ class AyaExpanse8BConfig:
     custom_prompt_template: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, config_dict: Dict[str, Any]) -> 'AyaExpanse8BConfig':
+    def from_dict(cls, config_dict: Dict[str, Any], skip_env: bool = False) -> 'AyaExpanse8BConfig':
         """
         Create configuration from dictionary.
         
         Args:
             config_dict: Configuration dictionary
+            skip_env: Bypass environment variable overrides entirely
             
         Returns:
             AyaExpanse8BConfig instance
         """
         # Override with environment variables if set
-        env_overrides = cls._get_env_overrides()
-        config_dict.update(env_overrides)
+        if not skip_env:
+            config_dict.update(cls._get_env_overrides())
         
         return cls(**{k: v for k, v in config_dict.items() if hasattr(cls, k)})
     
     @classmethod
     def _get_env_overrides(cls) -> Dict[str, Any]:
-        """Get configuration overrides from environment variables."""
+        """Get configuration overrides from environment variables (cached)."""
+        return dict(_cached_env_overrides())
+    
+    @staticmethod
+    def _read_env_overrides() -> Dict[str, Any]:
+        """Read configuration overrides from environment variables."""
         env_overrides = {}
         
         # Model path override
@@ -125,10 +157,52 @@ class AyaExpanse8BConfig:
             except ValueError:
                 pass
         
+        # CPU thread count override
+        if n_threads := os.getenv("LINGUA_NEXUS_AYA_N_THREADS"):
+            try:
+                env_overrides["n_threads"] = int(n_threads)
+            except ValueError:
+                pass
+        
+        # Prompt batch size overrides
+        if n_batch := os.getenv("LINGUA_NEXUS_AYA_N_BATCH"):
+            try:
+                env_overrides["n_batch"] = int(n_batch)
+            except ValueError:
+                pass
+        
+        if n_ubatch := os.getenv("LINGUA_NEXUS_AYA_N_UBATCH"):
+            try:
+                env_overrides["n_ubatch"] = int(n_ubatch)
+            except ValueError:
+                pass
+        
+        # Memory locking override
+        if use_mlock := os.getenv("LINGUA_NEXUS_AYA_MLOCK"):
+            env_overrides["use_mlock"] = use_mlock.lower() in ("true", "1", "yes")
+        
+        # Flash attention override
+        if flash_attn := os.getenv("LINGUA_NEXUS_AYA_FLASH_ATTN"):
+            env_overrides["flash_attn"] = flash_attn.lower() in ("true", "1", "yes")
+        
+        # NUMA override
+        if numa := os.getenv("LINGUA_NEXUS_AYA_NUMA"):
+            env_overrides["numa"] = numa.lower() in ("true", "1", "yes")
+        
         return env_overrides
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop the cached to_dict snapshot."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("_snapshot", None)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
+        return dict(self._snapshot)
+    
+    @cached_property
+    def _snapshot(self) -> Dict[str, Any]:
+        """Field snapshot reused by to_dict until a field is reassigned."""
         return {
             "model_name": self.model_name,
             "model_version": self.model_version,
@@ -139,6 +213,12 @@ class AyaExpanse8BConfig:
             "gguf_filename": self.gguf_filename,
             "n_ctx": self.n_ctx,
             "n_gpu_layers": self.n_gpu_layers,
+            "n_threads": self.n_threads,
+            "numa": self.numa,
+            "use_mlock": self.use_mlock,
+            "flash_attn": self.flash_attn,
+            "n_batch": self.n_batch,
+            "n_ubatch": self.n_ubatch,
             "max_length": self.max_length,
             "temperature": self.temperature,
             "top_p": self.top_p,
@@ -148,6 +228,8 @@ class AyaExpanse8BConfig:
             "batch_size": self.batch_size,
             "num_beams": self.num_beams,
             "use_cache": self.use_cache,
+            "translation_cache_size": self.translation_cache_size,
+            "health_check_interval": self.health_check_interval,
             "memory_requirements": self.memory_requirements,
             "supported_languages": self.supported_languages,
             "model_options": self.model_options,
@@ -5,24 +5,24 @@ This module provides the Aya Expanse 8B GGUF model implementation that integrate
 with the enhanced TranslationModel interface for single-model-per-instance deployment.
 """
 
+import importlib.util
 import os
+import re
 import time
-import torch
 import logging
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 
-from transformers import (
-    AutoModelForSeq2SeqLM, 
-    AutoTokenizer, 
-    BitsAndBytesConfig,
-    pipeline
-)
+# Heavy runtimes are bound on first use (see _import_transformers and
+# _import_llama_cpp) so GGUF-only deployments never import torch/transformers.
+torch = None
+AutoModelForSeq2SeqLM = None
+AutoTokenizer = None
+BitsAndBytesConfig = None
+pipeline = None
+Llama = None
 
-try:
-    from llama_cpp import Llama
-    LLAMA_CPP_AVAILABLE = True
-except ImportError:
-    LLAMA_CPP_AVAILABLE = False
+LLAMA_CPP_AVAILABLE = importlib.util.find_spec("llama_cpp") is not None
 
 from models.base import (
     TranslationModel,
@@ -34,37 +34,90 @@ from models.base import (
     ResourceError,
     ModelNotReadyError
 )
-from .config import AyaExpanse8BConfig
+from models.base.server_utils import load_server_util
+from .config import AyaExpanse8BConfig, _SUPPORTED_LANGS_SET, _SUPPORTED_LANGS_TUPLE
+
 
-# Import utilities from server (relative imports for compatibility)
+# Import utilities from server (package import, or by path when running from model directory)
 try:
     from server.app.utils.language_codes import LanguageCodeConverter
-    from server.app.utils.model_compat import (
-        get_device,
-        get_device_map,
-        check_memory_availability,
-        prepare_model_kwargs,
-        clear_memory_cache,
-        get_model_memory_footprint
-    )
 except ImportError:
-    # Fallback for when running from model directory
-    import sys
-    import os
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'server'))
-    from app.utils.language_codes import LanguageCodeConverter
-    from app.utils.model_compat import (
-        get_device,
-        get_device_map,
-        check_memory_availability,
-        prepare_model_kwargs,
-        clear_memory_cache,
-        get_model_memory_footprint
-    )
+    LanguageCodeConverter = load_server_util("language_codes").LanguageCodeConverter
+
+try:
+    from server.app.utils.language_detection import SCRIPT_MARK_TABLE as _DETECT_TABLE
+except ImportError:
+    _DETECT_TABLE = load_server_util("language_detection").SCRIPT_MARK_TABLE
 
 logger = logging.getLogger(__name__)
 
 
+def _import_transformers() -> None:
+    """Bind torch/transformers module globals on first use."""
+    global torch, AutoModelForSeq2SeqLM, AutoTokenizer, BitsAndBytesConfig, pipeline
+    if None not in (torch, AutoModelForSeq2SeqLM, AutoTokenizer, BitsAndBytesConfig, pipeline):
+        return
+    import torch as torch_module
+    import transformers
+    torch = torch or torch_module
+    AutoModelForSeq2SeqLM = AutoModelForSeq2SeqLM or transformers.AutoModelForSeq2SeqLM
+    AutoTokenizer = AutoTokenizer or transformers.AutoTokenizer
+    BitsAndBytesConfig = BitsAndBytesConfig or transformers.BitsAndBytesConfig
+    pipeline = pipeline or transformers.pipeline
+
+
+def _import_llama_cpp() -> None:
+    """Bind the llama-cpp Llama class on first use."""
+    global Llama
+    if Llama is None:
+        from llama_cpp import Llama as llama_cls
+        Llama = llama_cls
+
+
+def _default_n_threads() -> int:
+    """Physical core count minus one, leaving a core for the event loop."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    cores = cores or os.cpu_count() or 2
+    return max(1, cores - 1)
+
+
+def _model_compat():
+    """Import the torch-backed model_compat helpers on first use."""
+    try:
+        from server.app.utils import model_compat
+    except ImportError:
+        model_compat = load_server_util("model_compat")
+    return model_compat
+
+# Translation prompt templates, filled as (src, tgt, src, tgt, text)
+_SYSTEM_PROMPT = "You are a helpful multilingual translation assistant. Translate accurately from %s to %s."
+_USER_PROMPT = (
+    "Translate the following text from %s to %s. Return only the translation "
+    "without any additional text or explanation.\n\nText to translate: %s"
+)
+_GGUF_PROMPT_TEMPLATE = (
+    "<|START_OF_TURN_TOKEN|><|SYSTEM_TOKEN|>" + _SYSTEM_PROMPT + "<|END_OF_TURN_TOKEN|>"
+    "<|START_OF_TURN_TOKEN|><|USER_TOKEN|>" + _USER_PROMPT + "<|END_OF_TURN_TOKEN|>"
+    "<|START_OF_TURN_TOKEN|><|CHATBOT_TOKEN|>"
+)
+_HF_PROMPT_TEMPLATE = "<|SYSTEM|>" + _SYSTEM_PROMPT + "<|USER|>" + _USER_PROMPT + "<|ASSISTANT|>"
+
+# End-of-turn markers that end a GGUF completion inside llama.cpp's sampler
+_GGUF_STOP_SEQUENCES = ["<|END_OF_TURN_TOKEN|>", "<|START_OF_TURN_TOKEN|>", "</s>"]
+
+# Boilerplate prefixes the model sometimes emits before the translation
+_PREFIX_RE = re.compile(
+    r'^\s*(?:translation|translated text|output|result|the translation is|'
+    r'here is the translation|translated|answer)\s*:\s*',
+    re.IGNORECASE
+)
+_WRAP_QUOTES_RE = re.compile(r'^([\'"])(.*)\1$', re.DOTALL)
+
+
 class AyaExpanse8BModel(TranslationModel):
     """
     Aya Expanse 8B model implementation.
@@ -84,9 +137,36 @@ class AyaExpanse8BModel(TranslationModel):
         self.model = None
         self.tokenizer = None
         self.text_generator = None
+        self._gguf_gen_cfg: Dict[str, Any] = {}
+        self._hf_gen_cfg: Dict[str, Any] = {}
         self._initialized = False
         self._model_info = None
         
+        # LRU of recent translations keyed on (source_lang, target_lang, text)
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._cache_max = self.config.translation_cache_size
+        
+        # Throttled deep health check state
+        self._deep_check_ts = 0.0
+        self._deep_check_interval = self.config.health_check_interval
+        self._last_deep_ok = True
+        
+        # Hashed membership set for per-request language checks
+        if self.config.supported_languages is _SUPPORTED_LANGS_TUPLE:
+            self._supported_set = _SUPPORTED_LANGS_SET
+        else:
+            self._supported_set = frozenset(self.config.supported_languages)
+        
+        # Runtime selection and prompt template are fixed for the instance
+        self._use_gguf_runtime = self.config.use_gguf and LLAMA_CPP_AVAILABLE
+        self._prompt_template = _GGUF_PROMPT_TEMPLATE if self._use_gguf_runtime else _HF_PROMPT_TEMPLATE
+        
+        # ISO code -> Aya language name, resolved once instead of per request
+        self._iso_to_aya = {
+            code: LanguageCodeConverter.to_model_code(code, 'aya')
+            for code in LanguageCodeConverter.get_supported_languages('aya')
+        }
+        
         logger.info(f"Initializing Aya Expanse 8B model with config: {self.config}")
     
     async def initialize(self) -> None:
@@ -94,11 +174,12 @@ class AyaExpanse8BModel(TranslationModel):
         try:
             logger.info(f"Loading Aya Expanse 8B model from {self.config.model_path}")
             
-            if self.config.use_gguf and LLAMA_CPP_AVAILABLE:
+            if self._use_gguf_runtime:
                 await self._load_gguf_model()
             else:
                 await self._load_transformers_model()
             
+            self._build_generation_configs()
             self._initialized = True
             logger.info("Aya Expanse 8B model initialized successfully")
             
@@ -125,6 +206,12 @@ class AyaExpanse8BModel(TranslationModel):
         if not self._supports_language_pair(source_lang, target_lang):
             raise UnsupportedLanguageError(source_lang, target_lang, "aya-expanse-8b")
         
+        cache_key = (source_lang, target_lang, text)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+        
         try:
             logger.debug(f"Translating text from {source_lang} to {target_lang}")
             
@@ -134,14 +221,14 @@ class AyaExpanse8BModel(TranslationModel):
                 source_lang = detected_source
             
             # Convert ISO codes to Aya language names
-            source_lang_name = LanguageCodeConverter.to_model_code(source_lang, 'aya')
-            target_lang_name = LanguageCodeConverter.to_model_code(target_lang, 'aya')
+            source_lang_name = self._iso_to_aya.get(source_lang, source_lang)
+            target_lang_name = self._iso_to_aya.get(target_lang, target_lang)
             
             # Create translation prompt
             prompt = self._create_translation_prompt(text, source_lang_name, target_lang_name)
             
             # Generate translation
-            if self.config.use_gguf and LLAMA_CPP_AVAILABLE:
+            if self._use_gguf_runtime:
                 generated_text = await self._generate_gguf(prompt)
             else:
                 generated_text = await self._generate_transformers(prompt)
@@ -155,6 +242,7 @@ class AyaExpanse8BModel(TranslationModel):
                 translated_text = generated_text.strip()
             
             logger.debug(f"Translation completed: {translated_text[:100]}")
+            self._cache_translation(cache_key, translated_text)
             return translated_text
             
         except Exception as e:
@@ -162,18 +250,30 @@ class AyaExpanse8BModel(TranslationModel):
             raise TranslationError(f"Translation failed: {e}", "aya-expanse-8b")
     
     async def health_check(self) -> bool:
-        """Verify model readiness for inference."""
+        """
+        Verify model readiness for inference.
+        
+        The cheap readiness check runs on every call; the test translation
+        runs at most once per health_check_interval and its result is reused.
+        """
         try:
             if not self._initialized or self.model is None:
                 return False
             
+            now = time.monotonic()
+            if self._deep_check_ts and now - self._deep_check_ts < self._deep_check_interval:
+                return self._last_deep_ok
+            
             # Perform a quick test translation
             test_result = await self.translate("test", "en", "fr")
-            return bool(test_result and len(test_result.strip()) > 0)
+            self._last_deep_ok = bool(test_result and len(test_result.strip()) > 0)
             
         except Exception as e:
             logger.warning(f"Health check failed: {e}")
-            return False
+            self._last_deep_ok = False
+        
+        self._deep_check_ts = time.monotonic()
+        return self._last_deep_ok
     
     def get_model_info(self) -> ModelInfo:
         """Return model metadata and capabilities."""
@@ -181,7 +281,7 @@ class AyaExpanse8BModel(TranslationModel):
             self._model_info = ModelInfo(
                 name="aya-expanse-8b",
                 version=self.config.model_version,
-                supported_languages=self.config.supported_languages,
+                supported_languages=list(self.config.supported_languages),
                 max_tokens=self.config.max_length,
                 memory_requirements=self.config.memory_requirements,
                 description="Aya Expanse 8B multilingual translation model (GGUF format)"
@@ -198,7 +298,7 @@ class AyaExpanse8BModel(TranslationModel):
                 self.text_generator = None
             
             if self.model is not None:
-                if self.config.use_gguf and LLAMA_CPP_AVAILABLE and hasattr(self.model, 'close'):
+                if self._use_gguf_runtime and hasattr(self.model, 'close'):
                     self.model.close()
                 del self.model
                 self.model = None
@@ -207,22 +307,39 @@ class AyaExpanse8BModel(TranslationModel):
                 del self.tokenizer
                 self.tokenizer = None
             
-            clear_memory_cache()
+            self._cache.clear()
+            self._deep_check_ts = 0.0
+            
+            if not self._use_gguf_runtime:
+                _model_compat().clear_memory_cache()
             self._initialized = False
             logger.info("Aya Expanse 8B model cleanup completed")
             
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
     
+    def _cache_translation(self, key: Tuple[str, str, str], translated_text: str) -> None:
+        """Store a translation, evicting the least recently used entry when full."""
+        if self._cache_max <= 0:
+            return
+        self._cache[key] = translated_text
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+    
     def _supports_language_pair(self, source_lang: str, target_lang: str) -> bool:
         """Check if model supports the given language pair."""
-        supported = self.config.supported_languages
+        supported = self._supported_set
+        
+        # Identity pairs need a single lookup
+        if source_lang == target_lang:
+            return source_lang in supported
+        
+        if target_lang not in supported:
+            return False
         
         # Special handling for auto-detection
-        if source_lang == 'auto':
-            return target_lang in supported
-            
-        return source_lang in supported and target_lang in supported
+        return source_lang == 'auto' or source_lang in supported
     
     async def _load_gguf_model(self):
         """Load model using GGUF format with llama-cpp-python."""
@@ -272,19 +389,40 @@ class AyaExpanse8BModel(TranslationModel):
         # Update config with successful filename
         self.config.gguf_filename = successful_filename
         
+        # Explicit thread count; pin the process with taskset/cpuset for best results
+        n_threads = self.config.n_threads or _default_n_threads()
+        llama_kwargs = {
+            'model_path': model_file,
+            'n_ctx': self.config.n_ctx,
+            'n_gpu_layers': self.config.n_gpu_layers,
+            'verbose': False,
+            'use_mmap': True,
+            'use_mlock': self.config.use_mlock,
+            'n_threads': n_threads,
+            'n_threads_batch': n_threads,
+            'n_batch': min(self.config.n_batch, self.config.n_ctx),
+            'n_ubatch': min(self.config.n_ubatch, self.config.n_batch),
+            'seed': -1
+        }
+        if self.config.n_gpu_layers > 0:
+            # Keep the KV cache on the GPU alongside the offloaded layers
+            llama_kwargs['offload_kqv'] = True
+        if self.config.numa:
+            llama_kwargs['numa'] = True
+        if self.config.flash_attn:
+            llama_kwargs['flash_attn'] = True
+        
         # Initialize llama.cpp model
         try:
-            self.model = Llama(
-                model_path=model_file,
-                n_ctx=self.config.n_ctx,
-                n_gpu_layers=self.config.n_gpu_layers,
-                verbose=False,
-                use_mmap=True,
-                use_mlock=False,
-                n_threads=None,
-                n_batch=512,
-                seed=-1
-            )
+            _import_llama_cpp()
+            try:
+                self.model = Llama(**llama_kwargs)
+            except TypeError:
+                # Older llama-cpp-python releases do not accept flash_attn
+                if llama_kwargs.pop('flash_attn', None) is None:
+                    raise
+                logger.warning("llama-cpp-python does not support flash_attn, loading without it")
+                self.model = Llama(**llama_kwargs)
             logger.info(f"GGUF model '{successful_filename}' loaded successfully")
             
         except Exception as e:
@@ -294,6 +432,7 @@ class AyaExpanse8BModel(TranslationModel):
     async def _load_transformers_model(self):
         """Load model using transformers library (fallback)."""
         logger.info("Loading model using transformers library")
+        _import_transformers()
         
         # Load tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(
@@ -319,7 +458,7 @@ class AyaExpanse8BModel(TranslationModel):
             if quantization_config:
                 model_config['quantization_config'] = quantization_config
         
-        model_kwargs = prepare_model_kwargs(model_config)
+        model_kwargs = _model_compat().prepare_model_kwargs(model_config)
         
         # Load model
         try:
@@ -350,9 +489,10 @@ class AyaExpanse8BModel(TranslationModel):
             pad_token_id=self.tokenizer.eos_token_id
         )
     
-    def _get_quantization_config(self) -> Optional[BitsAndBytesConfig]:
+    def _get_quantization_config(self) -> Optional[Any]:
         """Get quantization configuration for memory optimization."""
         try:
+            _import_transformers()
             import bitsandbytes as bnb
             
             if self.config.load_in_8bit:
@@ -382,26 +522,36 @@ class AyaExpanse8BModel(TranslationModel):
                 text=text
             )
         
-        system_prompt = f"You are a helpful multilingual translation assistant. Translate accurately from {source_lang} to {target_lang}."
-        user_prompt = f"Translate the following text from {source_lang} to {target_lang}. Return only the translation without any additional text or explanation.\n\nText to translate: {text}"
-        
-        if self.config.use_gguf and LLAMA_CPP_AVAILABLE:
-            return f"<|START_OF_TURN_TOKEN|><|SYSTEM_TOKEN|>{system_prompt}<|END_OF_TURN_TOKEN|><|START_OF_TURN_TOKEN|><|USER_TOKEN|>{user_prompt}<|END_OF_TURN_TOKEN|><|START_OF_TURN_TOKEN|><|CHATBOT_TOKEN|>"
-        else:
-            return f"<|SYSTEM|>{system_prompt}<|USER|>{user_prompt}<|ASSISTANT|>"
+        return self._prompt_template % (source_lang, target_lang, source_lang, target_lang, text)
     
-    async def _generate_gguf(self, prompt: str) -> str:
-        """Generate text using GGUF model."""
-        generation_config = {
+    def _build_generation_configs(self) -> None:
+        """
+        Precompute generation kwargs once the runtime is loaded.
+        
+        Call again after mutating generation-related config fields.
+        """
+        self._gguf_gen_cfg = {
             "max_tokens": self.config.max_length,
             "temperature": self.config.temperature,
             "top_p": self.config.top_p,
             "repeat_penalty": 1.0,
+            "stop": _GGUF_STOP_SEQUENCES,
             "echo": False
         }
-        
+        if self.tokenizer is not None:
+            self._hf_gen_cfg = {
+                "max_new_tokens": self.config.max_length,
+                "temperature": self.config.temperature,
+                "top_p": self.config.top_p,
+                "do_sample": self.config.do_sample,
+                "pad_token_id": self.tokenizer.eos_token_id,
+                "eos_token_id": self.tokenizer.eos_token_id
+            }
+    
+    async def _generate_gguf(self, prompt: str) -> str:
+        """Generate text using GGUF model."""
         try:
-            response = self.model(prompt, **generation_config)
+            response = self.model(prompt, **self._gguf_gen_cfg)
             choice = response['choices'][0] if response.get('choices') else {}
             return choice.get('text', '')
         except Exception as e:
@@ -410,18 +560,12 @@ class AyaExpanse8BModel(TranslationModel):
     
     async def _generate_transformers(self, prompt: str) -> str:
         """Generate text using transformers pipeline."""
-        generation_config = {
-            "max_length": len(prompt) + self.config.max_length,
-            "max_new_tokens": self.config.max_length,
-            "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
-            "do_sample": self.config.do_sample,
-            "pad_token_id": self.tokenizer.eos_token_id,
-            "eos_token_id": self.tokenizer.eos_token_id
-        }
-        
         try:
-            generated = self.text_generator(prompt, **generation_config)
+            generated = self.text_generator(
+                prompt,
+                max_length=len(prompt) + self.config.max_length,
+                **self._hf_gen_cfg
+            )
             return generated[0]["generated_text"]
         except Exception as e:
             logger.error(f"Transformers generation failed: {e}")
@@ -436,20 +580,12 @@ class AyaExpanse8BModel(TranslationModel):
             translation = translation.replace(original_text, "").strip()
         
         # Remove common prefixes
-        prefixes_to_remove = [
-            "Translation:", "Translated text:", "Output:", "Result:",
-            "The translation is:", "Here is the translation:",
-            "Translated:", "Answer:"
-        ]
-        
-        for prefix in prefixes_to_remove:
-            if translation.lower().startswith(prefix.lower()):
-                translation = translation[len(prefix):].strip()
+        translation = _PREFIX_RE.sub('', translation, count=1)
         
         # Remove quotes if entire translation is quoted
-        if (translation.startswith('"') and translation.endswith('"')) or \
-           (translation.startswith("'") and translation.endswith("'")):
-            translation = translation[1:-1].strip()
+        match = _WRAP_QUOTES_RE.match(translation)
+        if match:
+            translation = match.group(2).strip()
         
         return translation
     
@@ -457,11 +593,11 @@ class AyaExpanse8BModel(TranslationModel):
         """Detect language using character-based analysis."""
         try:
             # Simple character-based detection
-            text_lower = text.lower()
+            marks = text.translate(_DETECT_TABLE)
             
-            # Count Cyrillic characters
-            cyrillic_chars = sum(1 for c in text_lower if 0x0400 <= ord(c) <= 0x04FF)
-            latin_letters = sum(1 for c in text_lower if 'a' <= c <= 'z')
+            # Count Cyrillic characters and Latin letters
+            cyrillic_chars = marks.count("C")
+            latin_letters = marks.count("L")
             
             letter_count = cyrillic_chars + latin_letters
             
@@ -19,7 +19,8 @@ from .request_models import (
     TranslationRequest,
     TranslationResponse,
     HealthCheckResponse,
-    ErrorResponse
+    ErrorResponse,
+    validate_translation_request
 )
 
 __all__ = [
@@ -32,6 +33,7 @@ __all__ = [
     "TranslationResponse", 
     "HealthCheckResponse",
     "ErrorResponse",
+    "validate_translation_request",
     
     # Exceptions
     "ModelError",
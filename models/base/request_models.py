@@ -3,33 +3,50 @@ Pydantic models for API requests and responses in the single-model architecture.
 
 This module defines the standardized request/response models that work with
 the new TranslationModel interface for consistent API integration.
+
+Response models expose a ``build`` classmethod that skips validation via
+``model_construct``. It is meant for server-side construction from values the
+server already produced or validated; untrusted input must go through normal
+validation (``TranslationRequest`` is never built this way).
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional, Dict, Any, Literal
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter
+
+# Language codes and text are normalised by pydantic-core rather than Python validators
+LanguageCode = Annotated[str, StringConstraints(min_length=2, to_lower=True)]
+TranslationText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=10000)]
+
+HealthStatus = Literal["healthy", "unhealthy", "initializing"]
 
 
 class TranslationRequest(BaseModel):
     """Request model for translation operations."""
     
-    text: str = Field(..., description="Text to translate", min_length=1, max_length=10000)
-    source_lang: str = Field(..., description="Source language code (ISO 639-1)")
-    target_lang: str = Field(..., description="Target language code (ISO 639-1)")
+    text: TranslationText = Field(..., description="Text to translate (surrounding whitespace stripped)")
+    source_lang: LanguageCode = Field(..., description="Source language code (ISO 639-1)")
+    target_lang: LanguageCode = Field(..., description="Target language code (ISO 639-1)")
     options: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional translation options")
+
+
+# Schema compiled once and reused for every request payload
+_REQUEST_ADAPTER = TypeAdapter(TranslationRequest)
+
+
+def validate_translation_request(payload: Any) -> TranslationRequest:
+    """
+    Validate an untrusted payload (e.g. decoded JSON) as a TranslationRequest.
     
-    @field_validator('text')
-    @classmethod
-    def text_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Text cannot be empty or whitespace only')
-        return v.strip()
-    
-    @field_validator('source_lang', 'target_lang')
-    @classmethod
-    def language_codes_must_be_valid(cls, v):
-        if not v or len(v) < 2:
-            raise ValueError('Language code must be at least 2 characters')
-        return v.lower()
+    Args:
+        payload: Mapping or TranslationRequest to validate
+        
+    Returns:
+        Validated TranslationRequest
+        
+    Raises:
+        pydantic.ValidationError: If the payload is invalid
+    """
+    return _REQUEST_ADAPTER.validate_python(payload)
 
 
 class TranslationResponse(BaseModel):
@@ -42,16 +59,56 @@ class TranslationResponse(BaseModel):
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
     confidence: Optional[float] = Field(None, description="Translation confidence score (0-1)")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
+    
+    @classmethod
+    def build(
+        cls,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+        model_name: str,
+        processing_time_ms: float,
+        confidence: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> "TranslationResponse":
+        """Construct from trusted server-side values without validation."""
+        return cls.model_construct(
+            translated_text=translated_text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            model_name=model_name,
+            processing_time_ms=processing_time_ms,
+            confidence=confidence,
+            metadata=metadata if metadata is not None else {}
+        )
 
 
 class HealthCheckResponse(BaseModel):
     """Response model for health check operations."""
     
-    status: str = Field(..., description="Health status ('healthy', 'unhealthy', 'initializing')")
+    status: HealthStatus = Field(..., description="Health status ('healthy', 'unhealthy', 'initializing')")
     model_name: str = Field(..., description="Name of the model being checked")
     model_info: Optional[Dict[str, Any]] = Field(None, description="Model information if available")
     timestamp: float = Field(..., description="Timestamp of health check")
     details: Optional[str] = Field(None, description="Additional status details")
+    
+    @classmethod
+    def build(
+        cls,
+        status: HealthStatus,
+        model_name: str,
+        timestamp: float,
+        model_info: Optional[Dict[str, Any]] = None,
+        details: Optional[str] = None
+    ) -> "HealthCheckResponse":
+        """Construct from trusted server-side values without validation."""
+        return cls.model_construct(
+            status=status,
+            model_name=model_name,
+            model_info=model_info,
+            timestamp=timestamp,
+            details=details
+        )
 
 
 class ErrorResponse(BaseModel):
@@ -61,4 +118,22 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Error message")
     model_name: Optional[str] = Field(None, description="Model that caused the error")
     timestamp: float = Field(..., description="Error timestamp")
-    details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
\ No newline at end of file
+    details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
+    
+    @classmethod
+    def build(
+        cls,
+        error: str,
+        message: str,
+        timestamp: float,
+        model_name: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> "ErrorResponse":
+        """Construct from trusted server-side values without validation."""
+        return cls.model_construct(
+            error=error,
+            message=message,
+            model_name=model_name,
+            timestamp=timestamp,
+            details=details
+        )
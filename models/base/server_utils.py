@@ -0,0 +1,30 @@
+"""
+Access to server/app/utils from model packages.
+
+Models normally import the server utilities as ``server.app.utils``; when a
+model runs from its own directory that package is not importable, so the
+utility module is loaded by file path instead.
+"""
+
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+
+def load_server_util(module_name: str) -> ModuleType:
+    """Load a server/app/utils module by file path without extending sys.path."""
+    qualified_name = f"lingua_nexus_utils.{module_name}"
+    if qualified_name in sys.modules:
+        return sys.modules[qualified_name]
+    path = os.path.join(os.path.dirname(__file__), '..', '..', 'server', 'app', 'utils', f"{module_name}.py")
+    spec = importlib.util.spec_from_file_location(qualified_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Never leave a half-initialized module for later calls to reuse
+        del sys.modules[qualified_name]
+        raise
+    return module
@@ -71,6 +71,29 @@ class TranslationModel(ABC):
         """
         pass
     
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate several texts sharing one language pair.
+        
+        The default implementation calls translate() once per text. Models
+        that can run a padded batch through a single forward pass should
+        override this.
+        
+        Args:
+            texts: Input texts to translate
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+            
+        Returns:
+            Translated texts, in input order
+            
+        Raises:
+            TranslationError: If translation fails
+            UnsupportedLanguageError: If language pair not supported
+            ValueError: If input parameters are invalid
+        """
+        return [await self.translate(text, source_lang, target_lang) for text in texts]
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """
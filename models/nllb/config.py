@@ -6,10 +6,34 @@ the NLLB (No Language Left Behind) model in the single-model architecture.
 """
 
 import os
-from typing import Dict, List, Any, Optional
+from functools import cached_property
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# Supported languages (NLLB-200 supports 200+ languages), deduplicated in order
+_SUPPORTED_LANGS_TUPLE: Tuple[str, ...] = tuple(dict.fromkeys([
+    "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
+    "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
+    "fi", "hu", "cs", "sk", "sl", "hr", "sr", "bg", "ro", "uk",
+    "be", "lt", "lv", "et", "mt", "ga", "cy", "eu", "ca", "gl",
+    "he", "yi", "fa", "ur", "ps", "ku", "az", "tk", "ky", "kk",
+    "uz", "tg", "mn", "my", "km", "lo", "si", "bn", "gu", "pa",
+    "ne", "mr", "as", "or", "ml", "kn", "te", "ta", "hy", "ka",
+    "af", "am", "bm", "eu", "be", "bn", "bs", "bg", "ca", "ceb",
+    "ny", "zh", "co", "hr", "cs", "da", "nl", "en", "eo", "et",
+    "tl", "fi", "fr", "fy", "gl", "ka", "de", "el", "gu", "ht",
+    "ha", "haw", "iw", "hi", "hmn", "hu", "is", "ig", "id", "ga",
+    "it", "ja", "jw", "kn", "kk", "km", "ko", "ku", "ky", "lo",
+    "la", "lv", "lt", "lb", "mk", "mg", "ms", "ml", "mt", "mi",
+    "mr", "mn", "my", "ne", "no", "ps", "fa", "pl", "pt", "pa",
+    "ro", "ru", "sm", "gd", "sr", "st", "sn", "sd", "si", "sk",
+    "sl", "so", "es", "su", "sw", "sv", "tg", "ta", "te", "th",
+    "tr", "uk", "ur", "uz", "vi", "cy", "xh", "yi", "yo", "zu"
+]))
+_SUPPORTED_LANGS_SET: FrozenSet[str] = frozenset(_SUPPORTED_LANGS_TUPLE)
+
+
 @dataclass
 class NLLBConfig:
     """Configuration for NLLB model."""
@@ -32,36 +56,34 @@ class NLLBConfig:
     use_pipeline: bool = True  # Use transformers pipeline for simplicity
     
     # Performance settings
-    batch_size: int = 1
+    batch_size: int = 1  # >1 enables micro-batching of concurrent translate() calls
+    max_wait_ms: float = 5.0  # How long a micro-batch waits to fill before generating
     use_cache: bool = True
+    greedy_threshold: int = 16  # Inputs shorter than this many tokens decode greedily (0 disables)
+    compile_model: bool = False  # torch.compile the forward pass (first calls pay compile warm-up)
+    health_check_interval: float = 30.0  # Seconds a probe-generate health result is reused
+    share_memory: bool = False  # Move CPU weights to shared memory for forked workers
+    
+    # Quantization settings
+    quantize_int8: bool = False  # Dynamic int8 Linear weights on CPU
+    load_in_8bit: bool = False  # bitsandbytes 8-bit weights on CUDA
     
     # Resource requirements
     memory_requirements: str = "2GB RAM (CPU) or 1GB VRAM (GPU)"
     
     # Supported languages (NLLB-200 supports 200+ languages)
-    supported_languages: List[str] = field(default_factory=lambda: [
-        "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
-        "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
-        "fi", "hu", "cs", "sk", "sl", "hr", "sr", "bg", "ro", "uk",
-        "be", "lt", "lv", "et", "mt", "ga", "cy", "eu", "ca", "gl",
-        "he", "yi", "fa", "ur", "ps", "ku", "az", "tk", "ky", "kk",
-        "uz", "tg", "mn", "my", "km", "lo", "si", "bn", "gu", "pa",
-        "ne", "mr", "as", "or", "ml", "kn", "te", "ta", "hy", "ka",
-        "af", "am", "bm", "eu", "be", "bn", "bs", "bg", "ca", "ceb",
-        "ny", "zh", "co", "hr", "cs", "da", "nl", "en", "eo", "et",
-        "tl", "fi", "fr", "fy", "gl", "ka", "de", "el", "gu", "ht",
-        "ha", "haw", "iw", "hi", "hmn", "hu", "is", "ig", "id", "ga",
-        "it", "ja", "jw", "kn", "kk", "km", "ko", "ku", "ky", "lo",
-        "la", "lv", "lt", "lb", "mk", "mg", "ms", "ml", "mt", "mi",
-        "mr", "mn", "my", "ne", "no", "ps", "fa", "pl", "pt", "pa",
-        "ro", "ru", "sm", "gd", "sr", "st", "sn", "sd", "si", "sk",
-        "sl", "so", "es", "su", "sw", "sv", "tg", "ta", "te", "th",
-        "tr", "uk", "ur", "uz", "vi", "cy", "xh", "yi", "yo", "zu"
-    ])
+    supported_languages: Tuple[str, ...] = _SUPPORTED_LANGS_TUPLE
     
     # Model-specific options
     model_options: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        """Build the hashed language set used for per-request membership checks."""
+        if self.supported_languages is _SUPPORTED_LANGS_TUPLE:
+            self._supported_set = _SUPPORTED_LANGS_SET
+        else:
+            self._supported_set = frozenset(self.supported_languages)
+    
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'NLLBConfig':
         """
@@ -106,14 +128,59 @@ class NLLBConfig:
             except ValueError:
                 pass
         
+        # Greedy fast-path override
+        if greedy_threshold := os.getenv("LINGUA_NEXUS_NLLB_GREEDY_THRESHOLD"):
+            try:
+                env_overrides["greedy_threshold"] = int(greedy_threshold)
+            except ValueError:
+                pass
+        
+        # Micro-batching overrides
+        if batch_size := os.getenv("LINGUA_NEXUS_NLLB_BATCH_SIZE"):
+            try:
+                env_overrides["batch_size"] = int(batch_size)
+            except ValueError:
+                pass
+        
+        if max_wait_ms := os.getenv("LINGUA_NEXUS_NLLB_MAX_WAIT_MS"):
+            try:
+                env_overrides["max_wait_ms"] = float(max_wait_ms)
+            except ValueError:
+                pass
+        
+        # torch.compile override
+        if compile_model := os.getenv("LINGUA_NEXUS_NLLB_COMPILE"):
+            env_overrides["compile_model"] = compile_model.lower() in ("true", "1", "yes")
+        
+        # Quantization overrides
+        if quantize_int8 := os.getenv("LINGUA_NEXUS_NLLB_QUANTIZE_INT8"):
+            env_overrides["quantize_int8"] = quantize_int8.lower() in ("true", "1", "yes")
+        
+        if load_in_8bit := os.getenv("LINGUA_NEXUS_NLLB_LOAD_IN_8BIT"):
+            env_overrides["load_in_8bit"] = load_in_8bit.lower() in ("true", "1", "yes")
+        
+        # Shared-memory weights override
+        if share_memory := os.getenv("LINGUA_NEXUS_NLLB_SHARE_MEMORY"):
+            env_overrides["share_memory"] = share_memory.lower() in ("true", "1", "yes")
+        
         # Pipeline usage override
         if use_pipeline := os.getenv("LINGUA_NEXUS_NLLB_USE_PIPELINE"):
             env_overrides["use_pipeline"] = use_pipeline.lower() in ("true", "1", "yes")
         
         return env_overrides
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop the cached to_dict snapshot."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("_snapshot", None)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
+        return dict(self._snapshot)
+    
+    @cached_property
+    def _snapshot(self) -> Dict[str, Any]:
+        """Field snapshot reused by to_dict until a field is reassigned."""
         return {
             "model_name": self.model_name,
             "model_version": self.model_version,
@@ -125,7 +192,14 @@ class NLLBConfig:
             "early_stopping": self.early_stopping,
             "use_pipeline": self.use_pipeline,
             "batch_size": self.batch_size,
+            "max_wait_ms": self.max_wait_ms,
             "use_cache": self.use_cache,
+            "greedy_threshold": self.greedy_threshold,
+            "compile_model": self.compile_model,
+            "health_check_interval": self.health_check_interval,
+            "share_memory": self.share_memory,
+            "quantize_int8": self.quantize_int8,
+            "load_in_8bit": self.load_in_8bit,
             "memory_requirements": self.memory_requirements,
             "supported_languages": self.supported_languages,
             "model_options": self.model_options
@@ -2,6 +2,7 @@
 """
 Test runner script that fixes Python path issues for comprehensive testing.
 """
+import importlib.util
 import os
 import sys
 import subprocess
@@ -26,9 +27,17 @@ def main():
         'tests/',
         '--tb=short',
         '-v',
-        '--maxfail=10'  # Stop after 10 failures to avoid overwhelming output
+        # Fail fast in CI; interactively stop after 10 failures to avoid overwhelming output
+        '--maxfail=1' if env.get('CI') else '--maxfail=10'
     ]
     
+    # Spread tests over all cores; loadscope keeps each module/class (and its
+    # expensive fixtures) on a single worker
+    if importlib.util.find_spec('xdist') is not None:
+        cmd += ['-n', 'auto', '--dist=loadscope']
+    else:
+        print("pytest-xdist not installed, running tests serially")
+    
     print(f"Running tests from: {server_dir}")
     print(f"PYTHONPATH: {project_root}")
     print(f"Command: {' '.join(cmd)}")
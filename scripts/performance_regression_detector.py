@@ -6,46 +6,108 @@ Analyzes performance reports and detects regressions compared to baselines.
 
 import json
 import argparse
+import os
 import statistics
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any, Union
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import sys
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
 
-@dataclass
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; only needed for compressed baselines
+    zstandard = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large reports are then parsed whole
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; classification falls back to a Python loop
+    np = None
+
+# Change (in percent, in the "better" direction) that counts as an improvement
+IMPROVEMENT_PERCENT = 5.0
+
+# Reports at least this large are stream-parsed (when ijson is available)
+_STREAM_MIN_BYTES = 1 << 20
+
+# Per-model analysis sections read by the extract_*_metrics methods
+_REPORT_SECTIONS = ("loading_time_stats", "latency_stats", "throughput_stats", "duration_stats", "test_info")
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__ storage
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=128)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON (or zstd-compressed .zst JSON) file; mtime and size key the cache so edits are re-read."""
+    raw = Path(path).read_bytes()
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read compressed baselines")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    return _json_loads(raw)
+
+
+def _read_json_cached(path: Union[str, Path]) -> Any:
+    """
+    Return the parsed contents of a JSON file, parsing each unchanged file once per process.
+    
+    The returned object is shared between callers and must not be mutated.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _parse_json_file(path, st.st_mtime_ns, st.st_size)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PerformanceMetric:
     """Performance metric with threshold configuration."""
     name: str
     current_value: float
     baseline_value: Optional[float]
-    threshold_percent: float  # Percentage increase that triggers regression alert
+    threshold_percent: float  # Percentage change that triggers regression alert (negative: lower is worse)
     unit: str
+    # Derived values, computed once in __post_init__
+    regression_threshold: Optional[float] = field(init=False, repr=False, compare=False)
+    change_percent: Optional[float] = field(init=False, repr=False, compare=False)
     
-    @property
-    def regression_threshold(self) -> Optional[float]:
-        """Calculate absolute regression threshold."""
-        if self.baseline_value is None:
-            return None
-        return self.baseline_value * (1 + self.threshold_percent / 100)
+    def __post_init__(self):
+        """Precompute the absolute regression threshold and percentage change from baseline."""
+        baseline = self.baseline_value
+        if baseline is None:
+            threshold = change = None
+        else:
+            threshold = baseline * (1 + self.threshold_percent / 100)
+            change = None if baseline == 0 else ((self.current_value - baseline) / baseline) * 100
+        object.__setattr__(self, "regression_threshold", threshold)
+        object.__setattr__(self, "change_percent", change)
     
     @property
     def is_regression(self) -> bool:
         """Check if current value represents a regression."""
         if self.baseline_value is None or self.regression_threshold is None:
             return False
+        if self.threshold_percent < 0:
+            # Lower is worse (throughput, success rate)
+            return self.current_value < self.regression_threshold
         return self.current_value > self.regression_threshold
-    
-    @property
-    def change_percent(self) -> Optional[float]:
-        """Calculate percentage change from baseline."""
-        if self.baseline_value is None or self.baseline_value == 0:
-            return None
-        return ((self.current_value - self.baseline_value) / self.baseline_value) * 100
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RegressionReport:
     """Report of performance regression analysis."""
     timestamp: str
@@ -72,9 +134,138 @@ class RegressionReport:
             return "NONE"
 
 
+def _stream_report(path: Path) -> Dict[str, Any]:
+    """
+    Stream-parse a report, keeping only the sections the extractors read.
+    
+    Only one model's analysis entry is materialized at a time, so peak memory
+    is bounded by the largest entry rather than the whole report.
+    """
+    report_data: Dict[str, Any] = {}
+    
+    with open(path, "rb") as f:
+        analysis = {}
+        for model_key, model_analysis in ijson.kvitems(f, "analysis", use_float=True):
+            entry = {section: model_analysis[section] for section in _REPORT_SECTIONS if section in model_analysis}
+            if entry:
+                analysis[model_key] = entry
+        if analysis:
+            report_data["analysis"] = analysis
+    
+    with open(path, "rb") as f:
+        for rss in ijson.items(f, "memory_statistics.process_memory.rss_mb", use_float=True):
+            report_data["memory_statistics"] = {"process_memory": {"rss_mb": rss}}
+            break
+    
+    return report_data
+
+
+def _report_type_from_name(filename: str) -> Optional[str]:
+    """Infer the report type from a report filename, or None if it is not recognizable."""
+    filename = filename.lower()
+    if "baseline" in filename or "loading" in filename:
+        return "model_loading"
+    elif "inference" in filename:
+        return "inference"
+    elif "memory" in filename:
+        return "memory"
+    elif "batch" in filename:
+        return "batch"
+    return None
+
+
+# Analysis section that identifies each analysis-based report type
+_SECTION_REPORT_TYPES = (
+    ("loading_time_stats", "model_loading"),
+    ("latency_stats", "inference"),
+    ("duration_stats", "batch"),
+)
+
+
+def _report_type_from_content(report_data: Dict) -> Optional[str]:
+    """Infer the report type from the top-level keys of its first analysis entry."""
+    if "memory_statistics" in report_data:
+        return "memory"
+    first_analysis = next(iter(report_data.get("analysis", {}).values()), {})
+    for section, report_type in _SECTION_REPORT_TYPES:
+        if section in first_analysis:
+            return report_type
+    return None
+
+
+def _group_by_model(report_data: Dict, section: str) -> Dict[str, List[Dict]]:
+    """Group report analysis entries containing section by model name (key prefix before '_')."""
+    by_model: Dict[str, List[Dict]] = defaultdict(list)
+    for model_key, analysis in report_data.get("analysis", {}).items():
+        if section in analysis:
+            by_model[model_key.split("_")[0]].append(analysis)
+    return by_model
+
+
+def _format_metric(metric: PerformanceMetric) -> str:
+    """Format one metric line of the text report."""
+    change_percent = metric.change_percent
+    change = f"{change_percent:+.1f}%" if change_percent is not None else "N/A"
+    return (f"  - {metric.name}: {metric.current_value:.2f} {metric.unit} "
+            f"(baseline: {metric.baseline_value:.2f} {metric.unit}, change: {change})")
+
+
+def _classify(metrics: List[PerformanceMetric]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Split metrics into regression, warning and improvement indices in one pass.
+    
+    Metrics without a usable (non-None, non-zero) baseline fall in no bucket.
+    A negative threshold_percent means lower values are worse, so the change
+    is sign-flipped before being compared against the threshold magnitude.
+    """
+    if np is None:
+        regressions, warnings, improvements = [], [], []
+        for i, metric in enumerate(metrics):
+            change = metric.change_percent
+            if change is None:
+                continue
+            limit = abs(metric.threshold_percent)
+            worse = -change if metric.threshold_percent < 0 else change
+            if worse > limit:
+                regressions.append(i)
+            elif abs(change) > limit / 2:
+                warnings.append(i)  # Warning at 50% of threshold
+            elif worse < -IMPROVEMENT_PERCENT:
+                improvements.append(i)
+        return regressions, warnings, improvements
+    
+    count = len(metrics)
+    current = np.fromiter((m.current_value for m in metrics), dtype=np.float64, count=count)
+    baseline = np.fromiter(
+        (np.nan if m.baseline_value is None else m.baseline_value for m in metrics),
+        dtype=np.float64, count=count
+    )
+    threshold = np.fromiter((m.threshold_percent for m in metrics), dtype=np.float64, count=count)
+    
+    valid = np.isfinite(baseline) & (baseline != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (current - baseline) / baseline * 100
+    limit = np.abs(threshold)
+    worse = np.where(threshold < 0, -change, change)
+    
+    is_reg = valid & (worse > limit)
+    is_warn = valid & ~is_reg & (np.abs(change) > limit / 2)
+    is_imp = valid & ~is_reg & ~is_warn & (worse < -IMPROVEMENT_PERCENT)
+    return (np.nonzero(is_reg)[0].tolist(), np.nonzero(is_warn)[0].tolist(),
+            np.nonzero(is_imp)[0].tolist())
+
+
 class PerformanceRegressionDetector:
     """Detects performance regressions by comparing current metrics to baselines."""
     
+    # Report type -> extractor method name
+    _EXTRACTORS = {
+        "model_loading": "extract_model_loading_metrics",
+        "inference": "extract_inference_metrics",
+        "memory": "extract_memory_metrics",
+        "batch": "extract_batch_metrics",
+    }
+    
     def __init__(self, baseline_dir: str = "performance_baselines", 
                  regression_thresholds: Optional[Dict[str, float]] = None):
         """
@@ -85,6 +276,8 @@ class PerformanceRegressionDetector:
             regression_thresholds: Custom thresholds for different metrics (percentage increase)
         """
         self.baseline_dir = Path(baseline_dir)
+        # Plain-string prefix so per-model baseline paths skip Path construction
+        self._baseline_prefix = os.path.join(str(self.baseline_dir), "")
         self.regression_thresholds = regression_thresholds or {
             "model_loading_time": 25.0,  # 25% slower loading time
             "inference_latency": 20.0,   # 20% slower inference
@@ -93,17 +286,43 @@ class PerformanceRegressionDetector:
             "batch_processing_time": 25.0,  # 25% slower batch processing
             "success_rate": -5.0,        # 5% lower success rate
         }
+        # Parsed baselines and their per-model analysis index, keyed by (metric_type, model_name)
+        self._baseline_cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+        self._baseline_index: Dict[Tuple[str, str], Dict[str, Dict]] = {}
         
     def load_baseline_metrics(self, metric_type: str, model_name: str) -> Optional[Dict]:
-        """Load baseline metrics for a specific type and model."""
-        baseline_file = self.baseline_dir / f"{metric_type}_{model_name}_baseline.json"
+        """Load baseline metrics for a specific type and model (read once per detector)."""
+        key = (metric_type, model_name)
+        if key not in self._baseline_cache:
+            self._baseline_cache[key] = self._read_baseline(metric_type, model_name)
+        return self._baseline_cache[key]
+    
+    def baseline_analysis(self, metric_type: str, model_name: str) -> Optional[Dict]:
+        """Return the baseline analysis entry for a model, or None if there is none."""
+        key = (metric_type, model_name)
+        index = self._baseline_index.get(key)
+        if index is None:
+            index = {}
+            baseline = self.load_baseline_metrics(metric_type, model_name)
+            if baseline and "analysis" in baseline:
+                for baseline_key, analysis in baseline["analysis"].items():
+                    index.setdefault(baseline_key.split("_")[0], analysis)
+            self._baseline_index[key] = index
+        return index.get(model_name)
+    
+    def _read_baseline(self, metric_type: str, model_name: str) -> Optional[Dict]:
+        """Read and parse a baseline file from disk."""
+        baseline_file = f"{self._baseline_prefix}{metric_type}_{model_name}_baseline.json"
         
-        if not baseline_file.exists():
+        # Prefer the compressed baseline written by update_baselines.py
+        compressed_file = baseline_file + ".zst"
+        if os.path.exists(compressed_file):
+            baseline_file = compressed_file
+        elif not os.path.exists(baseline_file):
             return None
             
         try:
-            with open(baseline_file) as f:
-                return json.load(f)
+            return _read_json_cached(baseline_file)
         except Exception as e:
             print(f"Warning: Failed to load baseline {baseline_file}: {e}")
             return None
@@ -112,33 +331,23 @@ class PerformanceRegressionDetector:
         """Extract model loading performance metrics."""
         metrics = []
         
-        if "analysis" not in report_data:
-            return metrics
-            
-        for model_key, analysis in report_data["analysis"].items():
-            if "loading_time_stats" not in analysis:
-                continue
-                
-            model_name = model_key.split("_")[0]  # Extract model name from key
-            stats = analysis["loading_time_stats"]
-            
+        for model_name, analyses in _group_by_model(report_data, "loading_time_stats").items():
             # Load baseline
-            baseline = self.load_baseline_metrics("model_loading", model_name)
+            baseline_analysis = self.baseline_analysis("model_loading", model_name)
             baseline_time = None
-            if baseline and "analysis" in baseline:
-                for baseline_key, baseline_analysis in baseline["analysis"].items():
-                    if model_name in baseline_key and "loading_time_stats" in baseline_analysis:
-                        baseline_time = baseline_analysis["loading_time_stats"]["mean_duration_seconds"]
-                        break
+            if baseline_analysis and "loading_time_stats" in baseline_analysis:
+                baseline_time = baseline_analysis["loading_time_stats"]["mean_duration_seconds"]
             
-            metric = PerformanceMetric(
-                name=f"{model_name}_loading_time",
-                current_value=stats["mean_duration_seconds"],
-                baseline_value=baseline_time,
-                threshold_percent=self.regression_thresholds["model_loading_time"],
-                unit="seconds"
-            )
-            metrics.append(metric)
+            for analysis in analyses:
+                stats = analysis["loading_time_stats"]
+                metric = PerformanceMetric(
+                    name=f"{model_name}_loading_time",
+                    current_value=stats["mean_duration_seconds"],
+                    baseline_value=baseline_time,
+                    threshold_percent=self.regression_thresholds["model_loading_time"],
+                    unit="seconds"
+                )
+                metrics.append(metric)
             
         return metrics
     
@@ -146,52 +355,43 @@ class PerformanceRegressionDetector:
         """Extract inference performance metrics."""
         metrics = []
         
-        if "analysis" not in report_data:
-            return metrics
-            
-        for model_key, analysis in report_data["analysis"].items():
-            if "latency_stats" not in analysis:
-                continue
-                
-            model_name = model_key.split("_")[0]
-            latency_stats = analysis["latency_stats"]
-            throughput_stats = analysis.get("throughput_stats", {})
-            
+        for model_name, analyses in _group_by_model(report_data, "latency_stats").items():
             # Load baseline
-            baseline = self.load_baseline_metrics("inference", model_name)
+            baseline_analysis = self.baseline_analysis("inference", model_name)
             baseline_latency = None
             baseline_throughput = None
             
-            if baseline and "analysis" in baseline:
-                for baseline_key, baseline_analysis in baseline["analysis"].items():
-                    if model_name in baseline_key:
-                        if "latency_stats" in baseline_analysis:
-                            baseline_latency = baseline_analysis["latency_stats"]["mean_seconds"]
-                        if "throughput_stats" in baseline_analysis:
-                            baseline_throughput = baseline_analysis["throughput_stats"]["mean_chars_per_sec"]
-                        break
+            if baseline_analysis:
+                if "latency_stats" in baseline_analysis:
+                    baseline_latency = baseline_analysis["latency_stats"]["mean_seconds"]
+                if "throughput_stats" in baseline_analysis:
+                    baseline_throughput = baseline_analysis["throughput_stats"]["mean_chars_per_sec"]
             
-            # Latency metric
-            if "mean_seconds" in latency_stats:
-                metric = PerformanceMetric(
-                    name=f"{model_name}_inference_latency",
-                    current_value=latency_stats["mean_seconds"],
-                    baseline_value=baseline_latency,
-                    threshold_percent=self.regression_thresholds["inference_latency"],
-                    unit="seconds"
-                )
-                metrics.append(metric)
-            
-            # Throughput metric
-            if "mean_chars_per_sec" in throughput_stats:
-                metric = PerformanceMetric(
-                    name=f"{model_name}_throughput",
-                    current_value=throughput_stats["mean_chars_per_sec"],
-                    baseline_value=baseline_throughput,
-                    threshold_percent=self.regression_thresholds["throughput"],
-                    unit="chars/sec"
-                )
-                metrics.append(metric)
+            for analysis in analyses:
+                latency_stats = analysis["latency_stats"]
+                throughput_stats = analysis.get("throughput_stats", {})
+                
+                # Latency metric
+                if "mean_seconds" in latency_stats:
+                    metric = PerformanceMetric(
+                        name=f"{model_name}_inference_latency",
+                        current_value=latency_stats["mean_seconds"],
+                        baseline_value=baseline_latency,
+                        threshold_percent=self.regression_thresholds["inference_latency"],
+                        unit="seconds"
+                    )
+                    metrics.append(metric)
+                
+                # Throughput metric
+                if "mean_chars_per_sec" in throughput_stats:
+                    metric = PerformanceMetric(
+                        name=f"{model_name}_throughput",
+                        current_value=throughput_stats["mean_chars_per_sec"],
+                        baseline_value=baseline_throughput,
+                        threshold_percent=self.regression_thresholds["throughput"],
+                        unit="chars/sec"
+                    )
+                    metrics.append(metric)
                 
         return metrics
     
@@ -244,52 +444,43 @@ class PerformanceRegressionDetector:
         """Extract batch processing metrics."""
         metrics = []
         
-        if "analysis" not in report_data:
-            return metrics
-            
-        for model_key, analysis in report_data["analysis"].items():
-            if "duration_stats" not in analysis:
-                continue
-                
-            model_name = model_key.split("_")[0]
-            duration_stats = analysis["duration_stats"]
-            success_rate = analysis.get("test_info", {}).get("overall_success_rate", 0)
-            
+        for model_name, analyses in _group_by_model(report_data, "duration_stats").items():
             # Load baseline
-            baseline = self.load_baseline_metrics("batch", model_name)
+            baseline_analysis = self.baseline_analysis("batch", model_name)
             baseline_duration = None
             baseline_success_rate = None
             
-            if baseline and "analysis" in baseline:
-                for baseline_key, baseline_analysis in baseline["analysis"].items():
-                    if model_name in baseline_key:
-                        if "duration_stats" in baseline_analysis:
-                            baseline_duration = baseline_analysis["duration_stats"]["mean_duration"]
-                        if "test_info" in baseline_analysis:
-                            baseline_success_rate = baseline_analysis["test_info"]["overall_success_rate"]
-                        break
+            if baseline_analysis:
+                if "duration_stats" in baseline_analysis:
+                    baseline_duration = baseline_analysis["duration_stats"]["mean_duration"]
+                if "test_info" in baseline_analysis:
+                    baseline_success_rate = baseline_analysis["test_info"]["overall_success_rate"]
             
-            # Duration metric
-            if "mean_duration" in duration_stats:
+            for analysis in analyses:
+                duration_stats = analysis["duration_stats"]
+                success_rate = analysis.get("test_info", {}).get("overall_success_rate", 0)
+                
+                # Duration metric
+                if "mean_duration" in duration_stats:
+                    metric = PerformanceMetric(
+                        name=f"{model_name}_batch_duration",
+                        current_value=duration_stats["mean_duration"],
+                        baseline_value=baseline_duration,
+                        threshold_percent=self.regression_thresholds["batch_processing_time"],
+                        unit="seconds"
+                    )
+                    metrics.append(metric)
+                
+                # Success rate metric
                 metric = PerformanceMetric(
-                    name=f"{model_name}_batch_duration",
-                    current_value=duration_stats["mean_duration"],
-                    baseline_value=baseline_duration,
-                    threshold_percent=self.regression_thresholds["batch_processing_time"],
-                    unit="seconds"
+                    name=f"{model_name}_batch_success_rate",
+                    current_value=success_rate * 100,  # Convert to percentage
+                    baseline_value=baseline_success_rate * 100 if baseline_success_rate else None,
+                    threshold_percent=self.regression_thresholds["success_rate"],
+                    unit="%"
                 )
                 metrics.append(metric)
             
-            # Success rate metric
-            metric = PerformanceMetric(
-                name=f"{model_name}_batch_success_rate",
-                current_value=success_rate * 100,  # Convert to percentage
-                baseline_value=baseline_success_rate * 100 if baseline_success_rate else None,
-                threshold_percent=self.regression_thresholds["success_rate"],
-                unit="%"
-            )
-            metrics.append(metric)
-            
         return metrics
     
     def analyze_report(self, report_file: str) -> List[PerformanceMetric]:
@@ -300,91 +491,50 @@ class PerformanceRegressionDetector:
             raise FileNotFoundError(f"Report file not found: {report_file}")
             
         try:
-            with open(report_path) as f:
-                report_data = json.load(f)
+            if ijson is not None and report_path.stat().st_size >= _STREAM_MIN_BYTES:
+                report_data = _stream_report(report_path)
+            else:
+                report_data = _read_json_cached(report_path)
         except Exception as e:
             raise ValueError(f"Failed to parse report file: {e}")
         
-        metrics = []
-        
-        # Determine report type and extract appropriate metrics
-        filename = report_path.name.lower()
-        
-        if "baseline" in filename or "loading" in filename:
-            metrics.extend(self.extract_model_loading_metrics(report_data))
-        elif "inference" in filename:
-            metrics.extend(self.extract_inference_metrics(report_data))
-        elif "memory" in filename:
-            metrics.extend(self.extract_memory_metrics(report_data))
-        elif "batch" in filename:
-            metrics.extend(self.extract_batch_metrics(report_data))
-        else:
-            # Try to extract from all types
-            metrics.extend(self.extract_model_loading_metrics(report_data))
-            metrics.extend(self.extract_inference_metrics(report_data))
-            metrics.extend(self.extract_memory_metrics(report_data))
-            metrics.extend(self.extract_batch_metrics(report_data))
-        
-        return metrics
+        # Route to exactly one extractor: by filename, else by probing the content
+        report_type = _report_type_from_name(report_path.name) or _report_type_from_content(report_data)
+        if report_type is None:
+            return []
+        return getattr(self, self._EXTRACTORS[report_type])(report_data)
     
     def detect_regressions(self, metrics: List[PerformanceMetric]) -> RegressionReport:
         """Detect performance regressions from a list of metrics."""
-        regressions = []
-        warnings = []
-        improvements = []
-        
-        for metric in metrics:
-            if metric.baseline_value is None:
-                continue  # Skip metrics without baselines
-                
-            if metric.is_regression:
-                regressions.append(metric)
-            elif metric.change_percent is not None:
-                if abs(metric.change_percent) > abs(metric.threshold_percent) / 2:
-                    warnings.append(metric)  # Warning at 50% of threshold
-                elif metric.change_percent < -5:  # Improvement of more than 5%
-                    improvements.append(metric)
+        regression_idx, warning_idx, improvement_idx = _classify(metrics)
         
         return RegressionReport(
             timestamp=datetime.now().isoformat(),
             total_metrics=len(metrics),
-            regressions=regressions,
-            warnings=warnings,
-            improvements=improvements
+            regressions=[metrics[i] for i in regression_idx],
+            warnings=[metrics[i] for i in warning_idx],
+            improvements=[metrics[i] for i in improvement_idx]
         )
     
     def generate_report_text(self, report: RegressionReport) -> str:
         """Generate human-readable regression report."""
-        lines = []
-        lines.append("=== Performance Regression Analysis ===")
-        lines.append(f"Timestamp: {report.timestamp}")
-        lines.append(f"Total Metrics Analyzed: {report.total_metrics}")
-        lines.append(f"Severity: {report.severity}")
-        lines.append("")
-        
-        if report.regressions:
-            lines.append("🚨 PERFORMANCE REGRESSIONS DETECTED:")
-            for metric in report.regressions:
-                change = f"{metric.change_percent:+.1f}%" if metric.change_percent else "N/A"
-                lines.append(f"  - {metric.name}: {metric.current_value:.2f} {metric.unit} "
-                           f"(baseline: {metric.baseline_value:.2f} {metric.unit}, change: {change})")
-            lines.append("")
+        lines = [
+            "=== Performance Regression Analysis ===",
+            f"Timestamp: {report.timestamp}",
+            f"Total Metrics Analyzed: {report.total_metrics}",
+            f"Severity: {report.severity}",
+            "",
+        ]
         
-        if report.warnings:
-            lines.append("⚠️  PERFORMANCE WARNINGS:")
-            for metric in report.warnings:
-                change = f"{metric.change_percent:+.1f}%" if metric.change_percent else "N/A"
-                lines.append(f"  - {metric.name}: {metric.current_value:.2f} {metric.unit} "
-                           f"(baseline: {metric.baseline_value:.2f} {metric.unit}, change: {change})")
-            lines.append("")
-        
-        if report.improvements:
-            lines.append("✅ PERFORMANCE IMPROVEMENTS:")
-            for metric in report.improvements:
-                change = f"{metric.change_percent:+.1f}%" if metric.change_percent else "N/A"
-                lines.append(f"  - {metric.name}: {metric.current_value:.2f} {metric.unit} "
-                           f"(baseline: {metric.baseline_value:.2f} {metric.unit}, change: {change})")
-            lines.append("")
+        for heading, section in (
+            ("🚨 PERFORMANCE REGRESSIONS DETECTED:", report.regressions),
+            ("⚠️  PERFORMANCE WARNINGS:", report.warnings),
+            ("✅ PERFORMANCE IMPROVEMENTS:", report.improvements),
+        ):
+            if section:
+                lines.append(heading)
+                lines.extend(map(_format_metric, section))
+                lines.append("")
         
         if not report.regressions and not report.warnings:
             lines.append("✅ No performance regressions detected!")
@@ -393,6 +543,31 @@ class PerformanceRegressionDetector:
         return "\n".join(lines)
 
 
+def _analyze_reports(detector: PerformanceRegressionDetector, report_files: List[str]):
+    """
+    Yield (report_file, metrics or exception) in input order.
+    
+    Report files are independent, so several files are analyzed in parallel
+    worker processes; a single file is analyzed in-process.
+    """
+    workers = min(len(report_files), os.cpu_count() or 1)
+    if workers <= 1:
+        for report_file in report_files:
+            try:
+                yield report_file, detector.analyze_report(report_file)
+            except Exception as e:
+                yield report_file, e
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(detector.analyze_report, report_file) for report_file in report_files]
+        for report_file, future in zip(report_files, futures):
+            try:
+                yield report_file, future.result()
+            except Exception as e:
+                yield report_file, e
+
+
 def main():
     """Main function for command-line usage."""
     parser = argparse.ArgumentParser(description="Detect performance regressions in E2E test reports")
@@ -423,13 +598,12 @@ def main():
     
     # Analyze all reports
     all_metrics = []
-    for report_file in args.reports:
-        try:
-            metrics = detector.analyze_report(report_file)
-            all_metrics.extend(metrics)
-            print(f"Analyzed {len(metrics)} metrics from {report_file}")
-        except Exception as e:
-            print(f"Error analyzing {report_file}: {e}")
+    for report_file, result in _analyze_reports(detector, args.reports):
+        if isinstance(result, Exception):
+            print(f"Error analyzing {report_file}: {result}")
+            continue
+        all_metrics.extend(result)
+        print(f"Analyzed {len(result)} metrics from {report_file}")
     
     # Detect regressions
     report = detector.detect_regressions(all_metrics)
@@ -2,20 +2,147 @@
 """
 Baseline Management Script
 Updates performance baselines from successful test runs.
+
+Baselines keep only the statistics the regression detector reads, in the
+layout it expects (``<report_type>_<model>_baseline.json``, with a ``.zst``
+suffix when zstandard is installed). Each update is
+blended into the existing baseline with an exponentially weighted moving
+average, so baselines track gradual drift instead of the latest run only.
 """
 
 import json
+import os
 import argparse
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to compact stdlib JSON
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; baselines are then stored uncompressed
+    zstandard = None
+
+
+# zstd level 3 is fast to write and still shrinks JSON baselines several-fold
+ZSTD_LEVEL = 3
+
+# Default weight of the newest report in the moving average
+DEFAULT_ALPHA = 0.3
+
+# Statistics consumed by performance_regression_detector, per analysis section
+_ANALYSIS_FIELDS = {
+    "model_loading": {"loading_time_stats": ("mean_duration_seconds",)},
+    "inference": {
+        "latency_stats": ("mean_seconds",),
+        "throughput_stats": ("mean_chars_per_sec",),
+    },
+    "batch": {
+        "duration_stats": ("mean_duration",),
+        "test_info": ("overall_success_rate",),
+    },
+}
+_MEMORY_FIELDS = ("max", "growth")
+
+
+def detect_report_type(report_path: Path) -> str:
+    """Infer the report type from the report filename."""
+    if "baseline" in report_path.name or "loading" in report_path.name:
+        return "model_loading"
+    elif "inference" in report_path.name:
+        return "inference"
+    elif "memory" in report_path.name:
+        return "memory"
+    elif "batch" in report_path.name:
+        return "batch"
+    return "unknown"
+
+
+def _extract_essential(report_data: Dict[str, Any], report_type: str) -> Dict[str, Any]:
+    """Keep only the statistics the regression detector reads for this report type."""
+    essential: Dict[str, Any] = {}
+    
+    if report_type == "unknown":
+        sections: Dict[str, tuple] = {}
+        for fields in _ANALYSIS_FIELDS.values():
+            sections.update(fields)
+    else:
+        sections = _ANALYSIS_FIELDS.get(report_type, {})
+    
+    analysis = {}
+    for model_key, model_analysis in report_data.get("analysis", {}).items():
+        entry = {}
+        for section, stat_names in sections.items():
+            stats = model_analysis.get(section)
+            if not stats:
+                continue
+            kept = {name: stats[name] for name in stat_names if name in stats}
+            if kept:
+                entry[section] = kept
+        if entry:
+            analysis[model_key] = entry
+    if analysis:
+        essential["analysis"] = analysis
+    
+    if report_type in ("memory", "unknown"):
+        rss = report_data.get("memory_statistics", {}).get("process_memory", {}).get("rss_mb", {})
+        kept = {name: rss[name] for name in _MEMORY_FIELDS if name in rss}
+        if kept:
+            essential["memory_statistics"] = {"process_memory": {"rss_mb": kept}}
+    
+    return essential
 
 
-def update_baseline(report_file: str, baseline_dir: str, model_name: str):
+def _ewma_merge(current: Any, previous: Any, alpha: float) -> Any:
+    """Blend current statistics into previous ones; keys only in one side are kept as-is."""
+    if isinstance(current, dict) and isinstance(previous, dict):
+        merged = dict(previous)
+        for key, value in current.items():
+            merged[key] = _ewma_merge(value, previous[key], alpha) if key in previous else value
+        return merged
+    if isinstance(current, (int, float)) and isinstance(previous, (int, float)):
+        return alpha * current + (1 - alpha) * previous
+    return current
+
+
+def baseline_file_candidates(baseline_path: Path, report_type: str, model_name: str) -> List[Path]:
+    """Return the baseline file paths for a report type and model, preferred (written) one first."""
+    stem = baseline_path / f"{report_type}_{model_name}_baseline.json"
+    compressed = stem.with_name(stem.name + ".zst")
+    return [compressed, stem] if zstandard is not None else [stem, compressed]
+
+
+def read_baseline_file(path: Path) -> Dict[str, Any]:
+    """Read a baseline file, transparently decompressing .zst files."""
+    raw = path.read_bytes()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_baseline_file(path: Path, data: Dict[str, Any]) -> None:
+    """Write compact (and, for .zst, compressed) JSON atomically via a temp file rename."""
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data, separators=(",", ":")).encode()
+    if path.suffix == ".zst":
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def update_baseline(report_file: str, baseline_dir: str, model_name: str,
+                    alpha: float = DEFAULT_ALPHA):
     """Update baseline from a performance report."""
     report_path = Path(report_file)
-    baseline_path = Path(baseline_dir) / model_name
+    baseline_path = Path(baseline_dir)
     
     if not report_path.exists():
         raise FileNotFoundError(f"Report file not found: {report_file}")
@@ -24,33 +151,45 @@ def update_baseline(report_file: str, baseline_dir: str, model_name: str):
     with open(report_path) as f:
         report_data = json.load(f)
     
+    report_type = detect_report_type(report_path)
+    statistics = _extract_essential(report_data, report_type)
+    
+    # The detector reads memory baselines under the "process" model name
+    baseline_model = "process" if report_type == "memory" else model_name
+    candidates = baseline_file_candidates(baseline_path, report_type, baseline_model)
+    baseline_file = candidates[0]
+    
+    # Blend into the existing baseline, if any
+    updates = 1
+    previous: Optional[Dict[str, Any]] = None
+    existing = next((path for path in candidates if path.exists()), None)
+    if existing is not None:
+        try:
+            previous = read_baseline_file(existing)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"Warning: Ignoring unreadable baseline {existing}: {e}")
+    if previous:
+        statistics = _ewma_merge(statistics, {k: v for k, v in previous.items()
+                                              if k in ("analysis", "memory_statistics")}, alpha)
+        updates = previous.get("updates", 0) + 1
+    
     # Create baseline entry
     baseline_data = {
         "model_name": model_name,
         "timestamp": datetime.now().isoformat(),
         "source_report": str(report_path),
-        "data": report_data
+        "updates": updates,
+        **statistics
     }
     
     # Ensure baseline directory exists
     baseline_path.mkdir(parents=True, exist_ok=True)
     
-    # Determine baseline filename
-    report_type = "unknown"
-    if "baseline" in report_path.name or "loading" in report_path.name:
-        report_type = "model_loading"
-    elif "inference" in report_path.name:
-        report_type = "inference"
-    elif "memory" in report_path.name:
-        report_type = "memory"
-    elif "batch" in report_path.name:
-        report_type = "batch"
-    
-    baseline_file = baseline_path / f"{report_type}_baseline.json"
-    
-    # Save baseline
-    with open(baseline_file, 'w') as f:
-        json.dump(baseline_data, f, indent=2)
+    # Save baseline, dropping a stale copy in the other format
+    _write_baseline_file(baseline_file, baseline_data)
+    for stale in candidates[1:]:
+        if stale.exists():
+            stale.unlink()
     
     print(f"Updated baseline: {baseline_file}")
 
@@ -61,12 +200,14 @@ def main():
     parser.add_argument("--baseline-dir", default="performance_baselines", 
                        help="Baseline directory")
     parser.add_argument("--model", required=True, help="Model name")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                       help="Weight of the new report in the moving-average baseline (0-1)")
     
     args = parser.parse_args()
     
     for report_file in args.reports:
         try:
-            update_baseline(report_file, args.baseline_dir, args.model)
+            update_baseline(report_file, args.baseline_dir, args.model, args.alpha)
         except Exception as e:
             print(f"Error updating baseline from {report_file}: {e}")
 
@@ -7,18 +7,26 @@ Coordinates semantic chunking, quality assessment, caching, and optimization.
 
 import asyncio
 import logging
+import os
+import sys
 import time
-from typing import Dict, List, Optional, Any, Tuple, Callable, Union
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Callable, Union, Coroutine, TypeVar, Awaitable
+from dataclasses import dataclass, replace
 from enum import Enum
 
-from .semantic_chunker import SemanticChunker, ChunkingResult, ContentType
+from .semantic_chunker import SemanticChunker, ChunkingResult, ContentType, chunk_separator, join_chunks
 from .quality_assessment import QualityMetricsEngine, QualityMetrics, TranslationPair
 from .cache_manager import IntelligentCacheManager, CacheEntry
 from .binary_search_optimizer import BinarySearchOptimizer, OptimizationStrategy
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__ storage
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TranslationStage(Enum):
     """Translation processing stages."""
@@ -29,7 +37,7 @@ class TranslationStage(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AdaptiveTranslationRequest:
     """Request for adaptive translation."""
     text: str
@@ -39,9 +47,10 @@ class AdaptiveTranslationRequest:
     user_preference: str = "balanced"  # fast, balanced, quality
     force_optimization: bool = False
     max_optimization_time: float = 5.0
+    total_deadline: float = 15.0  # seconds for the whole request
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TranslationUpdate:
     """Progressive translation update."""
     stage: TranslationStage
@@ -51,9 +60,10 @@ class TranslationUpdate:
     progress: float = 0.0
     status_message: str = ""
     metadata: Dict[str, Any] = None
+    delta: Optional[str] = None  # Newly translated text extending the previous deltas
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TranslationResult:
     """Final translation result."""
     translation: str
@@ -80,7 +90,11 @@ class AdaptiveTranslationController:
                  cache_manager: Optional[IntelligentCacheManager] = None,
                  binary_optimizer: Optional[BinarySearchOptimizer] = None,
                  quality_threshold: float = 0.75,
-                 max_concurrent_translations: int = 5):
+                 max_concurrent_translations: int = 5,
+                 semantic_cache_threshold: float = 0.95,
+                 quality_batch_size: int = 16,
+                 quality_batch_window: float = 0.005,
+                 update_queue_size: int = 8):
         """
         Initialize the adaptive translation controller.
         
@@ -92,25 +106,64 @@ class AdaptiveTranslationController:
             binary_optimizer: Binary search optimizer for chunk size optimization
             quality_threshold: Quality threshold for optimization
             max_concurrent_translations: Max concurrent translations
+            semantic_cache_threshold: Cosine similarity for semantic cache hits
+            quality_batch_size: Max quality assessments scored together
+            quality_batch_window: Seconds to wait for a quality batch to fill
+            update_queue_size: Progress updates buffered for a slow callback
+            
+        Raises:
+            ValueError: If update_queue_size is below 2
         """
+        # A full queue folds one pending delta into another, so it must hold two
+        if update_queue_size < 2:
+            raise ValueError(f"update_queue_size must be at least 2, got {update_queue_size}")
+        
         self.translation_function = translation_function
         self.chunker = chunker or SemanticChunker()
         self.quality_engine = quality_engine or QualityMetricsEngine()
         self.cache_manager = cache_manager
         self.binary_optimizer = binary_optimizer or BinarySearchOptimizer(translation_function)
         self.quality_threshold = quality_threshold
+        # Optimization threshold per user preference; None never optimizes
+        self._opt_thresholds: Dict[str, Optional[float]] = {
+            "fast": None,
+            "quality": max(0.85, quality_threshold),
+            "balanced": max(0.80, quality_threshold)
+        }
+        self.semantic_cache_threshold = semantic_cache_threshold
         
         # Concurrency control
         self.translation_semaphore = asyncio.Semaphore(max_concurrent_translations)
         
+        # Chunking and quality scoring are CPU-bound; keep them off the event loop
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="adaptive-cpu"
+        )
+        
+        # Quality assessments waiting to be scored as one batch
+        self.quality_batch_size = quality_batch_size
+        self.quality_batch_window = quality_batch_window
+        self._qa_pending: List[Tuple[TranslationPair, asyncio.Future]] = []
+        
+        # Progress updates buffered per progressive translation
+        self.update_queue_size = update_queue_size
+        
+        # Detached tasks, referenced until done so they are not garbage collected
+        self._background_tasks: set = set()
+        
+        # Running translations by request content, shared with identical concurrent requests
+        self._inflight: Dict[AdaptiveTranslationRequest, asyncio.Future] = {}
+        
         # Performance tracking
         self.performance_stats = {
             "total_requests": 0,
+            "coalesced_requests": 0,
             "cache_hits": 0,
             "optimizations_triggered": 0,
             "avg_processing_time": 0.0,
             "avg_quality_improvement": 0.0
         }
+        self._completed_translations = 0
 
     async def translate(self, request: AdaptiveTranslationRequest) -> TranslationResult:
         """
@@ -122,35 +175,63 @@ class AdaptiveTranslationController:
         Returns:
             TranslationResult with optimized translation
         """
-        start_time = time.time()
+        self.performance_stats["total_requests"] += 1
+        
+        # Identical requests (same key and deadline included) share one translation;
+        # each caller awaits it shielded so cancelling one cannot cancel the others
+        task = self._inflight.get(request)
+        if task is not None:
+            self.performance_stats["coalesced_requests"] += 1
+        else:
+            task = self._spawn(self._translate(request))
+            self._inflight[request] = task
+            
+            def release(finished: asyncio.Future):
+                if self._inflight.get(request) is finished:
+                    del self._inflight[request]
+            
+            task.add_done_callback(release)
+        
+        return await asyncio.shield(task)
+
+    async def _translate(self, request: AdaptiveTranslationRequest) -> TranslationResult:
+        """Run the adaptive translation pipeline for one request."""
+        start_time = time.perf_counter()
+        deadline = start_time + request.total_deadline
         stage_times = {}
         
         try:
-            self.performance_stats["total_requests"] += 1
-            
-            # 1. Check cache first
-            cache_start = time.time()
-            cached_result = await self._check_cache(request)
-            stage_times["cache_lookup"] = time.time() - cache_start
+            # 1. Check cache, chunking the text while a remote lookup is in flight
+            cache_start = time.perf_counter()
+            cached_result, chunking_result = await self._check_cache_while_chunking(request)
+            stage_times["cache_lookup"] = time.perf_counter() - cache_start
             
             if cached_result:
                 self.performance_stats["cache_hits"] += 1
                 return self._create_result_from_cache(cached_result, start_time, stage_times)
             
             # 2. Semantic chunking and fast path translation
-            semantic_start = time.time()
-            semantic_result = await self._semantic_translation_path(request)
-            stage_times["semantic_translation"] = time.time() - semantic_start
-            
-            # 3. Quality assessment
-            quality_start = time.time()
-            quality_metrics = await self._assess_translation_quality(
-                request.text, semantic_result.translation, semantic_result.chunking_result
+            semantic_start = time.perf_counter()
+            semantic_result = await self._until(
+                self._semantic_translation_path(request, chunking_result), deadline
             )
-            stage_times["quality_assessment"] = time.time() - quality_start
+            stage_times["semantic_translation"] = time.perf_counter() - semantic_start
             
-            # 4. Determine if optimization is needed
-            needs_optimization = self._should_optimize(
+            # 3. Quality assessment; fast requests never optimize, so score them off the critical path
+            assess_in_background = request.user_preference == "fast" and not request.force_optimization
+            if assess_in_background:
+                quality_metrics = QualityMetrics.unknown()
+                self._spawn(self._background_assess_and_cache(request, semantic_result))
+            else:
+                quality_start = time.perf_counter()
+                quality_metrics = await self._until(self._assess_translation_quality(
+                    request.text, semantic_result.translation, semantic_result.chunking_result,
+                    semantic_result.metadata.get("translated_chunks")
+                ), deadline)
+                stage_times["quality_assessment"] = time.perf_counter() - quality_start
+            
+            # 4. Determine if optimization is needed (never for background-assessed fast requests)
+            needs_optimization = not assess_in_background and self._should_optimize(
                 quality_metrics, request.user_preference, request.force_optimization
             )
             
@@ -160,19 +241,21 @@ class AdaptiveTranslationController:
             
             # 5. Optimization path if needed
             if needs_optimization:
-                optimization_start = time.time()
+                optimization_start = time.perf_counter()
                 try:
-                    optimized_result = await asyncio.wait_for(
-                        self._optimization_path(request, semantic_result),
-                        timeout=request.max_optimization_time
+                    optimized_result = await self._until(
+                        self._optimization_path(request, semantic_result, quality_metrics),
+                        min(deadline, optimization_start + request.max_optimization_time)
                     )
                     
                     # Verify optimization improved quality
-                    optimized_quality = await self._assess_translation_quality(
-                        request.text, optimized_result.translation, optimized_result.chunking_result
-                    )
+                    optimized_quality = await self._until(self._assess_translation_quality(
+                        request.text, optimized_result.translation, optimized_result.chunking_result,
+                        optimized_result.metadata.get("translated_chunks")
+                    ), deadline)
                     
                     if optimized_quality.overall_score > quality_metrics.overall_score:
+                        improvement = optimized_quality.overall_score - quality_metrics.overall_score
                         final_translation = optimized_result.translation
                         final_chunking = optimized_result.chunking_result
                         quality_metrics = optimized_quality
@@ -180,45 +263,35 @@ class AdaptiveTranslationController:
                         self.performance_stats["optimizations_triggered"] += 1
                         
                         # Update performance stats
-                        improvement = optimized_quality.overall_score - quality_metrics.overall_score
-                        self.performance_stats["avg_quality_improvement"] = (
-                            self.performance_stats["avg_quality_improvement"] + improvement
-                        ) / 2
+                        self._update_running_mean(
+                            "avg_quality_improvement", improvement,
+                            self.performance_stats["optimizations_triggered"]
+                        )
                     
                 except asyncio.TimeoutError:
                     logger.warning(f"Optimization timeout after {request.max_optimization_time}s")
                 except Exception as e:
                     logger.warning(f"Optimization failed: {e}")
                 
-                stage_times["optimization"] = time.time() - optimization_start
+                stage_times["optimization"] = time.perf_counter() - optimization_start
             
-            # 6. Cache the result
-            if self.cache_manager:
-                await self._cache_result(request, final_translation, quality_metrics, final_chunking)
+            # 6. Cache the result (unassessed fast results are cached once scored)
+            if not assess_in_background:
+                self._maybe_cache(request, final_translation, quality_metrics, final_chunking)
             
             # 7. Create final result
-            total_time = time.time() - start_time
-            self.performance_stats["avg_processing_time"] = (
-                self.performance_stats["avg_processing_time"] + total_time
-            ) / 2
+            total_time = time.perf_counter() - start_time
+            self._completed_translations += 1
+            self._update_running_mean("avg_processing_time", total_time, self._completed_translations)
             
-            return TranslationResult(
-                translation=final_translation,
-                original_text=request.text,
-                quality_metrics=quality_metrics,
-                chunking_result=final_chunking,
-                processing_time=total_time,
-                cache_hit=False,
-                optimization_applied=optimization_applied,
-                stage_times=stage_times,
-                metadata={
-                    "user_preference": request.user_preference,
-                    "needs_optimization": needs_optimization,
-                    "source_lang": request.source_lang,
-                    "target_lang": request.target_lang
-                }
+            return self._build_result(
+                request, final_translation, quality_metrics, final_chunking,
+                total_time, optimization_applied, stage_times, needs_optimization
             )
             
+        except asyncio.TimeoutError:
+            logger.error(f"Translation exceeded its {request.total_deadline}s deadline")
+            raise
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise
@@ -236,45 +309,71 @@ class AdaptiveTranslationController:
         Returns:
             Final translation result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        deadline = start_time + request.total_deadline
         
-        async def safe_callback(update):
-            """Safely call callback, logging exceptions but not failing."""
+        # Deliver updates from a dispatcher so a slow callback never stalls translation
+        updates: asyncio.Queue = asyncio.Queue(maxsize=self.update_queue_size)
+        dispatcher = asyncio.ensure_future(self._dispatch_updates(updates, callback))
+        
+        def publish(update: TranslationUpdate):
+            """Queue an update, coalescing with a pending one when the callback lags."""
             try:
-                await callback(update)
-            except Exception as e:
-                logger.warning(f"Callback failed: {e}")
+                updates.put_nowait(update)
+            except asyncio.QueueFull:
+                self._coalesce_update(updates, update)
         
         try:
             # Initial update
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.SEMANTIC,
                 status_message="Starting semantic translation...",
                 progress=0.1
             ))
             
-            # Check cache
-            cached_result = await self._check_cache(request)
+            # Check cache, chunking the text while a remote lookup is in flight
+            cached_result, chunking_result = await self._check_cache_while_chunking(request)
             if cached_result:
-                await safe_callback(TranslationUpdate(
+                publish(TranslationUpdate(
                     stage=TranslationStage.SEMANTIC,
                     translation=cached_result.translation,
                     quality_metrics=cached_result.quality_metrics,
                     progress=1.0,
                     status_message="Retrieved from cache"
                 ))
-                return self._create_result_from_cache(cached_result, time.time(), {})
+                return self._create_result_from_cache(cached_result, start_time, {})
             
             # Semantic translation
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.SEMANTIC,
                 status_message="Performing semantic chunking...",
                 progress=0.3
             ))
             
-            semantic_result = await self._semantic_translation_path(request)
+            # Stream each chunk as a text delta once every chunk before it is done
+            separator = chunk_separator(request.target_lang)
+            finished: Dict[int, str] = {}
+            next_chunk = 0
+            
+            def publish_chunk(index: int, total: int, translated: str):
+                nonlocal next_chunk
+                finished[index] = translated
+                while next_chunk in finished:
+                    text = finished.pop(next_chunk)
+                    if total > 1:
+                        text = (separator if next_chunk else "") + text.strip()
+                    next_chunk += 1
+                    publish(TranslationUpdate(
+                        stage=TranslationStage.SEMANTIC,
+                        progress=0.3 + 0.3 * next_chunk / total,
+                        delta=text
+                    ))
+            
+            semantic_result = await self._until(
+                self._semantic_translation_path(request, chunking_result, publish_chunk), deadline
+            )
             
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.SEMANTIC,
                 translation=semantic_result.translation,
                 chunking_result=semantic_result.chunking_result,
@@ -283,16 +382,17 @@ class AdaptiveTranslationController:
             ))
             
             # Quality assessment
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.ANALYZING,
                 translation=semantic_result.translation,
                 progress=0.7,
                 status_message="Analyzing translation quality..."
             ))
             
-            quality_metrics = await self._assess_translation_quality(
-                request.text, semantic_result.translation, semantic_result.chunking_result
-            )
+            quality_metrics = await self._until(self._assess_translation_quality(
+                request.text, semantic_result.translation, semantic_result.chunking_result,
+                semantic_result.metadata.get("translated_chunks")
+            ), deadline)
             
             # Check if optimization is needed
             needs_optimization = self._should_optimize(
@@ -300,7 +400,7 @@ class AdaptiveTranslationController:
             )
             
             if not needs_optimization:
-                await safe_callback(TranslationUpdate(
+                publish(TranslationUpdate(
                     stage=TranslationStage.SEMANTIC,
                     translation=semantic_result.translation,
                     quality_metrics=quality_metrics,
@@ -309,32 +409,16 @@ class AdaptiveTranslationController:
                 ))
                 
                 # Create result directly without optimization
-                total_time = time.time() - start_time
-                stage_times = {"progressive_semantic": total_time}
-                
-                # Cache the result
-                if self.cache_manager:
-                    await self._cache_result(request, semantic_result.translation, quality_metrics, semantic_result.chunking_result)
+                total_time = time.perf_counter() - start_time
+                self._maybe_cache(request, semantic_result.translation, quality_metrics, semantic_result.chunking_result)
                 
-                return TranslationResult(
-                    translation=semantic_result.translation,
-                    original_text=request.text,
-                    quality_metrics=quality_metrics,
-                    chunking_result=semantic_result.chunking_result,
-                    processing_time=total_time,
-                    cache_hit=False,
-                    optimization_applied=False,
-                    stage_times=stage_times,
-                    metadata={
-                        "user_preference": request.user_preference,
-                        "needs_optimization": False,
-                        "source_lang": request.source_lang,
-                        "target_lang": request.target_lang
-                    }
+                return self._build_result(
+                    request, semantic_result.translation, quality_metrics, semantic_result.chunking_result,
+                    total_time, False, {"progressive_semantic": total_time}, False
                 )
             
             # Optimization needed
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.OPTIMIZING,
                 translation=semantic_result.translation,
                 quality_metrics=quality_metrics,
@@ -343,22 +427,33 @@ class AdaptiveTranslationController:
             ))
             
             # Perform optimization
-            optimized_result = await self._optimization_path(request, semantic_result)
-            optimized_quality = await self._assess_translation_quality(
-                request.text, optimized_result.translation, optimized_result.chunking_result
-            )
+            try:
+                optimized_result = await self._until(
+                    self._optimization_path(request, semantic_result, quality_metrics), deadline
+                )
+                optimized_quality = await self._until(self._assess_translation_quality(
+                    request.text, optimized_result.translation, optimized_result.chunking_result,
+                    optimized_result.metadata.get("translated_chunks")
+                ), deadline)
+            except asyncio.TimeoutError:
+                # Out of time: finish with the semantic translation already delivered
+                logger.warning(f"Progressive optimization exceeded the {request.total_deadline}s deadline")
+                optimized_result = semantic_result
+                optimized_quality = quality_metrics
+                status_message = "Optimization timed out - keeping semantic translation"
+            else:
+                status_message = "Optimization complete"
             
-            await safe_callback(TranslationUpdate(
+            publish(TranslationUpdate(
                 stage=TranslationStage.OPTIMIZED,
                 translation=optimized_result.translation,
                 quality_metrics=optimized_quality,
                 progress=1.0,
-                status_message="Optimization complete"
+                status_message=status_message
             ))
             
             # Create result directly with optimization applied
-            total_time = time.time() - start_time
-            stage_times = {"progressive_semantic_and_optimization": total_time}
+            total_time = time.perf_counter() - start_time
             optimization_applied = optimized_quality.overall_score > quality_metrics.overall_score
             
             # Use optimized result if it's better, otherwise fall back to semantic
@@ -367,41 +462,101 @@ class AdaptiveTranslationController:
             final_chunking = optimized_result.chunking_result if optimization_applied else semantic_result.chunking_result
             
             # Cache the result
-            if self.cache_manager:
-                await self._cache_result(request, final_translation, final_quality, final_chunking)
+            self._maybe_cache(request, final_translation, final_quality, final_chunking)
             
-            return TranslationResult(
-                translation=final_translation,
-                original_text=request.text,
-                quality_metrics=final_quality,
-                chunking_result=final_chunking,
-                processing_time=total_time,
-                cache_hit=False,
-                optimization_applied=optimization_applied,
-                stage_times=stage_times,
-                metadata={
-                    "user_preference": request.user_preference,
-                    "needs_optimization": True,
-                    "optimization_successful": optimization_applied,
-                    "source_lang": request.source_lang,
-                    "target_lang": request.target_lang
-                }
+            return self._build_result(
+                request, final_translation, final_quality, final_chunking,
+                total_time, optimization_applied, {"progressive_semantic_and_optimization": total_time}, True,
+                extra_metadata={"optimization_successful": optimization_applied}
             )
             
         except Exception as e:
+            publish(TranslationUpdate(
+                stage=TranslationStage.ERROR,
+                status_message=f"Translation failed: {str(e)}",
+                progress=0.0
+            ))
+            raise
+        
+        finally:
+            if not dispatcher.done():
+                try:
+                    updates.put_nowait(None)
+                except asyncio.QueueFull:
+                    self._coalesce_update(updates, None)
+                await dispatcher
+
+    @staticmethod
+    async def _dispatch_updates(updates: asyncio.Queue, callback: Callable[[TranslationUpdate], None]):
+        """Deliver queued updates to ``callback`` in order until a ``None`` sentinel arrives."""
+        while True:
+            update = await updates.get()
+            if update is None:
+                return
             try:
-                await safe_callback(TranslationUpdate(
-                    stage=TranslationStage.ERROR,
-                    status_message=f"Translation failed: {str(e)}",
-                    progress=0.0
-                ))
+                await callback(update)
+            except Exception as e:
+                logger.warning(f"Callback failed: {e}")
+
+    @staticmethod
+    def _coalesce_update(updates: asyncio.Queue, update: Optional[TranslationUpdate]):
+        """
+        Make room for ``update`` in a full queue.
+        
+        Text deltas are never dropped: a new delta is appended to the latest
+        pending one. Otherwise a pending update from the same stage is
+        superseded by the new one, or the oldest snapshot update is dropped.
+        """
+        pending = [updates.get_nowait() for _ in range(updates.qsize())]
+        deltas = [i for i, item in enumerate(pending) if item.delta]
+        
+        if update is not None and update.delta and deltas:
+            latest = pending[deltas[-1]]
+            pending[deltas[-1]] = replace(latest, delta=latest.delta + update.delta, progress=update.progress)
+        else:
+            snapshots = [i for i, item in enumerate(pending) if not item.delta]
+            same_stage = [i for i in snapshots if update is not None and pending[i].stage == update.stage]
+            if same_stage:
+                del pending[same_stage[-1]]
+            elif snapshots:
+                del pending[snapshots[0]]
+            else:
+                first, second = pending[0], pending.pop(1)
+                pending[0] = replace(first, delta=first.delta + second.delta, progress=second.progress)
+            pending.append(update)
+        
+        for item in pending:
+            updates.put_nowait(item)
+
+    async def _check_cache_while_chunking(
+        self, request: AdaptiveTranslationRequest
+    ) -> Tuple[Optional[CacheEntry], Optional[ChunkingResult]]:
+        """
+        Look up the cache and chunk the text concurrently.
+        
+        Local hits complete before chunking starts; otherwise the text is chunked
+        on the worker pool while the remote lookup is in flight.
+        
+        Returns:
+            Tuple of (cache entry or None, chunking result or None)
+        """
+        cache_task = asyncio.create_task(self._check_cache(request))
+        await asyncio.sleep(0)  # Issue the lookup; local hits complete here
+        
+        chunking_result = None
+        if not cache_task.done():
+            try:
+                chunking_result = await self.run_cpu_bound(
+                    self.chunker.chunk_text_sync, request.text, request.source_lang, request.target_lang
+                )
             except Exception:
-                # If callback also fails, just log and continue
-                logger.warning(f"Callback failed during error reporting: {e}")
-            raise
+                cache_task.cancel()
+                raise
+        
+        return await cache_task, chunking_result
 
     async def _check_cache(self, request: AdaptiveTranslationRequest) -> Optional[CacheEntry]:
-        """Check cache for existing translation."""
+        """Check cache for an exact or near-duplicate translation."""
         if not self.cache_manager:
             return None
         
@@ -409,35 +564,55 @@ class AdaptiveTranslationController:
             text=request.text,
             source_lang=request.source_lang,
             target_lang=request.target_lang,
-            optimization_level="optimized" if request.user_preference == "quality" else "semantic"
+            optimization_level="optimized" if request.user_preference == "quality" else "semantic",
+            similarity_threshold=self.semantic_cache_threshold
         )
 
-    async def _semantic_translation_path(self, request: AdaptiveTranslationRequest) -> TranslationResult:
-        """Perform semantic chunking and translation."""
+    async def _semantic_translation_path(self,
+                                       request: AdaptiveTranslationRequest,
+                                       chunking_result: Optional[ChunkingResult] = None,
+                                       on_chunk: Optional[Callable[[int, int, str], None]] = None) -> TranslationResult:
+        """
+        Perform semantic chunking and translation, reusing ``chunking_result`` if given.
+        
+        ``on_chunk(index, total, translated)`` is called as each chunk finishes,
+        in completion order.
+        """
         # 1. Semantic chunking
-        chunking_result = await self.chunker.chunk_text(
-            request.text, request.source_lang, request.target_lang
-        )
+        if chunking_result is None:
+            chunking_result = await self.run_cpu_bound(
+                self.chunker.chunk_text_sync, request.text, request.source_lang, request.target_lang
+            )
         
         # 2. Translate chunks
-        async with self.translation_semaphore:
-            if len(chunking_result.chunks) == 1:
-                # Single chunk - direct translation
-                translation = await self.translation_function(
-                    chunking_result.chunks[0], request.source_lang, request.target_lang, request.api_key
-                )
-            else:
-                # Multiple chunks - parallel translation
-                translation_tasks = [
-                    self.translation_function(chunk, request.source_lang, request.target_lang, request.api_key)
-                    for chunk in chunking_result.chunks
-                ]
-                
-                translated_chunks = await asyncio.gather(*translation_tasks)
-                translation = " ".join(translated_chunks)
+        total = len(chunking_result.chunks)
+        
+        async def translate_chunk(index: int) -> str:
+            translated = await self._translate_chunk(chunking_result.chunks[index], request)
+            if on_chunk:
+                on_chunk(index, total, translated)
+            return translated
+        
+        if total == 1:
+            # Single chunk - direct translation
+            translated_chunks = [await translate_chunk(0)]
+        else:
+            # Multiple chunks - parallel translation, bounded per chunk
+            translated_chunks = await asyncio.gather(
+                *(translate_chunk(i) for i in range(total)),
+                return_exceptions=True
+            )
+            
+            # Retry failed chunks individually instead of failing the whole batch
+            for i, translated in enumerate(translated_chunks):
+                if isinstance(translated, BaseException):
+                    if not isinstance(translated, Exception):
+                        raise translated
+                    logger.warning(f"Chunk {i} translation failed: {translated}, retrying")
+                    translated_chunks[i] = await translate_chunk(i)
         
         return TranslationResult(
-            translation=translation,
+            translation=join_chunks(translated_chunks, request.target_lang),
             original_text=request.text,
             quality_metrics=None,  # Will be assessed separately
             chunking_result=chunking_result,
@@ -445,19 +620,43 @@ class AdaptiveTranslationController:
             cache_hit=False,
             optimization_applied=False,
             stage_times={},
-            metadata={}
+            metadata={"translated_chunks": translated_chunks}
         )
 
+    @staticmethod
+    async def _until(aw: Awaitable[T], deadline: float) -> T:
+        """
+        Await ``aw`` until a ``time.perf_counter()`` deadline, cancelling it on expiry.
+        
+        Cancelling a chunk gather cancels its sibling chunk translations too.
+        
+        Raises:
+            asyncio.TimeoutError: If the deadline passes first
+        """
+        return await asyncio.wait_for(aw, timeout=max(0.0, deadline - time.perf_counter()))
+
+    async def run_cpu_bound(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a synchronous chunking or scoring call on the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, func, *args)
+
+    async def _translate_chunk(self, chunk: str, request: AdaptiveTranslationRequest) -> str:
+        """Translate one chunk, holding the shared semaphore only for this call."""
+        async with self.translation_semaphore:
+            return await self.translation_function(
+                chunk, request.source_lang, request.target_lang, request.api_key
+            )
+
     async def _optimization_path(self, 
                                 request: AdaptiveTranslationRequest,
-                                semantic_result: TranslationResult) -> TranslationResult:
-        """Perform binary search optimization for better quality."""
+                                semantic_result: TranslationResult,
+                                baseline_quality: QualityMetrics) -> TranslationResult:
+        """Perform binary search optimization for better quality.
+        
+        ``baseline_quality`` is the assessment the caller already made of
+        ``semantic_result``; it is reused rather than scored a second time.
+        """
         try:
-            # Assess current quality
-            current_quality = await self._assess_translation_quality(
-                request.text, semantic_result.translation, semantic_result.chunking_result
-            )
-            
             # Determine optimization strategy based on user preference
             if request.user_preference == "quality":
                 strategy = OptimizationStrategy.QUALITY_FOCUSED
@@ -473,20 +672,18 @@ class AdaptiveTranslationController:
                 target_lang=request.target_lang,
                 api_key=request.api_key,
                 baseline_translation=semantic_result.translation,
-                baseline_quality=current_quality.overall_score,
+                baseline_quality=baseline_quality.overall_score,
                 strategy=strategy,
                 timeout=request.max_optimization_time
             )
             
-            # Create chunking result for the optimal chunk size
-            optimal_chunker = SemanticChunker(
-                min_chunk_size=max(optimization_result.optimal_chunk_size - 50, 100),
-                max_chunk_size=optimization_result.optimal_chunk_size
-            )
-            
-            optimal_chunking = await optimal_chunker.chunk_text(
-                request.text, request.source_lang, request.target_lang
-            )
+            # Reuse the chunking the optimizer translated; without one it kept the baseline
+            if optimization_result.optimal_chunking is not None:
+                optimal_chunking = optimization_result.optimal_chunking
+                translated_chunks = optimization_result.optimal_translated_chunks
+            else:
+                optimal_chunking = semantic_result.chunking_result
+                translated_chunks = semantic_result.metadata.get("translated_chunks")
             
             return TranslationResult(
                 translation=optimization_result.optimal_translation,
@@ -498,6 +695,7 @@ class AdaptiveTranslationController:
                 optimization_applied=True,
                 stage_times={},
                 metadata={
+                    "translated_chunks": translated_chunks,
                     "optimization_result": optimization_result,
                     "quality_improvement": optimization_result.quality_improvement,
                     "optimization_confidence": optimization_result.optimization_confidence,
@@ -512,16 +710,80 @@ class AdaptiveTranslationController:
     async def _assess_translation_quality(self,
                                         original: str,
                                         translation: str,
-                                        chunking_result: ChunkingResult) -> QualityMetrics:
-        """Assess translation quality."""
+                                        chunking_result: ChunkingResult,
+                                        translated_chunks: Optional[List[str]] = None) -> QualityMetrics:
+        """Assess translation quality, aligned to the translated chunks when known."""
         translation_pair = TranslationPair(
             original=original,
             translation=translation,
             chunks_original=chunking_result.chunks if chunking_result else None,
-            chunks_translated=translation.split(" ") if " " in translation else [translation]
+            chunks_translated=translated_chunks or [translation]
         )
         
-        return await self.quality_engine.assess_quality(translation_pair)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._qa_pending.append((translation_pair, future))
+        
+        if len(self._qa_pending) >= self.quality_batch_size:
+            self._flush_quality_batch()
+        elif len(self._qa_pending) == 1:
+            loop.call_later(self.quality_batch_window, self._flush_quality_batch)
+        
+        return await future
+
+    def _flush_quality_batch(self):
+        """Hand all pending quality assessments to a single scoring task."""
+        if not self._qa_pending:
+            return
+        
+        batch, self._qa_pending = self._qa_pending, []
+        self._spawn(self._score_quality_batch(batch))
+
+    async def _score_quality_batch(self, batch: List[Tuple[TranslationPair, asyncio.Future]]):
+        """Score a batch of translation pairs and resolve each waiting future."""
+        pairs = [pair for pair, _ in batch]
+        try:
+            if len(pairs) == 1:
+                results = [await self.run_cpu_bound(self.quality_engine.assess_quality_sync, pairs[0])]
+            else:
+                results = await self.run_cpu_bound(self.quality_engine.assess_quality_batch_sync, pairs)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), metrics in zip(batch, results):
+            if not future.done():
+                future.set_result(metrics)
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Future:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _background_assess_and_cache(self,
+                                         request: AdaptiveTranslationRequest,
+                                         semantic_result: TranslationResult):
+        """Assess a result already returned to the caller and cache it with its real quality."""
+        try:
+            quality_metrics = await self._assess_translation_quality(
+                request.text, semantic_result.translation, semantic_result.chunking_result,
+                semantic_result.metadata.get("translated_chunks")
+            )
+            if self.cache_manager:
+                await self._cache_result(
+                    request, semantic_result.translation, quality_metrics, semantic_result.chunking_result
+                )
+        except Exception as e:
+            logger.warning(f"Background quality assessment failed: {e}")
+
+    def _update_running_mean(self, key: str, value: float, count: int) -> None:
+        """Fold the count-th sample into a running mean in performance_stats."""
+        mean = self.performance_stats[key]
+        self.performance_stats[key] = mean + (value - mean) / count
 
     def _should_optimize(self,
                         quality_metrics: QualityMetrics,
@@ -531,41 +793,75 @@ class AdaptiveTranslationController:
         if force_optimization:
             return True
         
-        # User preference-based decisions take priority
-        if user_preference == "fast":
-            return False  # Fast preference avoids optimization even if quality is low
-        elif user_preference == "quality" and quality_metrics.overall_score < 0.85:
-            return True
-        elif user_preference == "balanced" and quality_metrics.overall_score < 0.80:
-            return True
-        
-        # Default quality threshold check
-        if quality_metrics.overall_score < self.quality_threshold:
-            return True
+        # Fast preference avoids optimization even if quality is low
+        threshold = self._opt_thresholds.get(user_preference, self.quality_threshold)
+        return threshold is not None and quality_metrics.overall_score < threshold
+
+    def _maybe_cache(self,
+                     request: AdaptiveTranslationRequest,
+                     translation: str,
+                     quality_metrics: QualityMetrics,
+                     chunking_result: ChunkingResult):
+        """Cache a result in the background when a cache manager is configured."""
+        if self.cache_manager:
+            self._spawn(self._cache_result(request, translation, quality_metrics, chunking_result))
+
+    def _build_result(self,
+                      request: AdaptiveTranslationRequest,
+                      translation: str,
+                      quality_metrics: QualityMetrics,
+                      chunking_result: ChunkingResult,
+                      processing_time: float,
+                      optimization_applied: bool,
+                      stage_times: Dict[str, float],
+                      needs_optimization: bool,
+                      extra_metadata: Optional[Dict[str, Any]] = None) -> TranslationResult:
+        """Create the final result for a freshly translated request."""
+        metadata = {
+            "user_preference": request.user_preference,
+            "needs_optimization": needs_optimization,
+            "source_lang": request.source_lang,
+            "target_lang": request.target_lang
+        }
+        if extra_metadata:
+            metadata.update(extra_metadata)
         
-        return False
+        return TranslationResult(
+            translation=translation,
+            original_text=request.text,
+            quality_metrics=quality_metrics,
+            chunking_result=chunking_result,
+            processing_time=processing_time,
+            cache_hit=False,
+            optimization_applied=optimization_applied,
+            stage_times=stage_times,
+            metadata=metadata
+        )
 
     async def _cache_result(self,
                           request: AdaptiveTranslationRequest,
                           translation: str,
                           quality_metrics: QualityMetrics,
                           chunking_result: ChunkingResult):
-        """Cache the translation result."""
+        """Cache the translation result. Usually detached, so failures are logged, not raised."""
         if not self.cache_manager:
             return
         
         optimization_level = "optimized" if quality_metrics.overall_score > self.quality_threshold else "semantic"
         
-        await self.cache_manager.store_translation(
-            text=request.text,
-            source_lang=request.source_lang,
-            target_lang=request.target_lang,
-            translation=translation,
-            quality_metrics=quality_metrics,
-            chunking_result=chunking_result,
-            content_type=chunking_result.content_type.value if chunking_result else None,
-            optimization_level=optimization_level
-        )
+        try:
+            await self.cache_manager.store_translation(
+                text=request.text,
+                source_lang=request.source_lang,
+                target_lang=request.target_lang,
+                translation=translation,
+                quality_metrics=quality_metrics,
+                chunking_result=chunking_result,
+                content_type=chunking_result.content_type.value if chunking_result else None,
+                optimization_level=optimization_level
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache translation: {e}")
 
     def _create_result_from_cache(self,
                                 cached_entry: CacheEntry,
@@ -577,7 +873,7 @@ class AdaptiveTranslationController:
             original_text="",  # Not stored in cache
             quality_metrics=cached_entry.quality_metrics,
             chunking_result=cached_entry.chunking_result,
-            processing_time=time.time() - start_time,
+            processing_time=time.perf_counter() - start_time,
             cache_hit=True,
             optimization_applied=cached_entry.key.optimization_level == "optimized",
             stage_times=stage_times,
@@ -588,12 +884,21 @@ class AdaptiveTranslationController:
             }
         )
 
+    async def aclose(self):
+        """Wait for detached cache writes and background assessments to finish."""
+        self._flush_quality_batch()
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._cpu_pool.shutdown(wait=False)
+
     async def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
+        # Snapshot before awaiting so the counters are mutually consistent
+        controller_stats = dict(self.performance_stats)
         cache_stats = await self.cache_manager.get_statistics() if self.cache_manager else None
         
         return {
-            "controller_stats": self.performance_stats,
+            "controller_stats": controller_stats,
             "cache_stats": cache_stats,
             "quality_threshold": self.quality_threshold
         }
\ No newline at end of file
@@ -6,12 +6,15 @@ and progressive translation with real-time updates.
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import StreamingResponse
+import time
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Tuple
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-import json
+import orjson
 
 from .adaptive_controller import (
     AdaptiveTranslationController, 
@@ -21,12 +24,14 @@ from .adaptive_controller import (
     TranslationStage
 )
 from .semantic_chunker import SemanticChunker, ContentType
-from .quality_assessment import QualityMetricsEngine
+from .quality_assessment import QualityMetrics, QualityMetricsEngine
 from .cache_manager import IntelligentCacheManager
 
 logger = logging.getLogger(__name__)
 
 # Pydantic models for API
+# Responses are built with model_construct(): their fields come from trusted
+# internal results, so per-field validation is skipped.
 
 class SemanticChunkRequest(BaseModel):
     """Request for semantic chunking."""
@@ -56,20 +61,31 @@ class AdaptiveTranslateRequest(BaseModel):
     user_preference: str = Field(default="balanced", description="User preference: fast, balanced, quality")
     force_optimization: bool = Field(default=False, description="Force optimization regardless of quality")
     max_optimization_time: float = Field(default=5.0, description="Maximum time for optimization in seconds")
+    total_deadline: float = Field(default=15.0, description="Maximum time for the whole translation in seconds")
+
+
+class AdaptiveTranslateBatchRequest(BaseModel):
+    """Request for adaptive translation of several texts."""
+    items: List[AdaptiveTranslateRequest] = Field(..., max_length=100, description="Texts to translate")
 
 
 class TranslationResponse(BaseModel):
     """Response for translation."""
     translation: str
     original_text: str
-    quality_score: float
-    quality_grade: str
+    quality_score: Optional[float] = Field(default=None, description="None until the translation is assessed")
+    quality_grade: Optional[str] = Field(default=None, description="None until the translation is assessed")
     optimization_applied: bool
     processing_time: float
     cache_hit: bool
     metadata: Dict[str, Any]
 
 
+class BatchTranslationResponse(BaseModel):
+    """Response for batch translation, in request order."""
+    results: List[TranslationResponse]
+
+
 class QualityAssessmentRequest(BaseModel):
     """Request for quality assessment."""
     original: str = Field(..., description="Original text")
@@ -103,8 +119,16 @@ quality_engine: Optional[QualityMetricsEngine] = None
 cache_manager: Optional[IntelligentCacheManager] = None
 adaptive_controller: Optional[AdaptiveTranslationController] = None
 
+# Monitoring snapshots served to pollers: name -> (built_at, etag, body)
+_SNAPSHOT_TTL = 1.0
+_snapshots: Dict[str, Tuple[float, str, bytes]] = {}
+
 # Router
-router = APIRouter(prefix="/adaptive", tags=["adaptive-translation"])
+router = APIRouter(
+    prefix="/adaptive",
+    tags=["adaptive-translation"],
+    default_response_class=ORJSONResponse
+)
 
 
 async def get_translation_function():
@@ -113,12 +137,42 @@ async def get_translation_function():
     raise HTTPException(status_code=500, detail="Translation function not configured")
 
 
+def get_chunker() -> SemanticChunker:
+    """Dependency providing the initialized semantic chunker."""
+    if chunker is None:
+        raise HTTPException(status_code=500, detail="Semantic chunker not initialized")
+    return chunker
+
+
+def get_quality_engine() -> QualityMetricsEngine:
+    """Dependency providing the initialized quality engine."""
+    if quality_engine is None:
+        raise HTTPException(status_code=500, detail="Quality engine not initialized")
+    return quality_engine
+
+
+def get_cache_manager() -> IntelligentCacheManager:
+    """Dependency providing the initialized cache manager."""
+    if cache_manager is None:
+        raise HTTPException(status_code=500, detail="Cache manager not initialized")
+    return cache_manager
+
+
+def get_controller() -> AdaptiveTranslationController:
+    """Dependency providing the initialized adaptive controller."""
+    if adaptive_controller is None:
+        raise HTTPException(status_code=500, detail="Adaptive controller not initialized")
+    return adaptive_controller
+
+
 async def initialize_adaptive_system(translation_func, redis_url: str = "redis://localhost:6379"):
     """Initialize the adaptive translation system."""
     global chunker, quality_engine, cache_manager, adaptive_controller
     
     # Initialize components
     chunker = SemanticChunker()
+    _get_sized_chunker.cache_clear()
+    _snapshots.clear()
     quality_engine = QualityMetricsEngine()
     
     # Initialize cache manager
@@ -136,28 +190,62 @@ async def initialize_adaptive_system(translation_func, redis_url: str = "redis:/
     logger.info("Adaptive translation system initialized successfully")
 
 
+async def shutdown_adaptive_system():
+    """Drain pending background work and close the cache connection."""
+    if adaptive_controller:
+        await adaptive_controller.aclose()
+    if cache_manager:
+        await cache_manager.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_sized_chunker(base_chunker: SemanticChunker, min_chunk_size: int, max_chunk_size: int) -> SemanticChunker:
+    """Get a chunker for custom size bounds that shares ``base_chunker``'s loaded models."""
+    return base_chunker.with_size_bounds(min_chunk_size, max_chunk_size)
+
+
+async def _conditional_snapshot(request: Request, name: str,
+                                build: Callable[[], Awaitable[Dict[str, Any]]]) -> Response:
+    """
+    Serve a briefly memoized JSON snapshot with an ETag.
+    
+    Pollers repeating the ETag in ``If-None-Match`` get an empty 304 response.
+    """
+    now = time.monotonic()
+    snapshot = _snapshots.get(name)
+    if snapshot is None or now - snapshot[0] >= _SNAPSHOT_TTL:
+        body = orjson.dumps(await build())
+        snapshot = (now, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"', body)
+        _snapshots[name] = snapshot
+    
+    _, etag, body = snapshot
+    headers = {"ETag": etag, "Cache-Control": f"max-age={_SNAPSHOT_TTL:g}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post("/chunk", response_model=SemanticChunkResponse)
-async def semantic_chunk_text(request: SemanticChunkRequest):
+async def semantic_chunk_text(request: SemanticChunkRequest,
+                              base_chunker: SemanticChunker = Depends(get_chunker),
+                              controller: AdaptiveTranslationController = Depends(get_controller)):
     """
     Perform semantic chunking of text.
     
     Returns optimized text chunks with discourse analysis and content type detection.
     """
-    if not chunker:
-        raise HTTPException(status_code=500, detail="Semantic chunker not initialized")
-    
     try:
-        # Create temporary chunker with custom parameters if provided
-        temp_chunker = SemanticChunker(
-            min_chunk_size=request.min_chunk_size,
-            max_chunk_size=request.max_chunk_size
-        )
+        # Use the global chunker unless custom size bounds were requested
+        if (request.min_chunk_size, request.max_chunk_size) == (base_chunker.min_chunk_size, base_chunker.max_chunk_size):
+            temp_chunker = base_chunker
+        else:
+            temp_chunker = _get_sized_chunker(base_chunker, request.min_chunk_size, request.max_chunk_size)
         
-        result = await temp_chunker.chunk_text(
-            request.text, request.source_lang, request.target_lang
+        result = await controller.run_cpu_bound(
+            temp_chunker.chunk_text_sync, request.text, request.source_lang, request.target_lang
         )
         
-        return SemanticChunkResponse(
+        return SemanticChunkResponse.model_construct(
             chunks=result.chunks,
             chunk_boundaries=result.chunk_boundaries,
             content_type=result.content_type.value,
@@ -171,110 +259,173 @@ async def semantic_chunk_text(request: SemanticChunkRequest):
         raise HTTPException(status_code=500, detail=f"Chunking failed: {str(e)}")
 
 
+def _to_internal_request(request: AdaptiveTranslateRequest) -> AdaptiveTranslationRequest:
+    """Convert an API translation request to the controller's request format."""
+    return AdaptiveTranslationRequest(
+        text=request.text,
+        source_lang=request.source_lang,
+        target_lang=request.target_lang,
+        api_key=request.api_key,
+        user_preference=request.user_preference,
+        force_optimization=request.force_optimization,
+        max_optimization_time=request.max_optimization_time,
+        total_deadline=request.total_deadline
+    )
+
+
+def _assessed_quality(quality_metrics: Optional[QualityMetrics]) -> Optional[QualityMetrics]:
+    """Metrics to report, or None for a placeholder whose translation was not scored."""
+    if quality_metrics is None or (quality_metrics.metadata or {}).get("assessed") is False:
+        return None
+    return quality_metrics
+
+
+def _to_translation_response(result: TranslationResult) -> TranslationResponse:
+    """Convert a controller result to the API translation response."""
+    quality_metrics = _assessed_quality(result.quality_metrics)
+    return TranslationResponse.model_construct(
+        translation=result.translation,
+        original_text=result.original_text,
+        quality_score=quality_metrics.overall_score if quality_metrics else None,
+        quality_grade=quality_metrics.quality_grade if quality_metrics else None,
+        optimization_applied=result.optimization_applied,
+        processing_time=result.processing_time,
+        cache_hit=result.cache_hit,
+        metadata={
+            **result.metadata,
+            "stage_times": result.stage_times,
+            "chunking_metadata": result.chunking_result.metadata if result.chunking_result else {}
+        }
+    )
+
+
 @router.post("/translate", response_model=TranslationResponse)
-async def adaptive_translate(request: AdaptiveTranslateRequest):
+async def adaptive_translate(request: AdaptiveTranslateRequest,
+                             controller: AdaptiveTranslationController = Depends(get_controller)):
     """
     Perform adaptive translation with intelligent optimization.
     
     Uses semantic chunking, quality assessment, and optimization to provide
     the best possible translation quality within time constraints.
     """
-    if not adaptive_controller:
-        raise HTTPException(status_code=500, detail="Adaptive controller not initialized")
-    
     try:
         # Convert to internal request format
-        internal_request = AdaptiveTranslationRequest(
-            text=request.text,
-            source_lang=request.source_lang,
-            target_lang=request.target_lang,
-            api_key=request.api_key,
-            user_preference=request.user_preference,
-            force_optimization=request.force_optimization,
-            max_optimization_time=request.max_optimization_time
-        )
+        internal_request = _to_internal_request(request)
         
         # Perform translation
-        result = await adaptive_controller.translate(internal_request)
+        result = await controller.translate(internal_request)
         
-        return TranslationResponse(
-            translation=result.translation,
-            original_text=result.original_text,
-            quality_score=result.quality_metrics.overall_score,
-            quality_grade=result.quality_metrics.quality_grade,
-            optimization_applied=result.optimization_applied,
-            processing_time=result.processing_time,
-            cache_hit=result.cache_hit,
-            metadata={
-                **result.metadata,
-                "stage_times": result.stage_times,
-                "chunking_metadata": result.chunking_result.metadata if result.chunking_result else {}
-            }
-        )
+        return _to_translation_response(result)
         
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Translation exceeded its {request.total_deadline}s deadline"
+        )
     except Exception as e:
         logger.error(f"Adaptive translation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
+@router.post("/translate/batch", response_model=BatchTranslationResponse)
+async def adaptive_translate_batch(request: AdaptiveTranslateBatchRequest,
+                                   controller: AdaptiveTranslationController = Depends(get_controller)):
+    """
+    Perform adaptive translation of several texts in one call.
+    
+    Items are translated concurrently within the controller's concurrency
+    limit; duplicate items share one translation. Results keep request order.
+    """
+    results = await asyncio.gather(
+        *(controller.translate(_to_internal_request(item)) for item in request.items),
+        return_exceptions=True
+    )
+    
+    for index, result in enumerate(results):
+        if isinstance(result, asyncio.TimeoutError):
+            raise HTTPException(
+                status_code=504,
+                detail=f"Item {index} exceeded its {request.items[index].total_deadline}s deadline"
+            )
+        if isinstance(result, BaseException):
+            logger.error(f"Batch translation item {index} failed: {result}")
+            raise HTTPException(status_code=500, detail=f"Translation of item {index} failed: {str(result)}")
+    
+    return BatchTranslationResponse.model_construct(
+        results=[_to_translation_response(result) for result in results]
+    )
+
+
+def _sse_event(data: Dict[str, Any]) -> bytes:
+    """Encode a payload as one Server-Sent Event frame."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
 @router.post("/translate/progressive")
-async def progressive_translate(request: AdaptiveTranslateRequest):
+async def progressive_translate(request: AdaptiveTranslateRequest,
+                                controller: AdaptiveTranslationController = Depends(get_controller)):
     """
     Perform progressive translation with real-time updates.
     
     Returns a streaming response with translation progress updates,
     allowing clients to show immediate results and quality improvements.
     """
-    if not adaptive_controller:
-        raise HTTPException(status_code=500, detail="Adaptive controller not initialized")
-    
     async def generate_updates():
         """Generate streaming updates for progressive translation."""
         try:
             # Convert to internal request format
-            internal_request = AdaptiveTranslationRequest(
-                text=request.text,
-                source_lang=request.source_lang,
-                target_lang=request.target_lang,
-                api_key=request.api_key,
-                user_preference=request.user_preference,
-                force_optimization=request.force_optimization,
-                max_optimization_time=request.max_optimization_time
-            )
+            internal_request = _to_internal_request(request)
             
-            # Track updates
-            updates = []
+            # Updates from the controller, ended by a None sentinel once translation finishes
+            updates: asyncio.Queue = asyncio.Queue()
             
             async def update_callback(update: TranslationUpdate):
                 """Callback for receiving translation updates."""
-                update_data = {
+                if update.delta:
+                    updates.put_nowait({
+                        "stage": update.stage.value,
+                        "delta": update.delta,
+                        "progress": update.progress
+                    })
+                    return
+                quality_metrics = _assessed_quality(update.quality_metrics)
+                updates.put_nowait({
                     "stage": update.stage.value,
                     "translation": update.translation,
                     "progress": update.progress,
                     "status_message": update.status_message,
-                    "quality_score": update.quality_metrics.overall_score if update.quality_metrics else None,
-                    "quality_grade": update.quality_metrics.quality_grade if update.quality_metrics else None,
+                    "quality_score": quality_metrics.overall_score if quality_metrics else None,
+                    "quality_grade": quality_metrics.quality_grade if quality_metrics else None,
                     "metadata": update.metadata or {}
-                }
-                
-                updates.append(update_data)
-                
-                # Send update as Server-Sent Event
-                yield f"data: {json.dumps(update_data)}\n\n"
+                })
             
-            # Perform progressive translation
-            final_result = await adaptive_controller.progressive_translate(
-                internal_request, update_callback
+            # Perform progressive translation, streaming each update as it arrives
+            translation_task = asyncio.ensure_future(
+                controller.progressive_translate(internal_request, update_callback)
             )
+            translation_task.add_done_callback(lambda _: updates.put_nowait(None))
+            
+            try:
+                while True:
+                    update_data = await updates.get()
+                    if update_data is None:
+                        break
+                    yield _sse_event(update_data)
+                
+                final_result = await translation_task
+            finally:
+                # The client may disconnect mid-stream; stop translating for it
+                translation_task.cancel()
             
             # Send final result
+            quality_metrics = _assessed_quality(final_result.quality_metrics)
             final_data = {
                 "stage": "completed",
                 "translation": final_result.translation,
                 "progress": 1.0,
                 "status_message": "Translation completed",
-                "quality_score": final_result.quality_metrics.overall_score,
-                "quality_grade": final_result.quality_metrics.quality_grade,
+                "quality_score": quality_metrics.overall_score if quality_metrics else None,
+                "quality_grade": quality_metrics.quality_grade if quality_metrics else None,
                 "optimization_applied": final_result.optimization_applied,
                 "processing_time": final_result.processing_time,
                 "cache_hit": final_result.cache_hit,
@@ -284,7 +435,7 @@ async def progressive_translate(request: AdaptiveTranslateRequest):
                 }
             }
             
-            yield f"data: {json.dumps(final_data)}\n\n"
+            yield _sse_event(final_data)
             
         except Exception as e:
             logger.error(f"Progressive translation failed: {e}")
@@ -294,29 +445,28 @@ async def progressive_translate(request: AdaptiveTranslateRequest):
                 "progress": 0.0,
                 "status_message": f"Translation failed: {str(e)}"
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _sse_event(error_data)
     
     return StreamingResponse(
         generate_updates(),
-        media_type="text/plain",
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
-            "Content-Type": "text/event-stream"
+            "X-Accel-Buffering": "no"  # Stop reverse proxies from buffering the stream
         }
     )
 
 
 @router.post("/quality/assess", response_model=QualityAssessmentResponse)
-async def assess_translation_quality(request: QualityAssessmentRequest):
+async def assess_translation_quality(request: QualityAssessmentRequest,
+                                     engine: QualityMetricsEngine = Depends(get_quality_engine),
+                                     controller: AdaptiveTranslationController = Depends(get_controller)):
     """
     Assess translation quality using multi-dimensional metrics.
     
     Provides detailed quality analysis beyond simple confidence scores.
     """
-    if not quality_engine:
-        raise HTTPException(status_code=500, detail="Quality engine not initialized")
-    
     try:
         from .quality_assessment import TranslationPair
         
@@ -328,9 +478,9 @@ async def assess_translation_quality(request: QualityAssessmentRequest):
         )
         
         # Assess quality
-        quality_metrics = await quality_engine.assess_quality(translation_pair)
+        quality_metrics = await controller.run_cpu_bound(engine.assess_quality_sync, translation_pair)
         
-        return QualityAssessmentResponse(
+        return QualityAssessmentResponse.model_construct(
             overall_score=quality_metrics.overall_score,
             quality_grade=quality_metrics.quality_grade,
             dimension_scores={
@@ -347,25 +497,25 @@ async def assess_translation_quality(request: QualityAssessmentRequest):
 
 
 @router.get("/cache/stats", response_model=CacheStatsResponse)
-async def get_cache_statistics():
+async def get_cache_statistics(request: Request, cache: IntelligentCacheManager = Depends(get_cache_manager)):
     """
     Get cache performance statistics.
     
     Returns cache hit rates, memory usage, and performance metrics.
     """
-    if not cache_manager:
-        raise HTTPException(status_code=500, detail="Cache manager not initialized")
-    
-    try:
-        stats = await cache_manager.get_statistics()
+    async def build_stats() -> Dict[str, Any]:
+        stats = await cache.get_statistics()
         
-        return CacheStatsResponse(
+        return CacheStatsResponse.model_construct(
             hit_rate=stats.hit_rate,
             total_requests=stats.total_requests,
             cache_hits=stats.cache_hits,
             cache_misses=stats.cache_misses,
             memory_usage=stats.memory_usage or {}
-        )
+        ).model_dump()
+    
+    try:
+        return await _conditional_snapshot(request, "cache_stats", build_stats)
         
     except Exception as e:
         logger.error(f"Failed to get cache statistics: {e}")
@@ -376,24 +526,23 @@ async def get_cache_statistics():
 async def invalidate_cache(
     source_lang: str,
     target_lang: str,
-    content_type: Optional[str] = None
+    content_type: Optional[str] = None,
+    cache: IntelligentCacheManager = Depends(get_cache_manager)
 ):
     """
     Invalidate cache entries matching the specified pattern.
     
     Useful for clearing cache when translation models are updated.
     """
-    if not cache_manager:
-        raise HTTPException(status_code=500, detail="Cache manager not initialized")
-    
     try:
-        await cache_manager.invalidate_pattern(
+        removed = await cache.invalidate_pattern(
             source_lang=source_lang,
             target_lang=target_lang,
             content_type=content_type
         )
+        _snapshots.pop("cache_stats", None)
         
-        return {"message": f"Cache invalidated for {source_lang}->{target_lang}"}
+        return {"message": f"Cache invalidated for {source_lang}->{target_lang}", "removed": removed}
         
     except Exception as e:
         logger.error(f"Cache invalidation failed: {e}")
@@ -401,17 +550,14 @@ async def invalidate_cache(
 
 
 @router.get("/stats")
-async def get_system_statistics():
+async def get_system_statistics(controller: AdaptiveTranslationController = Depends(get_controller)):
     """
     Get comprehensive system statistics.
     
     Returns performance metrics for all components of the adaptive system.
     """
-    if not adaptive_controller:
-        raise HTTPException(status_code=500, detail="Adaptive controller not initialized")
-    
     try:
-        stats = await adaptive_controller.get_performance_stats()
+        stats = await controller.get_performance_stats()
         return stats
         
     except Exception as e:
@@ -420,12 +566,17 @@ async def get_system_statistics():
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint for monitoring.
     
     Returns the status of all system components.
     """
+    return await _conditional_snapshot(request, "health", _build_health_status)
+
+
+async def _build_health_status() -> Dict[str, Any]:
+    """Check every component, raising 503 so unhealthy states are never memoized."""
     health_status = {
         "status": "healthy",
         "components": {
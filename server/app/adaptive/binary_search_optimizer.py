@@ -10,15 +10,19 @@ import logging
 import time
 import statistics
 from typing import Dict, List, Optional, Tuple, Callable, Any
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 
-from .semantic_chunker import SemanticChunker, ChunkingResult
+from .semantic_chunker import SemanticChunker, ChunkingResult, join_chunks
 from .quality_assessment import QualityMetricsEngine, QualityMetrics, TranslationPair
 
 logger = logging.getLogger(__name__)
 
+# Sized chunkers kept per optimizer; fine-tuning keeps producing new bounds
+_CHUNKER_POOL_SIZE = 32
+
 
 class OptimizationStrategy(Enum):
     """Binary search optimization strategies."""
@@ -36,6 +40,7 @@ class OptimizationPoint:
     chunking_result: ChunkingResult
     processing_time: float
     confidence: float = 0.0
+    translated_chunks: Optional[List[str]] = None  # Aligned with chunking_result.chunks
 
 
 @dataclass
@@ -51,6 +56,8 @@ class OptimizationResult:
     convergence_iterations: int
     total_optimization_time: float
     metadata: Dict[str, Any]
+    optimal_chunking: Optional[ChunkingResult] = None  # None when falling back to the baseline
+    optimal_translated_chunks: Optional[List[str]] = None  # Aligned with optimal_chunking.chunks
 
 
 class BinarySearchOptimizer:
@@ -91,12 +98,15 @@ class BinarySearchOptimizer:
         self.max_iterations = max_iterations
         self.parallel_evaluations = parallel_evaluations
         
+        # LRU of chunkers keyed by (min_chunk_size, max_chunk_size), all sharing self.chunker's models
+        self._chunker_pool: "OrderedDict[Tuple[int, int], SemanticChunker]" = OrderedDict()
+        
         # Optimization statistics
         self.optimization_stats = {
             "total_optimizations": 0,
             "successful_optimizations": 0,
-            "avg_improvement": 0.0,
-            "avg_optimization_time": 0.0
+            "total_improvement": 0.0,  # Over successful optimizations
+            "total_optimization_time": 0.0  # Over all optimizations
         }
 
     async def optimize_translation(self,
@@ -165,14 +175,10 @@ class BinarySearchOptimizer:
             
             if quality_improvement > self.convergence_threshold:
                 self.optimization_stats["successful_optimizations"] += 1
-                self.optimization_stats["avg_improvement"] = (
-                    self.optimization_stats["avg_improvement"] + quality_improvement
-                ) / 2
+                self.optimization_stats["total_improvement"] += quality_improvement
             
             total_time = time.time() - start_time
-            self.optimization_stats["avg_optimization_time"] = (
-                self.optimization_stats["avg_optimization_time"] + total_time
-            ) / 2
+            self.optimization_stats["total_optimization_time"] += total_time
             
             return OptimizationResult(
                 optimal_chunk_size=fine_tuned_result.chunk_size,
@@ -184,6 +190,8 @@ class BinarySearchOptimizer:
                 search_points=sample_points,
                 convergence_iterations=len(sample_points),
                 total_optimization_time=total_time,
+                optimal_chunking=fine_tuned_result.chunking_result,
+                optimal_translated_chunks=fine_tuned_result.translated_chunks,
                 metadata={
                     "strategy": strategy.value,
                     "baseline_quality": baseline_quality,
@@ -244,6 +252,19 @@ class BinarySearchOptimizer:
             logger.error(f"Quality curve sampling failed: {e}")
             return []
 
+    def _get_chunker(self, min_chunk_size: int, max_chunk_size: int) -> SemanticChunker:
+        """Get a pooled chunker for the given size bounds, creating it on first use."""
+        key = (min_chunk_size, max_chunk_size)
+        chunker = self._chunker_pool.get(key)
+        if chunker is None:
+            chunker = self.chunker.with_size_bounds(min_chunk_size, max_chunk_size)
+            self._chunker_pool[key] = chunker
+            if len(self._chunker_pool) > _CHUNKER_POOL_SIZE:
+                self._chunker_pool.popitem(last=False)
+        else:
+            self._chunker_pool.move_to_end(key)
+        return chunker
+
     async def _evaluate_chunk_size(self,
                                  text: str,
                                  source_lang: str,
@@ -254,20 +275,18 @@ class BinarySearchOptimizer:
         eval_start = time.time()
         
         try:
-            # Create chunker with specific size
-            temp_chunker = SemanticChunker(
-                min_chunk_size=max(chunk_size - 50, self.min_chunk_size),
-                max_chunk_size=chunk_size
-            )
+            # Get chunker for this specific size
+            chunker = self._get_chunker(max(chunk_size - 50, self.min_chunk_size), chunk_size)
             
             # Perform chunking
-            chunking_result = await temp_chunker.chunk_text(text, source_lang, target_lang)
+            chunking_result = await chunker.chunk_text(text, source_lang, target_lang)
             
             # Translate chunks
             if len(chunking_result.chunks) == 1:
                 translation = await self.translation_function(
                     chunking_result.chunks[0], source_lang, target_lang, api_key
                 )
+                translated_chunks = [translation]
             else:
                 # Parallel translation of chunks
                 translation_tasks = [
@@ -275,13 +294,14 @@ class BinarySearchOptimizer:
                     for chunk in chunking_result.chunks
                 ]
                 translated_chunks = await asyncio.gather(*translation_tasks)
-                translation = " ".join(translated_chunks)
+                translation = join_chunks(translated_chunks, target_lang)
             
             # Assess quality
             translation_pair = TranslationPair(
                 original=text,
                 translation=translation,
                 chunks_original=chunking_result.chunks,
+                chunks_translated=translated_chunks,
                 language_pair=(source_lang, target_lang)
             )
             
@@ -295,7 +315,8 @@ class BinarySearchOptimizer:
                 translation=translation,
                 chunking_result=chunking_result,
                 processing_time=processing_time,
-                confidence=1.0 - abs(quality_metrics.confidence_interval[1] - quality_metrics.confidence_interval[0])
+                confidence=1.0 - abs(quality_metrics.confidence_interval[1] - quality_metrics.confidence_interval[0]),
+                translated_chunks=translated_chunks
             )
             
         except Exception as e:
@@ -460,6 +481,9 @@ class BinarySearchOptimizer:
                             start_time: float,
                             strategy: OptimizationStrategy) -> OptimizationResult:
         """Create result for failed optimization."""
+        total_time = time.time() - start_time
+        self.optimization_stats["total_optimization_time"] += total_time
+        
         return OptimizationResult(
             optimal_chunk_size=300,  # Default safe chunk size
             optimal_translation=baseline_translation,
@@ -469,7 +493,7 @@ class BinarySearchOptimizer:
             optimization_confidence=0.0,
             search_points=[],
             convergence_iterations=0,
-            total_optimization_time=time.time() - start_time,
+            total_optimization_time=total_time,
             metadata={
                 "optimization_failed": True,
                 "strategy": strategy.value
@@ -478,14 +502,14 @@ class BinarySearchOptimizer:
 
     async def get_optimization_stats(self) -> Dict[str, Any]:
         """Get optimization performance statistics."""
-        success_rate = 0.0
-        if self.optimization_stats["total_optimizations"] > 0:
-            success_rate = (self.optimization_stats["successful_optimizations"] / 
-                          self.optimization_stats["total_optimizations"])
+        total = self.optimization_stats["total_optimizations"]
+        successful = self.optimization_stats["successful_optimizations"]
         
         return {
             **self.optimization_stats,
-            "success_rate": success_rate,
+            "success_rate": successful / total if total else 0.0,
+            "avg_improvement": self.optimization_stats["total_improvement"] / successful if successful else 0.0,
+            "avg_optimization_time": self.optimization_stats["total_optimization_time"] / total if total else 0.0,
             "convergence_threshold": self.convergence_threshold,
             "max_iterations": self.max_iterations,
             "chunk_size_range": (self.min_chunk_size, self.max_chunk_size)
@@ -6,13 +6,16 @@ Supports local cache, Redis cache, and pattern-based cache optimization for tran
 """
 
 import json
+import re
 import hashlib
+import functools
 import logging
 import asyncio
 from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import time
+from collections import OrderedDict
 
 import redis.asyncio as redis
 import numpy as np
@@ -23,6 +26,45 @@ from .semantic_chunker import ChunkingResult
 
 logger = logging.getLogger(__name__)
 
+# Redis keys scanned and unlinked per round trip during invalidation
+_INVALIDATION_BATCH_SIZE = 500
+
+# Short phrases differing only in a trailing "." or "!" also share a secondary key
+_SHORT_TEXT_LENGTH = 64
+_TRAILING_STOPS = re.compile(r"[.!]+$")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so layout-only variants share a cache key."""
+    return " ".join(text.split())
+
+
+@functools.lru_cache(maxsize=128)
+def text_hash(text: str) -> str:
+    """Hash normalized text for cache keys; memoized since lookup and store hash the same text."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()[:16]
+
+
+def phrase_variant(text: str) -> Optional[str]:
+    """
+    Secondary cache text for a short phrase ending in "." or "!".
+    
+    "Thanks!" and "Thanks." both map to "Thanks", whose exact key they share
+    as a fallback. Other punctuation changes meaning and is never dropped.
+    """
+    normalized = normalize_text(text)
+    if len(normalized) > _SHORT_TEXT_LENGTH:
+        return None
+    variant = _TRAILING_STOPS.sub("", normalized).rstrip()
+    return variant if variant and variant != normalized else None
+
+
+def quantize_embedding(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Quantize a vector to int8 codes and a per-vector scale, with vector ~= codes * scale."""
+    peak = float(np.max(np.abs(vector)))
+    scale = peak / 127.0 if peak > 0 else 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
 
 @dataclass
 class CacheKey:
@@ -87,9 +129,8 @@ class IntelligentCacheManager:
         self.redis_ttl = redis_ttl
         self.similarity_threshold = similarity_threshold
         
-        # Local cache
-        self.local_cache: Dict[str, CacheEntry] = {}
-        self.local_access_order: List[str] = []
+        # Local cache, least recently used first
+        self.local_cache: Dict[str, CacheEntry] = OrderedDict()
         
         # Redis connection
         self.redis_client: Optional[redis.Redis] = None
@@ -102,6 +143,9 @@ class IntelligentCacheManager:
             logger.warning(f"Failed to load embedding model {embedding_model}: {e}")
             self.embedder = None
         
+        # Unit-length embeddings of local entries as int8 codes and scale, keyed like local_cache
+        self._embeddings: Dict[str, Tuple[np.ndarray, float]] = {}
+        
         # Statistics
         self.stats = CacheStatistics()
         
@@ -132,11 +176,8 @@ class IntelligentCacheManager:
                           content_type: Optional[str] = None,
                           optimization_level: str = "semantic") -> CacheKey:
         """Generate structured cache key."""
-        # Create hash of text content
-        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
-        
         return CacheKey(
-            text_hash=text_hash,
+            text_hash=text_hash(text),
             source_lang=source_lang,
             target_lang=target_lang,
             chunk_size=chunk_size,
@@ -167,7 +208,8 @@ class IntelligentCacheManager:
                             target_lang: str,
                             chunk_size: Optional[int] = None,
                             content_type: Optional[str] = None,
-                            optimization_level: str = "semantic") -> Optional[CacheEntry]:
+                            optimization_level: str = "semantic",
+                            similarity_threshold: Optional[float] = None) -> Optional[CacheEntry]:
         """
         Get translation from cache with multi-level lookup and similarity matching.
         
@@ -178,6 +220,7 @@ class IntelligentCacheManager:
             chunk_size: Optional chunk size
             content_type: Optional content type
             optimization_level: Optimization level (semantic, optimized)
+            similarity_threshold: Override for the similarity tier threshold
             
         Returns:
             CacheEntry if found, None otherwise
@@ -185,20 +228,61 @@ class IntelligentCacheManager:
         start_time = time.time()
         self.stats.total_requests += 1
         
-        cache_key = self._generate_cache_key(
+        key_strings = [self._cache_key_to_string(self._generate_cache_key(
             text, source_lang, target_lang, chunk_size, content_type, optimization_level
+        ))]
+        variant = phrase_variant(text)
+        if variant:
+            key_strings.append(self._cache_key_to_string(self._generate_cache_key(
+                variant, source_lang, target_lang, chunk_size, content_type, optimization_level
+            )))
+        key_string = key_strings[0]
+        
+        # 1-2. Local then Redis lookup, exact key before the phrase variant
+        for candidate in key_strings:
+            entry = await self._lookup_exact(candidate)
+            if entry:
+                self.stats.cache_hits += 1
+                self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
+                return entry
+        
+        # 3. Similarity-based lookup
+        embedding = self.embed_text(text)
+        similar_entry = await self._find_similar_translation(
+            text, source_lang, target_lang, optimization_level,
+            threshold=similarity_threshold, embedding=embedding
         )
-        key_string = self._cache_key_to_string(cache_key)
         
+        if similar_entry:
+            # Store similar result with new key
+            await self.store_translation(
+                text, source_lang, target_lang, similar_entry.translation,
+                similar_entry.quality_metrics, similar_entry.chunking_result,
+                chunk_size, content_type, optimization_level,
+                embedding=embedding
+            )
+            
+            self.stats.cache_hits += 1
+            self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
+            
+            logger.debug(f"Similarity cache hit for text: {text[:50]}...")
+            return similar_entry
+        
+        # 4. Cache miss
+        self.stats.cache_misses += 1
+        self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
+        
+        logger.debug(f"Cache miss for key: {key_string}")
+        return None
+
+    async def _lookup_exact(self, key_string: str) -> Optional[CacheEntry]:
+        """Look a key up in the local cache, then Redis, promoting Redis hits locally."""
         # 1. Local cache lookup
         if key_string in self.local_cache:
             entry = self.local_cache[key_string]
             entry.access_count += 1
             entry.hit_count += 1
-            self._update_access_order(key_string)
-            
-            self.stats.cache_hits += 1
-            self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
+            self.local_cache.move_to_end(key_string)
             
             logger.debug(f"Local cache hit for key: {key_string}")
             return entry
@@ -214,38 +298,11 @@ class IntelligentCacheManager:
                     # Store in local cache
                     await self._store_local(key_string, entry)
                     
-                    self.stats.cache_hits += 1
-                    self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
-                    
                     logger.debug(f"Redis cache hit for key: {key_string}")
                     return entry
             except Exception as e:
                 logger.warning(f"Redis lookup failed: {e}")
         
-        # 3. Similarity-based lookup
-        similar_entry = await self._find_similar_translation(
-            text, source_lang, target_lang, optimization_level
-        )
-        
-        if similar_entry:
-            # Store similar result with new key
-            await self.store_translation(
-                text, source_lang, target_lang, similar_entry.translation,
-                similar_entry.quality_metrics, similar_entry.chunking_result,
-                chunk_size, content_type, optimization_level
-            )
-            
-            self.stats.cache_hits += 1
-            self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
-            
-            logger.debug(f"Similarity cache hit for text: {text[:50]}...")
-            return similar_entry
-        
-        # 4. Cache miss
-        self.stats.cache_misses += 1
-        self.stats.avg_access_time = (self.stats.avg_access_time + (time.time() - start_time)) / 2
-        
-        logger.debug(f"Cache miss for key: {key_string}")
         return None
 
     async def store_translation(self,
@@ -258,7 +315,8 @@ class IntelligentCacheManager:
                               chunk_size: Optional[int] = None,
                               content_type: Optional[str] = None,
                               optimization_level: str = "semantic",
-                              optimization_time: Optional[float] = None):
+                              optimization_time: Optional[float] = None,
+                              embedding: Optional[np.ndarray] = None):
         """
         Store translation in multi-level cache.
         
@@ -273,6 +331,7 @@ class IntelligentCacheManager:
             content_type: Optional content type
             optimization_level: Optimization level
             optimization_time: Time taken for optimization
+            embedding: Precomputed embedding of ``text``, computed if omitted
         """
         cache_key = self._generate_cache_key(
             text, source_lang, target_lang, chunk_size, content_type, optimization_level
@@ -291,6 +350,26 @@ class IntelligentCacheManager:
         # Store in local cache
         await self._store_local(key_string, entry)
         
+        # Index the embedding for semantic lookups
+        if embedding is None:
+            embedding = self.embed_text(text)
+        if embedding is not None and key_string in self.local_cache:
+            self._embeddings[key_string] = quantize_embedding(embedding)
+        
+        # Short phrases ending in "." or "!" also fill their variant key, never
+        # replacing an entry stored for that exact text. The alias shares the
+        # primary's embedding so sphere invalidation removes both together.
+        variant = phrase_variant(text)
+        variant_key = None
+        if variant:
+            variant_key = self._cache_key_to_string(self._generate_cache_key(
+                variant, source_lang, target_lang, chunk_size, content_type, optimization_level
+            ))
+            if variant_key not in self.local_cache:
+                await self._store_local(variant_key, entry)
+                if key_string in self._embeddings and variant_key in self.local_cache:
+                    self._embeddings[variant_key] = self._embeddings[key_string]
+        
         # Store in Redis
         if self.redis_client:
             try:
@@ -300,6 +379,8 @@ class IntelligentCacheManager:
                     self.redis_ttl, 
                     json.dumps(entry_dict)
                 )
+                if variant_key:
+                    await self.redis_client.set(variant_key, json.dumps(entry_dict), ex=self.redis_ttl, nx=True)
                 logger.debug(f"Stored in Redis cache: {key_string}")
             except Exception as e:
                 logger.warning(f"Redis storage failed: {e}")
@@ -309,60 +390,108 @@ class IntelligentCacheManager:
 
     async def _store_local(self, key_string: str, entry: CacheEntry):
         """Store entry in local cache with LRU eviction."""
-        # Remove if already exists
-        if key_string in self.local_cache:
-            self.local_access_order.remove(key_string)
-        
-        # Add to cache
         self.local_cache[key_string] = entry
-        self.local_access_order.append(key_string)
+        self.local_cache.move_to_end(key_string)
         
         # Evict if over size limit
         while len(self.local_cache) > self.local_cache_size:
-            oldest_key = self.local_access_order.pop(0)
-            del self.local_cache[oldest_key]
+            oldest_key, _ = self.local_cache.popitem(last=False)
+            self._embeddings.pop(oldest_key, None)
+
+    def embed_text(self, text: str) -> Optional[np.ndarray]:
+        """Embed normalized text as a unit-length vector, or None without an embedder."""
+        if not self.embedder:
+            return None
+        
+        try:
+            # Case only matters for exact keys ("US" vs "us"); similarity ignores it
+            vector = np.asarray(self.embedder.encode([normalize_text(text).casefold()])[0], dtype=np.float32)
+            norm = np.linalg.norm(vector)
+        except Exception as e:
+            logger.warning(f"Text embedding failed: {e}")
+            return None
+        
+        return vector / norm if norm > 0 else None
+
+    def semantic_lookup(self,
+                        embedding: np.ndarray,
+                        source_lang: str,
+                        target_lang: str,
+                        threshold: Optional[float] = None,
+                        optimization_level: Optional[str] = None) -> Optional[CacheEntry]:
+        """
+        Find the most similar cached entry for a language pair.
+        
+        Args:
+            embedding: Unit-length query embedding from embed_text
+            source_lang: Source language
+            target_lang: Target language
+            threshold: Minimum cosine similarity, defaults to similarity_threshold
+            optimization_level: Optional optimization level to match
+            
+        Returns:
+            Closest CacheEntry at or above the threshold, None otherwise
+        """
+        threshold = self.similarity_threshold if threshold is None else threshold
+        
+        keys = [
+            key for key, entry in self.local_cache.items()
+            if key in self._embeddings
+            and entry.key.source_lang == source_lang
+            and entry.key.target_lang == target_lang
+            and (optimization_level is None or entry.key.optimization_level == optimization_level)
+        ]
+        if not keys:
+            return None
+        
+        similarities = self._similarities(keys, embedding)
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        
+        logger.debug(f"Found similar translation with similarity: {similarities[best]:.3f}")
+        return self.local_cache[keys[best]]
 
-    def _update_access_order(self, key_string: str):
-        """Update access order for LRU."""
-        if key_string in self.local_access_order:
-            self.local_access_order.remove(key_string)
-        self.local_access_order.append(key_string)
+    def _similarities(self, keys: List[str], embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity of a unit-length embedding to the indexed entries at ``keys``."""
+        codes = np.stack([self._embeddings[key][0] for key in keys])
+        scales = np.array([self._embeddings[key][1] for key in keys], dtype=np.float32)
+        return (codes @ embedding) * scales
 
     async def _find_similar_translation(self,
                                       text: str,
                                       source_lang: str,
                                       target_lang: str,
-                                      optimization_level: str) -> Optional[CacheEntry]:
+                                      optimization_level: str,
+                                      threshold: Optional[float] = None,
+                                      embedding: Optional[np.ndarray] = None) -> Optional[CacheEntry]:
         """Find similar translation using semantic similarity."""
         if not self.embedder:
             return None
         
         try:
-            # Get embedding for current text
-            text_embedding = self.embedder.encode([text])
+            if embedding is None:
+                embedding = self.embed_text(text)
+            if embedding is None:
+                return None
             
-            # Search through local cache
-            for cached_entry in self.local_cache.values():
-                if (cached_entry.key.source_lang == source_lang and
-                    cached_entry.key.target_lang == target_lang and
-                    cached_entry.key.optimization_level == optimization_level):
-                    
-                    # Get text from chunking result or reconstruct
-                    cached_text = self._reconstruct_original_text(cached_entry)
-                    if not cached_text:
-                        continue
-                    
-                    # Calculate similarity
-                    cached_embedding = self.embedder.encode([cached_text])
-                    similarity = np.dot(text_embedding[0], cached_embedding[0]) / (
-                        np.linalg.norm(text_embedding[0]) * np.linalg.norm(cached_embedding[0])
-                    )
-                    
-                    if similarity >= self.similarity_threshold:
-                        logger.debug(f"Found similar translation with similarity: {similarity:.3f}")
-                        return cached_entry
+            # Entries hydrated from Redis carry no embedding yet; index them once
+            for key_string, cached_entry in self.local_cache.items():
+                if key_string in self._embeddings:
+                    continue
+                if (cached_entry.key.source_lang != source_lang or
+                    cached_entry.key.target_lang != target_lang or
+                    cached_entry.key.optimization_level != optimization_level):
+                    continue
+                cached_text = self._reconstruct_original_text(cached_entry)
+                if cached_text:
+                    cached_embedding = self.embed_text(cached_text)
+                    if cached_embedding is not None:
+                        self._embeddings[key_string] = quantize_embedding(cached_embedding)
             
-            return None
+            return self.semantic_lookup(
+                embedding, source_lang, target_lang, threshold, optimization_level
+            )
             
         except Exception as e:
             logger.warning(f"Similarity search failed: {e}")
@@ -450,8 +579,16 @@ class IntelligentCacheManager:
     async def invalidate_pattern(self, 
                                source_lang: str,
                                target_lang: str,
-                               content_type: Optional[str] = None):
-        """Invalidate cache entries matching pattern."""
+                               content_type: Optional[str] = None) -> int:
+        """
+        Invalidate cache entries matching a language pair and content type.
+        
+        Redis keys are found with SCAN and removed with UNLINK in batches, so
+        large invalidations neither block Redis nor cost a round trip per key.
+        
+        Returns:
+            Number of Redis entries removed, or of local entries without Redis
+        """
         pattern = f"tg_translate:*:{source_lang}:{target_lang}:*"
         if content_type:
             pattern += f":type_{content_type}"
@@ -463,19 +600,62 @@ class IntelligentCacheManager:
                 keys_to_remove.append(key)
         
         for key in keys_to_remove:
-            del self.local_cache[key]
-            if key in self.local_access_order:
-                self.local_access_order.remove(key)
+            self._remove_local(key)
+        
+        if not self.redis_client:
+            return len(keys_to_remove)
         
         # Clear from Redis
-        if self.redis_client:
+        redis_removed = 0
+        try:
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=_INVALIDATION_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= _INVALIDATION_BATCH_SIZE:
+                    redis_removed += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                redis_removed += await self.redis_client.unlink(*batch)
+            logger.info(f"Invalidated {len(keys_to_remove)} local and {redis_removed} Redis entries")
+        except Exception as e:
+            logger.warning(f"Redis invalidation failed: {e}")
+        
+        return redis_removed
+
+    async def invalidate_sphere(self, embedding: np.ndarray, threshold: float) -> int:
+        """
+        Invalidate every cached entry semantically close to an embedding.
+        
+        Args:
+            embedding: Unit-length center of the invalidation sphere
+            threshold: Cosine similarity at or above which entries are removed
+            
+        Returns:
+            Number of local entries removed
+        """
+        keys = list(self._embeddings)
+        if not keys:
+            return 0
+        
+        similarities = self._similarities(keys, embedding)
+        keys_to_remove = [key for key, similarity in zip(keys, similarities) if similarity >= threshold]
+        
+        for key in keys_to_remove:
+            self._remove_local(key)
+        
+        if self.redis_client and keys_to_remove:
             try:
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    await self.redis_client.delete(*keys)
-                logger.info(f"Invalidated {len(keys_to_remove)} local and {len(keys) if keys else 0} Redis entries")
+                await self.redis_client.delete(*keys_to_remove)
             except Exception as e:
                 logger.warning(f"Redis invalidation failed: {e}")
+        
+        logger.info(f"Invalidated {len(keys_to_remove)} entries within similarity {threshold}")
+        return len(keys_to_remove)
+
+    def _remove_local(self, key: str):
+        """Remove an entry and its embedding from the local cache."""
+        self.local_cache.pop(key, None)
+        self._embeddings.pop(key, None)
 
     def _key_matches_pattern(self, key: str, source_lang: str, target_lang: str, content_type: Optional[str]) -> bool:
         """Check if key matches invalidation pattern."""
@@ -7,7 +7,7 @@ Evaluates translation quality using structural, semantic, and linguistic criteri
 
 import re
 import logging
-import asyncio
+import time
 from typing import List, Dict, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
@@ -20,6 +20,14 @@ from sklearn.metrics.pairwise import cosine_similarity
 logger = logging.getLogger(__name__)
 
 
+def adjacent_coherence(embeddings: np.ndarray) -> float:
+    """Mean cosine similarity between adjacent chunk embeddings."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    unit = embeddings / np.where(norms == 0, 1.0, norms)
+    # Row-wise dot of each chunk with the next, without building the full similarity matrix
+    return float(np.mean(np.einsum("ij,ij->i", unit[:-1], unit[1:])))
+
+
 class QualityDimension(Enum):
     """Quality assessment dimensions."""
     CONFIDENCE = "confidence"           # Model confidence score
@@ -43,6 +51,19 @@ class QualityMetrics:
     improvement_suggestions: List[str]
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def unknown(cls) -> "QualityMetrics":
+        """Placeholder for a translation whose quality has not been assessed."""
+        return cls(
+            overall_score=0.0,
+            dimension_scores={},
+            confidence_interval=(0.0, 1.0),
+            quality_grade="N/A",
+            optimization_needed=False,
+            improvement_suggestions=[],
+            metadata={"assessed": False}
+        )
+
 
 @dataclass
 class TranslationPair:
@@ -115,23 +136,94 @@ class QualityMetricsEngine:
         """
         Perform comprehensive quality assessment of a translation.
         
+        Runs inline; use ``assess_quality_sync`` on a worker thread to keep the
+        event loop free.
+        
         Args:
             translation_pair: Original and translated text with metadata
             
         Returns:
             QualityMetrics with detailed assessment results
         """
+        return self.assess_quality_sync(translation_pair)
+
+    def assess_quality_sync(self, translation_pair: TranslationPair) -> QualityMetrics:
+        """Synchronous ``assess_quality``, for running on a worker thread."""
         if not translation_pair.translation.strip():
-            return QualityMetrics(
-                overall_score=0.0,
-                dimension_scores={dim: 0.0 for dim in QualityDimension},
-                confidence_interval=(0.0, 0.0),
-                quality_grade="F",
-                optimization_needed=True,
-                improvement_suggestions=["Translation is empty"],
-                metadata={"error": "Empty translation"}
-            )
+            return self._empty_translation_metrics()
+        
+        boundary_coherence = self._assess_boundary_coherence(translation_pair)
+        semantic_similarity = self._assess_semantic_similarity(translation_pair)
+        
+        return self._build_metrics(translation_pair, boundary_coherence, semantic_similarity)
+
+    async def assess_quality_batch(self, translation_pairs: List[TranslationPair]) -> List[QualityMetrics]:
+        """
+        Assess several translations, embedding all of their texts in one pass.
+        
+        Args:
+            translation_pairs: Translation pairs to assess
+            
+        Returns:
+            QualityMetrics for each pair, in the same order
+        """
+        return self.assess_quality_batch_sync(translation_pairs)
+
+    def assess_quality_batch_sync(self, translation_pairs: List[TranslationPair]) -> List[QualityMetrics]:
+        """Synchronous ``assess_quality_batch``, for running on a worker thread."""
+        results: List[Optional[QualityMetrics]] = [None] * len(translation_pairs)
+        
+        # Lay out original, translation and translated chunks of every pair in one list
+        texts: List[str] = []
+        spans: List[Tuple[int, int, int]] = []  # (pair index, first text index, chunk count)
+        for i, pair in enumerate(translation_pairs):
+            if not pair.translation.strip():
+                results[i] = self._empty_translation_metrics()
+                continue
+            
+            chunks = pair.chunks_translated if pair.chunks_translated and len(pair.chunks_translated) > 1 else []
+            spans.append((i, len(texts), len(chunks)))
+            texts.extend([pair.original, pair.translation, *chunks])
+        
+        embeddings = None
+        if self.embedder and texts:
+            try:
+                embeddings = self.embedder.encode(texts)
+            except Exception as e:
+                logger.warning(f"Batch embedding failed: {e}")
+        
+        for i, first, num_chunks in spans:
+            if embeddings is None:
+                semantic_similarity = 0.7  # Neutral score when embeddings unavailable
+                boundary_coherence = 0.7 if num_chunks else 1.0
+            else:
+                semantic_similarity = self._similarity_from_embeddings(embeddings[first], embeddings[first + 1])
+                boundary_coherence = (
+                    adjacent_coherence(embeddings[first + 2:first + 2 + num_chunks])
+                    if num_chunks else 1.0
+                )
+            
+            results[i] = self._build_metrics(translation_pairs[i], boundary_coherence, semantic_similarity)
         
+        return results
+
+    def _empty_translation_metrics(self) -> QualityMetrics:
+        """Metrics for an empty translation."""
+        return QualityMetrics(
+            overall_score=0.0,
+            dimension_scores={dim: 0.0 for dim in QualityDimension},
+            confidence_interval=(0.0, 0.0),
+            quality_grade="F",
+            optimization_needed=True,
+            improvement_suggestions=["Translation is empty"],
+            metadata={"error": "Empty translation"}
+        )
+
+    def _build_metrics(self,
+                       translation_pair: TranslationPair,
+                       boundary_coherence: float,
+                       semantic_similarity: float) -> QualityMetrics:
+        """Score the remaining dimensions and combine them with the embedding-based ones."""
         # Calculate individual dimension scores
         dimension_scores = {}
         
@@ -148,10 +240,10 @@ class QualityMetricsEngine:
         dimension_scores[QualityDimension.NAMED_ENTITY_PRESERVATION] = self._assess_entity_preservation(translation_pair)
         
         # 5. Boundary coherence (for chunked translations)
-        dimension_scores[QualityDimension.BOUNDARY_COHERENCE] = await self._assess_boundary_coherence(translation_pair)
+        dimension_scores[QualityDimension.BOUNDARY_COHERENCE] = boundary_coherence
         
         # 6. Semantic similarity
-        dimension_scores[QualityDimension.SEMANTIC_SIMILARITY] = await self._assess_semantic_similarity(translation_pair)
+        dimension_scores[QualityDimension.SEMANTIC_SIMILARITY] = semantic_similarity
         
         # 7. Target language fluency
         dimension_scores[QualityDimension.FLUENCY] = self._assess_fluency(translation_pair)
@@ -182,7 +274,7 @@ class QualityMetricsEngine:
             optimization_needed=optimization_needed,
             improvement_suggestions=improvement_suggestions,
             metadata={
-                "assessment_timestamp": asyncio.get_event_loop().time(),
+                "assessment_timestamp": time.monotonic(),  # Same clock as the event loop, usable off-loop
                 "language_pair": translation_pair.language_pair,
                 "original_length": len(translation_pair.original),
                 "translation_length": len(translation_pair.translation),
@@ -294,7 +386,7 @@ class QualityMetricsEngine:
         
         return preserved_count / len(original_entities)
 
-    async def _assess_boundary_coherence(self, translation_pair: TranslationPair) -> float:
+    def _assess_boundary_coherence(self, translation_pair: TranslationPair) -> float:
         """Assess coherence at chunk boundaries for chunked translations."""
         if not translation_pair.chunks_translated or len(translation_pair.chunks_translated) <= 1:
             return 1.0  # Perfect score for single chunk or no chunks
@@ -304,21 +396,14 @@ class QualityMetricsEngine:
         
         try:
             # Calculate semantic coherence between adjacent chunks
-            chunks = translation_pair.chunks_translated
-            embeddings = self.embedder.encode(chunks)
-            
-            coherence_scores = []
-            for i in range(len(embeddings) - 1):
-                similarity = cosine_similarity([embeddings[i]], [embeddings[i + 1]])[0][0]
-                coherence_scores.append(similarity)
-            
-            return float(np.mean(coherence_scores))
+            embeddings = self.embedder.encode(translation_pair.chunks_translated)
+            return adjacent_coherence(embeddings)
             
         except Exception as e:
             logger.warning(f"Boundary coherence assessment failed: {e}")
             return 0.7
 
-    async def _assess_semantic_similarity(self, translation_pair: TranslationPair) -> float:
+    def _assess_semantic_similarity(self, translation_pair: TranslationPair) -> float:
         """Assess semantic similarity between original and translation."""
         if not self.embedder:
             return 0.7  # Neutral score when embeddings unavailable
@@ -327,17 +412,17 @@ class QualityMetricsEngine:
             # Get embeddings for both texts
             texts = [translation_pair.original, translation_pair.translation]
             embeddings = self.embedder.encode(texts)
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-            
-            # Convert to 0-1 scale (cosine similarity can be negative)
-            return max(0.0, float(similarity))
+            return self._similarity_from_embeddings(embeddings[0], embeddings[1])
             
         except Exception as e:
             logger.warning(f"Semantic similarity assessment failed: {e}")
             return 0.7
 
+    @staticmethod
+    def _similarity_from_embeddings(original: np.ndarray, translation: np.ndarray) -> float:
+        """Cosine similarity clipped to a 0-1 scale (cosine similarity can be negative)."""
+        return max(0.0, float(cosine_similarity([original], [translation])[0][0]))
+
     def _assess_fluency(self, translation_pair: TranslationPair) -> float:
         """Assess target language fluency."""
         translation = translation_pair.translation
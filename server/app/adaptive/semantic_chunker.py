@@ -6,6 +6,7 @@ Handles emotional text, technical content, and conversational messages with appr
 """
 
 import re
+import copy
 import logging
 import asyncio
 from typing import List, Dict, Tuple, Optional, Any
@@ -17,6 +18,8 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from .quality_assessment import adjacent_coherence
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt')
@@ -30,6 +33,29 @@ except LookupError:
 
 logger = logging.getLogger(__name__)
 
+# Target languages whose scripts do not separate words or sentences with spaces
+_UNSPACED_LANGUAGES = frozenset({"zh", "ja", "th", "lo", "km", "my"})
+
+
+def chunk_separator(target_lang: str) -> str:
+    """Separator placed between translated chunks in the target script."""
+    base_lang = target_lang.replace("_", "-").split("-")[0].lower()
+    return "" if base_lang in _UNSPACED_LANGUAGES else " "
+
+
+def join_chunks(translated_chunks: List[str], target_lang: str) -> str:
+    """
+    Join translated chunks into one translation in the target script.
+    
+    Chinese, Japanese, Thai, Lao, Khmer and Burmese chunks are concatenated
+    directly; other languages get a single space. Chunks are stripped first
+    so whitespace a model leaves around a chunk never doubles the separator.
+    A single chunk is returned unchanged.
+    """
+    if len(translated_chunks) == 1:
+        return translated_chunks[0]
+    return chunk_separator(target_lang).join(chunk.strip() for chunk in translated_chunks)
+
 
 class ContentType(Enum):
     """Content type classification for adaptive chunking strategies."""
@@ -115,6 +141,13 @@ class SemanticChunker:
             r'\b[a-zA-Z]+_[a-zA-Z]+\b',  # Technical terms with underscores
         ]
 
+    def with_size_bounds(self, min_chunk_size: int, max_chunk_size: int) -> "SemanticChunker":
+        """Shallow copy with different size bounds, sharing this chunker's loaded embedding model."""
+        sized_chunker = copy.copy(self)
+        sized_chunker.min_chunk_size = min_chunk_size
+        sized_chunker.max_chunk_size = max_chunk_size
+        return sized_chunker
+
     async def chunk_text(self, 
                         text: str, 
                         source_lang: str = 'auto',
@@ -122,6 +155,26 @@ class SemanticChunker:
         """
         Perform context-aware semantic chunking of input text.
         
+        Runs inline; use ``chunk_text_sync`` on a worker thread to keep the
+        event loop free.
+        
+        Args:
+            text: Input text to chunk
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            ChunkingResult with optimized chunks and metadata
+        """
+        return self.chunk_text_sync(text, source_lang, target_lang)
+
+    def chunk_text_sync(self, 
+                        text: str, 
+                        source_lang: str = 'auto',
+                        target_lang: str = 'en') -> ChunkingResult:
+        """
+        Synchronous ``chunk_text``, for running on a worker thread.
+        
         Args:
             text: Input text to chunk
             source_lang: Source language code
@@ -148,16 +201,16 @@ class SemanticChunker:
         
         # Select chunking strategy based on content type
         if content_type == ContentType.EMOTIONAL:
-            chunks, boundaries = await self._chunk_emotional_content(text, discourse_features)
+            chunks, boundaries = self._chunk_emotional_content(text, discourse_features)
         elif content_type == ContentType.TECHNICAL:
-            chunks, boundaries = await self._chunk_technical_content(text, discourse_features)
+            chunks, boundaries = self._chunk_technical_content(text, discourse_features)
         elif content_type == ContentType.CONVERSATIONAL:
-            chunks, boundaries = await self._chunk_conversational_content(text, discourse_features)
+            chunks, boundaries = self._chunk_conversational_content(text, discourse_features)
         else:
-            chunks, boundaries = await self._chunk_semantic_similarity(text, discourse_features)
+            chunks, boundaries = self._chunk_semantic_similarity(text, discourse_features)
         
         # Calculate coherence score
-        coherence_score = await self._calculate_coherence_score(chunks)
+        coherence_score = self._calculate_coherence_score(chunks)
         
         # Estimate optimal chunk size for this content type
         optimal_size = self._estimate_optimal_size(text, content_type, discourse_features)
@@ -251,7 +304,7 @@ class SemanticChunker:
         else:
             return ContentType.FORMAL
 
-    async def _chunk_emotional_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_emotional_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Chunk emotional content preserving emotional context and flow."""
         sentences = nltk.sent_tokenize(text)
         chunks = []
@@ -280,7 +333,7 @@ class SemanticChunker:
         
         return chunks, boundaries
 
-    async def _chunk_technical_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_technical_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Chunk technical content preserving technical terms and concepts."""
         # Split on paragraph boundaries first for technical content
         paragraphs = text.split('\n\n')
@@ -326,7 +379,7 @@ class SemanticChunker:
         
         return chunks, boundaries
 
-    async def _chunk_conversational_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_conversational_content(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Chunk conversational content preserving dialogue flow."""
         # For short conversational content, often no chunking needed
         if len(text) <= self.max_chunk_size:
@@ -334,29 +387,29 @@ class SemanticChunker:
         
         # Split on dialogue markers or sentence boundaries
         sentences = nltk.sent_tokenize(text)
-        return await self._chunk_by_similarity(sentences, text)
+        return self._chunk_by_similarity(sentences, text)
 
-    async def _chunk_semantic_similarity(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_semantic_similarity(self, text: str, features: DiscourseFeatures) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Chunk using semantic similarity between sentences."""
         sentences = nltk.sent_tokenize(text)
         
         if not self.embedder or len(sentences) <= 2:
             # Fallback to simple sentence-based chunking
-            return await self._chunk_by_size(sentences, text)
+            return self._chunk_by_size(sentences, text)
         
-        return await self._chunk_by_similarity(sentences, text)
+        return self._chunk_by_similarity(sentences, text)
 
-    async def _chunk_by_similarity(self, sentences: List[str], full_text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_by_similarity(self, sentences: List[str], full_text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Group sentences by semantic similarity."""
         if not self.embedder:
-            return await self._chunk_by_size(sentences, full_text)
+            return self._chunk_by_size(sentences, full_text)
         
         try:
             # Get embeddings for all sentences
             embeddings = self.embedder.encode(sentences)
             
-            # Calculate similarity matrix
-            similarity_matrix = cosine_similarity(embeddings)
+            # Pairs of sentences similar enough to share a chunk
+            similar = cosine_similarity(embeddings) > self.similarity_threshold
             
             # Group sentences by similarity
             groups = []
@@ -370,13 +423,12 @@ class SemanticChunker:
                 current_length = len(sentence)
                 used.add(i)
                 
-                # Find similar sentences to group together
-                for j in range(i + 1, len(sentences)):
+                # Find similar sentences to group together, visiting only similar candidates
+                for j in (np.flatnonzero(similar[i, i + 1:]) + i + 1).tolist():
                     if j in used:
                         continue
                     
-                    if (similarity_matrix[i][j] > self.similarity_threshold and 
-                        current_length + len(sentences[j]) < self.max_chunk_size):
+                    if current_length + len(sentences[j]) < self.max_chunk_size:
                         current_group.append(j)
                         current_length += len(sentences[j])
                         used.add(j)
@@ -400,9 +452,9 @@ class SemanticChunker:
             
         except Exception as e:
             logger.warning(f"Similarity-based chunking failed: {e}, falling back to size-based")
-            return await self._chunk_by_size(sentences, full_text)
+            return self._chunk_by_size(sentences, full_text)
 
-    async def _chunk_by_size(self, sentences: List[str], full_text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    def _chunk_by_size(self, sentences: List[str], full_text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
         """Fallback chunking by size limits."""
         chunks = []
         boundaries = []
@@ -429,7 +481,7 @@ class SemanticChunker:
         
         return chunks, boundaries
 
-    async def _calculate_coherence_score(self, chunks: List[str]) -> float:
+    def _calculate_coherence_score(self, chunks: List[str]) -> float:
         """Calculate coherence score for the chunking result."""
         if not chunks or not self.embedder:
             return 0.5  # Neutral score
@@ -442,12 +494,7 @@ class SemanticChunker:
             embeddings = self.embedder.encode(chunks)
             
             # Calculate average similarity between adjacent chunks
-            similarities = []
-            for i in range(len(embeddings) - 1):
-                sim = cosine_similarity([embeddings[i]], [embeddings[i + 1]])[0][0]
-                similarities.append(sim)
-            
-            return float(np.mean(similarities))
+            return adjacent_coherence(embeddings)
             
         except Exception as e:
             logger.warning(f"Coherence calculation failed: {e}")
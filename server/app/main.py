@@ -34,7 +34,11 @@ from app.utils.language_detection import detect_language, detect_language_nllb_f
 from app.utils.language_metadata import get_language_metadata, validate_language_code, get_language_by_code
 
 # Import adaptive translation system for enhanced capabilities
-from app.adaptive.api_endpoints import router as adaptive_router, initialize_adaptive_system
+from app.adaptive.api_endpoints import (
+    router as adaptive_router,
+    initialize_adaptive_system,
+    shutdown_adaptive_system,
+)
 
 # Initialize FastAPI app with legacy NLLB API configuration
 # NOTE: This is the backward-compatible API. For new features, see:
@@ -179,6 +183,12 @@ async def startup_event():
         model = None
         tokenizer = None
 
+# Shutdown event to drain the adaptive system's background work
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish pending cache writes and quality batches, then close Redis."""
+    await shutdown_adaptive_system()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
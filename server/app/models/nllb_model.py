@@ -21,6 +21,7 @@ from .base import (
     LanguageDetectionError
 )
 from ..utils.language_codes import LanguageCodeConverter
+from ..utils.language_detection import SCRIPT_MARK_TABLE as _DETECT_TABLE
 
 logger = logging.getLogger(__name__)
 
@@ -204,11 +205,11 @@ class NLLBModel(TranslationModel):
             if not text or not text.strip():
                 return "en"  # Default for empty strings
             
-            text = text.lower()
+            marks = text.translate(_DETECT_TABLE)
             
             # Count Cyrillic characters and letters
-            cyrillic_chars = sum(1 for c in text if 0x0400 <= ord(c) <= 0x04FF)
-            latin_letters = sum(1 for c in text if 'a' <= c <= 'z')
+            cyrillic_chars = marks.count("C")
+            latin_letters = marks.count("L")
             
             # Count actual letters (Cyrillic + Latin) to ignore punctuation and numbers
             letter_count = cyrillic_chars + latin_letters
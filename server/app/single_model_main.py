@@ -18,7 +18,7 @@ from fastapi import FastAPI, HTTPException, Depends, Security, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security.api_key import APIKeyHeader
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -66,6 +66,7 @@ class SingleModelServer:
         self.model_name = model_name
         self.model: Optional[TranslationModel] = None
         self._initialized = False
+        self._model_info_dict: Optional[Dict[str, Any]] = None
     
     async def startup(self):
         """Initialize the single model instance."""
@@ -87,6 +88,7 @@ class SingleModelServer:
                 await self.model.cleanup()
                 self.model = None
             self._initialized = False
+            self._model_info_dict = None
             logger.info("Single-model server shutdown completed")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
@@ -122,6 +124,13 @@ class SingleModelServer:
             raise ModelNotReadyError("Model not ready", self.model_name)
         return self.model.get_model_info()
     
+    async def get_model_info_dict(self) -> Dict[str, Any]:
+        """Get model information serialized once for HTTP responses."""
+        if self._model_info_dict is None:
+            model_info = await self.get_model_info()
+            self._model_info_dict = model_info.model_dump()
+        return self._model_info_dict
+    
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Perform translation."""
         if not self.is_ready():
@@ -176,7 +185,8 @@ def create_app() -> FastAPI:
         title=f"Lingua Nexus - {model_name.title()} Translation API",
         description=f"Single-model translation API for {model_name}",
         version="2.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
     
     # Set up rate limiting (disable during testing)
@@ -225,7 +235,7 @@ def create_app() -> FastAPI:
         timestamp = time.time()
         
         if not server:
-            return HealthCheckResponse(
+            return HealthCheckResponse.build(
                 status="unhealthy",
                 model_name="unknown",
                 timestamp=timestamp,
@@ -237,10 +247,9 @@ def create_app() -> FastAPI:
             model_info = None
             
             if server.is_ready():
-                model_info_obj = await server.get_model_info()
-                model_info = model_info_obj.dict()
+                model_info = await server.get_model_info_dict()
             
-            return HealthCheckResponse(
+            return HealthCheckResponse.build(
                 status="healthy" if is_healthy else "unhealthy",
                 model_name=server.model_name,
                 model_info=model_info,
@@ -250,7 +259,7 @@ def create_app() -> FastAPI:
             
         except Exception as e:
             logger.error(f"Health check failed: {e}")
-            return HealthCheckResponse(
+            return HealthCheckResponse.build(
                 status="unhealthy",
                 model_name=server.model_name if server else "unknown",
                 timestamp=timestamp,
@@ -266,14 +275,13 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=503, detail="Model not ready")
         
         try:
-            model_info = await server.get_model_info()
-            return model_info.dict()
+            return await server.get_model_info_dict()
         except Exception as e:
             logger.error(f"Failed to get model info: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get model info: {str(e)}")
     
     # Translation endpoint
-    @app.post("/translate")
+    @app.post("/translate", response_model=None)
     @limiter.limit("10/minute")
     async def translate(
         request: Request, 
@@ -296,13 +304,14 @@ def create_app() -> FastAPI:
             
             processing_time = (time.time() - start_time) * 1000
             
-            return BaseTranslationResponse(
+            # Serialize directly with orjson; the response is built from trusted values
+            return ORJSONResponse(BaseTranslationResponse.build(
                 translated_text=translated_text,
                 source_lang=translation_req.source_lang,
                 target_lang=translation_req.target_lang,
                 model_name=server.model_name,
                 processing_time_ms=processing_time
-            )
+            ).model_dump())
             
         except ModelNotReadyError as e:
             raise HTTPException(status_code=503, detail=str(e))
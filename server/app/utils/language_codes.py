@@ -6,6 +6,7 @@ and model-specific formats, enabling seamless model switching while maintaining
 a common language interface.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, Set
 import logging
 
@@ -112,10 +113,14 @@ class LanguageCodeConverter:
     }
     
     @classmethod
+    @lru_cache(maxsize=512)
     def to_model_code(cls, iso_code: str, model_type: str) -> str:
         """
         Convert ISO 639-1 code to model-specific code.
         
+        Results are memoized; the mappings are static class attributes and
+        callers hit this twice per translation request.
+        
         Args:
             iso_code: ISO 639-1 language code (e.g., 'en', 'ru')
             model_type: Model type ('nllb', 'aya', 'openai')
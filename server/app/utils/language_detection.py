@@ -18,6 +18,16 @@ Integration with Multi-Model System:
 - Can be extended to support additional model-specific language sets
 """
 
+import string
+
+# Script-marking table for language detection: Cyrillic -> "C", Latin -> "L".
+# Lets str.translate/str.count scan the text in C instead of a Python loop.
+SCRIPT_MARK_TABLE = str.maketrans({
+    **{chr(cp): "C" for cp in range(0x0400, 0x0500)},
+    **{c: "L" for c in string.ascii_letters},
+})
+
+
 def detect_language(text):
     """Detect if text is Russian or English based on character analysis.
     
@@ -57,6 +57,7 @@ class TestSingleModelAPI:
         server.model = mock_model
         server.is_ready.return_value = True
         server.get_model_info = AsyncMock(return_value=mock_model.get_model_info())
+        server.get_model_info_dict = AsyncMock(return_value=mock_model.get_model_info().model_dump())
         server.translate = AsyncMock(return_value="Тестовый перевод")
         server.health_check = AsyncMock(return_value=True)
         return server
@@ -6,6 +6,8 @@ Tests orchestration logic, progressive translation, and integration of all compo
 
 import pytest
 import asyncio
+import dataclasses
+import threading
 import time
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -57,6 +59,25 @@ class TestAdaptiveTranslationRequest:
         assert request.user_preference == "quality"
         assert request.force_optimization == True
         assert request.max_optimization_time == 10.0
+    
+    def test_request_is_immutable_and_hashable(self):
+        """Test requests are frozen and usable as dict keys."""
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        same_request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            request.text = "changed"
+        assert {request: "cached"}[same_request] == "cached"
 
 
 class TestTranslationUpdate:
@@ -142,7 +163,7 @@ class TestAdaptiveTranslationController:
     def mock_chunker(self):
         """Mock semantic chunker."""
         chunker = Mock()
-        chunker.chunk_text = AsyncMock(return_value=ChunkingResult(
+        chunker.chunk_text_sync = Mock(return_value=ChunkingResult(
             chunks=["test chunk"],
             chunk_boundaries=[(0, 10)],
             content_type=ContentType.CONVERSATIONAL,
@@ -156,7 +177,7 @@ class TestAdaptiveTranslationController:
     def mock_quality_engine(self):
         """Mock quality assessment engine."""
         engine = Mock()
-        engine.assess_quality = AsyncMock(return_value=QualityMetrics(
+        engine.assess_quality_sync = Mock(return_value=QualityMetrics(
             overall_score=0.85,
             dimension_scores={QualityDimension.CONFIDENCE: 0.8},
             confidence_interval=(0.7, 0.9),
@@ -165,6 +186,9 @@ class TestAdaptiveTranslationController:
             improvement_suggestions=["Good quality"],
             metadata={}
         ))
+        engine.assess_quality_batch_sync = Mock(
+            side_effect=lambda pairs: [engine.assess_quality_sync.return_value] * len(pairs)
+        )
         return engine
     
     @pytest.fixture
@@ -255,6 +279,219 @@ class TestAdaptiveTranslationController:
         assert result.processing_time > 0
         # Should have fast response from cache
     
+    @pytest.mark.asyncio
+    async def test_translate_chunks_during_cache_lookup(self, controller, mock_cache_manager, mock_chunker):
+        """Test chunking overlaps a pending cache lookup and is not repeated on a miss."""
+        async def slow_lookup(**kwargs):
+            await asyncio.sleep(0.01)
+            return None
+        
+        mock_cache_manager.get_translation.side_effect = slow_lookup
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        result = await controller.translate(request)
+        
+        assert result.cache_hit == False
+        mock_chunker.chunk_text_sync.assert_called_once_with("Hello world", "en", "fr")
+    
+    @pytest.mark.asyncio
+    async def test_translate_coalesces_identical_inflight_requests(self, controller):
+        """Test identical concurrent requests share one pipeline run and its result."""
+        calls = []
+        
+        async def translate(text, source_lang, target_lang, api_key):
+            calls.append(text)
+            await asyncio.sleep(0.01)
+            return f"translated({text})"
+        
+        controller.translation_function = translate
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        same_request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        other_user = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="other_key"
+        )
+        
+        first, second, third = await asyncio.gather(
+            controller.translate(request),
+            controller.translate(same_request),
+            controller.translate(other_user)
+        )
+        
+        assert first is second
+        assert third is not first
+        assert calls == ["test chunk", "test chunk"]
+        assert controller.performance_stats["total_requests"] == 3
+        assert controller.performance_stats["coalesced_requests"] == 1
+        assert controller._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_coalesced_translation(self, controller):
+        """Test cancelling the first caller leaves the shared translation running for followers."""
+        async def translate(text, source_lang, target_lang, api_key):
+            await asyncio.sleep(0.02)
+            return f"translated({text})"
+        
+        controller.translation_function = translate
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        leader = asyncio.ensure_future(controller.translate(request))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(controller.translate(request))
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        result = await follower
+        
+        assert leader.cancelled()
+        assert result.translation == "translated(test chunk)"
+    
+    @pytest.mark.asyncio
+    async def test_translate_enforces_total_deadline(self, controller, mock_chunker):
+        """Test a stuck chunk translation is cancelled, with its siblings, at the request deadline."""
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
+            chunks=["fast chunk", "stuck chunk"],
+            chunk_boundaries=[(0, 10), (11, 22)],
+            content_type=ContentType.CONVERSATIONAL,
+            coherence_score=0.8,
+            optimal_size_estimate=300,
+            metadata={}
+        )
+        cancelled = []
+        
+        async def translate(text, source_lang, target_lang, api_key):
+            try:
+                await asyncio.sleep(0 if text == "fast chunk" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(text)
+                raise
+            return f"translated({text})"
+        
+        controller.translation_function = translate
+        
+        request = AdaptiveTranslationRequest(
+            text="fast chunk stuck chunk",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key",
+            total_deadline=0.05
+        )
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await controller.translate(request)
+        
+        assert cancelled == ["stuck chunk"]
+    
+    @pytest.mark.asyncio
+    async def test_progressive_translate_keeps_semantic_result_at_deadline(self, controller):
+        """Test progressive optimization that overruns the deadline falls back to the semantic result."""
+        async def stuck_optimization(request, semantic_result, quality_metrics):
+            await asyncio.sleep(10)
+        
+        controller._optimization_path = stuck_optimization
+        updates = []
+        
+        async def update_callback(update):
+            updates.append(update)
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key",
+            force_optimization=True,
+            total_deadline=0.05
+        )
+        
+        result = await controller.progressive_translate(request, update_callback)
+        
+        semantic = next(update for update in updates if update.stage == TranslationStage.OPTIMIZING)
+        assert result.optimization_applied is False
+        assert result.translation == semantic.translation
+        assert updates[-1].stage == TranslationStage.OPTIMIZED
+        assert updates[-1].translation == result.translation
+        assert TranslationStage.ERROR not in [update.stage for update in updates]
+    
+    @pytest.mark.asyncio
+    async def test_translate_fast_preference_assesses_in_background(self, controller, mock_quality_engine,
+                                                                     mock_cache_manager):
+        """Test fast requests return before quality assessment and cache once it completes."""
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key",
+            user_preference="fast"
+        )
+        
+        result = await controller.translate(request)
+        
+        assert result.quality_metrics.quality_grade == "N/A"
+        assert "quality_assessment" not in result.stage_times
+        mock_cache_manager.store_translation.assert_not_called()
+        
+        await asyncio.gather(*controller._background_tasks)
+        
+        mock_quality_engine.assess_quality_sync.assert_called_once()
+        mock_cache_manager.store_translation.assert_called_once()
+        assert mock_cache_manager.store_translation.call_args[1]["quality_metrics"].overall_score == 0.85
+    
+    @pytest.mark.asyncio
+    async def test_translate_caches_in_background(self, controller, mock_cache_manager):
+        """Test cache writes are detached and drained by aclose."""
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+        
+        async def slow_store(**kwargs):
+            write_started.set()
+            await release_write.wait()
+        
+        mock_cache_manager.store_translation.side_effect = slow_store
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        result = await controller.translate(request)
+        
+        assert result.cache_hit == False
+        assert controller._background_tasks
+        
+        await write_started.wait()
+        release_write.set()
+        await controller.aclose()
+        
+        assert not controller._background_tasks
+        mock_cache_manager.store_translation.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_translate_with_optimization(self, controller, mock_quality_engine):
         """Test translation that triggers optimization."""
@@ -287,7 +524,7 @@ class TestAdaptiveTranslationController:
             else:
                 return high_quality  # All subsequent calls: optimized translation assessment
         
-        mock_quality_engine.assess_quality.side_effect = quality_side_effect
+        mock_quality_engine.assess_quality_sync.side_effect = quality_side_effect
         
         request = AdaptiveTranslationRequest(
             text="Text needing optimization",
@@ -335,7 +572,7 @@ class TestAdaptiveTranslationController:
             else:
                 return improved_quality  # All subsequent calls: optimized translation assessment
         
-        mock_quality_engine.assess_quality.side_effect = quality_side_effect
+        mock_quality_engine.assess_quality_sync.side_effect = quality_side_effect
         
         request = AdaptiveTranslationRequest(
             text="Text with forced optimization",
@@ -402,6 +639,129 @@ class TestAdaptiveTranslationController:
         assert len(updates) > 0
         # Should still provide updates even for cached results
     
+    @pytest.mark.asyncio
+    async def test_progressive_translate_chunks_during_cache_lookup(self, controller, mock_cache_manager,
+                                                                    mock_chunker):
+        """Test progressive translation reuses chunking done while the cache lookup was pending."""
+        async def slow_lookup(**kwargs):
+            await asyncio.sleep(0.01)
+            return None
+        
+        mock_cache_manager.get_translation.side_effect = slow_lookup
+        
+        async def update_callback(update):
+            pass
+        
+        request = AdaptiveTranslationRequest(
+            text="Hello world",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        result = await controller.progressive_translate(request, update_callback)
+        
+        assert result.cache_hit == False
+        mock_chunker.chunk_text_sync.assert_called_once_with("Hello world", "en", "fr")
+    
+    @pytest.mark.asyncio
+    async def test_progressive_translate_slow_callback_receives_updates_in_order(self, controller):
+        """Test a slow callback is fed from a queue and still sees every update before return."""
+        updates = []
+        
+        async def slow_callback(update):
+            await asyncio.sleep(0.01)
+            updates.append(update)
+        
+        request = AdaptiveTranslationRequest(
+            text="Progressive translation test",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        await controller.progressive_translate(request, slow_callback)
+        
+        progress = [update.progress for update in updates]
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
+    
+    def test_coalesce_update_supersedes_same_stage(self, controller):
+        """Test a full update queue replaces the latest pending update of the same stage."""
+        queue = asyncio.Queue(maxsize=2)
+        queue.put_nowait(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.1))
+        queue.put_nowait(TranslationUpdate(stage=TranslationStage.ANALYZING, progress=0.7))
+        
+        controller._coalesce_update(queue, TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.6))
+        
+        pending = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [update.progress for update in pending] == [0.7, 0.6]
+    
+    def test_update_queue_size_must_hold_two_updates(self, mock_translation_function, mock_chunker,
+                                                     mock_quality_engine):
+        """Test a queue too small to merge pending deltas is rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveTranslationController(
+                translation_function=mock_translation_function,
+                chunker=mock_chunker,
+                quality_engine=mock_quality_engine,
+                update_queue_size=1
+            )
+    
+    def test_coalesce_update_merges_deltas(self, controller):
+        """Test a full update queue folds a new delta into the latest pending delta."""
+        queue = asyncio.Queue(maxsize=2)
+        queue.put_nowait(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.4, delta="Bonjour"))
+        queue.put_nowait(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.5, delta=" le"))
+        
+        controller._coalesce_update(queue, TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.6,
+                                                             delta=" monde"))
+        controller._coalesce_update(queue, None)
+        
+        pending = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert pending[0].delta == "Bonjour le monde"
+        assert pending[0].progress == 0.6
+        assert pending[1] is None
+    
+    @pytest.mark.asyncio
+    async def test_progressive_translate_streams_chunk_deltas_in_order(self, controller, mock_chunker):
+        """Test chunk deltas arrive in source order and concatenate to the semantic translation."""
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
+            chunks=["First part.", "Second part.", "Third part."],
+            chunk_boundaries=[(0, 11), (12, 24), (25, 36)],
+            content_type=ContentType.CONVERSATIONAL,
+            coherence_score=0.8,
+            optimal_size_estimate=300,
+            metadata={}
+        )
+        
+        async def translate(text, source_lang, target_lang, api_key):
+            # The third chunk finishes before the second
+            await asyncio.sleep(0.01 * (3 - len(text) % 3))
+            return f"translated({text})"
+        
+        controller.translation_function = translate
+        updates = []
+        
+        async def update_callback(update):
+            updates.append(update)
+        
+        request = AdaptiveTranslationRequest(
+            text="First part. Second part. Third part.",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        await controller.progressive_translate(request, update_callback)
+        
+        deltas = [update for update in updates if update.delta]
+        semantic = next(update for update in updates
+                        if update.stage == TranslationStage.SEMANTIC and update.translation)
+        assert "".join(update.delta for update in deltas) == semantic.translation
+        assert deltas[0].delta == "translated(First part.)"
+        assert [update.progress for update in deltas] == sorted(update.progress for update in deltas)
+    
     @pytest.mark.asyncio
     async def test_progressive_translate_with_optimization(self, controller, mock_quality_engine):
         """Test progressive translation that triggers optimization."""
@@ -435,7 +795,7 @@ class TestAdaptiveTranslationController:
             else:
                 return high_quality  # All subsequent calls: optimized translation assessment
         
-        mock_quality_engine.assess_quality.side_effect = quality_side_effect
+        mock_quality_engine.assess_quality_sync.side_effect = quality_side_effect
         
         updates = []
         async def update_callback(update):
@@ -477,7 +837,8 @@ class TestAdaptiveTranslationController:
             text="Cache check test",
             source_lang="en",
             target_lang="fr",
-            optimization_level="semantic"
+            optimization_level="semantic",
+            similarity_threshold=0.95
         )
     
     @pytest.mark.asyncio
@@ -497,14 +858,15 @@ class TestAdaptiveTranslationController:
             text="Quality cache test",
             source_lang="en",
             target_lang="fr",
-            optimization_level="optimized"  # Should request optimized for quality
+            optimization_level="optimized",  # Should request optimized for quality
+            similarity_threshold=0.95
         )
     
     @pytest.mark.asyncio
     async def test_semantic_translation_path_single_chunk(self, controller, mock_chunker, mock_translation_function):
         """Test semantic translation path with single chunk."""
         # Mock single chunk result
-        mock_chunker.chunk_text.return_value = ChunkingResult(
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
             chunks=["single chunk text"],
             chunk_boundaries=[(0, 17)],
             content_type=ContentType.CONVERSATIONAL,
@@ -530,7 +892,7 @@ class TestAdaptiveTranslationController:
     async def test_semantic_translation_path_multiple_chunks(self, controller, mock_chunker):
         """Test semantic translation path with multiple chunks."""
         # Mock multiple chunks result
-        mock_chunker.chunk_text.return_value = ChunkingResult(
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
             chunks=["chunk1", "chunk2", "chunk3"],
             chunk_boundaries=[(0, 6), (7, 13), (14, 20)],
             content_type=ContentType.NARRATIVE,
@@ -553,6 +915,100 @@ class TestAdaptiveTranslationController:
         assert result.translation == "translated(chunk1) translated(chunk2) translated(chunk3)"
         assert len(result.chunking_result.chunks) == 3
     
+    @pytest.mark.asyncio
+    async def test_semantic_translation_path_retries_failed_chunk(self, controller, mock_chunker):
+        """Test a failing chunk is retried without discarding the others."""
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
+            chunks=["chunk1", "chunk2"],
+            chunk_boundaries=[(0, 6), (7, 13)],
+            content_type=ContentType.NARRATIVE,
+            coherence_score=0.85,
+            optimal_size_estimate=350,
+            metadata={}
+        )
+        
+        calls = []
+        async def flaky_translate(text, source_lang, target_lang, api_key):
+            calls.append(text)
+            if text == "chunk2" and calls.count("chunk2") == 1:
+                raise Exception("Transient failure")
+            return f"translated({text})"
+        
+        controller.translation_function = flaky_translate
+        
+        request = AdaptiveTranslationRequest(
+            text="chunk1 chunk2",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        result = await controller._semantic_translation_path(request)
+        
+        assert result.translation == "translated(chunk1) translated(chunk2)"
+        assert calls.count("chunk1") == 1
+        assert calls.count("chunk2") == 2
+    
+    @pytest.mark.asyncio
+    async def test_semantic_translation_path_keeps_chunk_boundaries(self, controller, mock_chunker,
+                                                                     mock_quality_engine):
+        """Test translated chunks are carried through to quality assessment."""
+        mock_chunker.chunk_text_sync.return_value = ChunkingResult(
+            chunks=["first sentence.", "second sentence."],
+            chunk_boundaries=[(0, 15), (16, 32)],
+            content_type=ContentType.NARRATIVE,
+            coherence_score=0.85,
+            optimal_size_estimate=350,
+            metadata={}
+        )
+        
+        request = AdaptiveTranslationRequest(
+            text="first sentence. second sentence.",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        await controller.translate(request)
+        
+        translation_pair = mock_quality_engine.assess_quality_sync.call_args_list[0][0][0]
+        assert translation_pair.chunks_translated == [
+            "translated(first sentence.)", "translated(second sentence.)"
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_run_cpu_bound_uses_worker_thread(self, controller):
+        """Test CPU-bound calls run outside the event loop thread."""
+        def thread_name():
+            return threading.current_thread().name
+        
+        name = await controller.run_cpu_bound(thread_name)
+        
+        assert name.startswith("adaptive-cpu")
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_quality_assessments_are_batched(self, controller, mock_quality_engine):
+        """Test concurrent assessments are scored with one batch call."""
+        mock_quality_engine.assess_quality_batch_sync = Mock(
+            side_effect=lambda pairs: [Mock(overall_score=len(pair.translation)) for pair in pairs]
+        )
+        
+        results = await asyncio.gather(*(
+            controller._assess_translation_quality("original", "t" * i, None)
+            for i in range(1, 4)
+        ))
+        
+        assert [result.overall_score for result in results] == [1, 2, 3]
+        mock_quality_engine.assess_quality_batch_sync.assert_called_once()
+        mock_quality_engine.assess_quality_sync.assert_not_called()
+    
+    def test_running_mean_statistics(self, controller):
+        """Test statistics are true running means."""
+        for count, value in enumerate([1.0, 2.0, 6.0], start=1):
+            controller._update_running_mean("avg_processing_time", value, count)
+        
+        assert controller.performance_stats["avg_processing_time"] == pytest.approx(3.0)
+    
     @pytest.mark.asyncio
     async def test_optimization_path(self, controller, mock_binary_optimizer):
         """Test optimization path execution."""
@@ -575,13 +1031,47 @@ class TestAdaptiveTranslationController:
             api_key="test_key",
             user_preference="balanced"
         )
+        baseline_quality = Mock(overall_score=0.7)
         
-        result = await controller._optimization_path(request, semantic_result)
+        result = await controller._optimization_path(request, semantic_result, baseline_quality)
         
         assert isinstance(result, TranslationResult)
         assert result.optimization_applied == True
         assert result.translation == "optimized translation"
         mock_binary_optimizer.optimize_translation.assert_called_once()
+        assert mock_binary_optimizer.optimize_translation.call_args[1]["baseline_quality"] == 0.7
+        assert result.chunking_result is semantic_result.chunking_result
+    
+    @pytest.mark.asyncio
+    async def test_optimization_path_reuses_optimal_chunking(self, controller, mock_binary_optimizer):
+        """Test the optimizer's chunking and chunk translations are reused instead of re-chunking."""
+        optimal_chunking = Mock()
+        mock_binary_optimizer.optimize_translation.return_value.optimal_chunking = optimal_chunking
+        mock_binary_optimizer.optimize_translation.return_value.optimal_translated_chunks = ["a", "b"]
+        
+        semantic_result = TranslationResult(
+            translation="semantic translation",
+            original_text="test text",
+            quality_metrics=None,
+            chunking_result=Mock(),
+            processing_time=1.0,
+            cache_hit=False,
+            optimization_applied=False,
+            stage_times={},
+            metadata={}
+        )
+        
+        request = AdaptiveTranslationRequest(
+            text="test text",
+            source_lang="en",
+            target_lang="fr",
+            api_key="test_key"
+        )
+        
+        result = await controller._optimization_path(request, semantic_result, Mock(overall_score=0.7))
+        
+        assert result.chunking_result is optimal_chunking
+        assert result.metadata["translated_chunks"] == ["a", "b"]
     
     @pytest.mark.asyncio
     async def test_optimization_path_quality_strategy(self, controller, mock_binary_optimizer):
@@ -605,8 +1095,9 @@ class TestAdaptiveTranslationController:
             api_key="test_key",
             user_preference="quality"  # Quality-focused strategy
         )
+        baseline_quality = Mock(overall_score=0.7)
         
-        await controller._optimization_path(request, semantic_result)
+        await controller._optimization_path(request, semantic_result, baseline_quality)
         
         # Verify optimization was called with quality strategy
         call_args = mock_binary_optimizer.optimize_translation.call_args[1]
@@ -635,8 +1126,9 @@ class TestAdaptiveTranslationController:
             target_lang="fr",
             api_key="test_key"
         )
+        baseline_quality = Mock(overall_score=0.7)
         
-        result = await controller._optimization_path(request, semantic_result)
+        result = await controller._optimization_path(request, semantic_result, baseline_quality)
         
         # Should fall back to semantic result
         assert result == semantic_result
@@ -787,6 +1279,20 @@ class TestAdaptiveTranslationController:
         assert stats["cache_stats"] == mock_cache_stats
         assert stats["quality_threshold"] == 0.8
     
+    @pytest.mark.asyncio
+    async def test_get_performance_stats_is_snapshot(self, controller, mock_cache_manager):
+        """Test counters updated while cache stats are fetched do not leak into the snapshot."""
+        async def get_statistics():
+            controller.performance_stats["total_requests"] += 1
+            return Mock()
+        
+        mock_cache_manager.get_statistics.side_effect = get_statistics
+        
+        stats = await controller.get_performance_stats()
+        
+        assert stats["controller_stats"]["total_requests"] == 0
+        assert controller.performance_stats["total_requests"] == 1
+    
     @pytest.mark.asyncio
     async def test_get_performance_stats_no_cache(self, controller):
         """Test performance statistics without cache manager."""
@@ -0,0 +1,288 @@
+"""
+Unit tests for the Adaptive Translation API endpoints.
+
+Tests request/response conversion with a mocked adaptive controller.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adaptive import api_endpoints
+from app.adaptive.api_endpoints import router, get_controller, get_cache_manager
+from app.adaptive.adaptive_controller import TranslationResult, TranslationUpdate, TranslationStage
+from app.adaptive.quality_assessment import QualityMetrics, QualityDimension
+
+
+def _result(quality_metrics, translation="Bonjour le monde", original_text="Hello world"):
+    """Controller result carrying the given quality metrics."""
+    return TranslationResult(
+        translation=translation,
+        original_text=original_text,
+        quality_metrics=quality_metrics,
+        chunking_result=None,
+        processing_time=0.1,
+        cache_hit=False,
+        optimization_applied=False,
+        stage_times={"semantic_translation": 0.1},
+        metadata={}
+    )
+
+
+def _translate_request(text="Hello world"):
+    """JSON body of a fast translation request."""
+    return {
+        "text": text,
+        "source_lang": "en",
+        "target_lang": "fr",
+        "api_key": "test_key",
+        "user_preference": "fast"
+    }
+
+
+@pytest.fixture
+def controller():
+    """Mock adaptive controller."""
+    return Mock()
+
+
+@pytest.fixture
+def app(controller):
+    """Application serving the adaptive router with the controller dependency overridden."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_controller] = lambda: controller
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the adaptive router."""
+    return TestClient(app)
+
+
+class TestAdaptiveTranslateEndpoint:
+    """Test suite for the /adaptive/translate endpoint."""
+    
+    def _post(self, client):
+        """Post a fast translation request."""
+        return client.post("/adaptive/translate", json=_translate_request())
+    
+    def test_unassessed_translation_reports_no_quality(self, client, controller):
+        """Test a translation scored off the critical path reports null quality, not 0.0."""
+        controller.translate = AsyncMock(return_value=_result(QualityMetrics.unknown()))
+        
+        response = self._post(client)
+        
+        assert response.status_code == 200
+        assert response.json()["quality_score"] is None
+        assert response.json()["quality_grade"] is None
+    
+    def test_assessed_translation_reports_quality(self, client, controller):
+        """Test an assessed translation reports its score and grade."""
+        controller.translate = AsyncMock(return_value=_result(QualityMetrics(
+            overall_score=0.85,
+            dimension_scores={QualityDimension.CONFIDENCE: 0.8},
+            confidence_interval=(0.7, 0.9),
+            quality_grade="B",
+            optimization_needed=False,
+            improvement_suggestions=[],
+            metadata={}
+        )))
+        
+        response = self._post(client)
+        
+        assert response.status_code == 200
+        assert response.json()["quality_score"] == 0.85
+        assert response.json()["quality_grade"] == "B"
+
+
+class TestProgressiveTranslateEndpoint:
+    """Test suite for the /adaptive/translate/progressive SSE endpoint."""
+    
+    @pytest.fixture
+    def sent_frames(self):
+        """Response body frames in the order the application sent them."""
+        return []
+    
+    @pytest.fixture
+    def client(self, app, sent_frames):
+        """Test client recording each body frame as the application sends it."""
+        async def recording_app(scope, receive, send):
+            async def recording_send(message):
+                if message["type"] == "http.response.body" and message.get("body"):
+                    sent_frames.append(message["body"])
+                await send(message)
+            await app(scope, receive, recording_send)
+        return TestClient(recording_app)
+    
+    @staticmethod
+    def _events(response):
+        """Decode the SSE frames of a response body."""
+        return [json.loads(frame[len("data: "):]) for frame in response.text.split("\n\n") if frame]
+    
+    def test_frames_stream_incrementally_in_order(self, client, controller, sent_frames):
+        """Test each update is sent as its own frame before the translation finishes."""
+        frames_sent_mid_translation = []
+        
+        async def progressive_translate(request, update_callback):
+            await update_callback(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.45, delta="Bonjour"))
+            # Give the endpoint a chance to flush the first delta
+            for _ in range(100):
+                if sent_frames:
+                    break
+                await asyncio.sleep(0.01)
+            frames_sent_mid_translation.append(len(sent_frames))
+            await update_callback(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.6, delta=" le monde"))
+            return _result(QualityMetrics.unknown())
+        
+        controller.progressive_translate = progressive_translate
+        
+        response = client.post("/adaptive/translate/progressive", json=_translate_request())
+        events = self._events(response)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert frames_sent_mid_translation == [1]
+        assert [event.get("delta") for event in events] == ["Bonjour", " le monde", None]
+        assert [event["progress"] for event in events] == [0.45, 0.6, 1.0]
+        assert events[-1]["stage"] == "completed"
+        assert events[-1]["translation"] == "Bonjour le monde"
+        assert len(sent_frames) == len(events)
+    
+    def test_failure_ends_stream_with_error_frame(self, client, controller):
+        """Test a failed translation ends the stream with an error event after earlier updates."""
+        async def progressive_translate(request, update_callback):
+            await update_callback(TranslationUpdate(stage=TranslationStage.SEMANTIC, progress=0.45, delta="Bonjour"))
+            raise RuntimeError("model crashed")
+        
+        controller.progressive_translate = progressive_translate
+        
+        events = self._events(client.post("/adaptive/translate/progressive", json=_translate_request()))
+        
+        assert [event["stage"] for event in events] == ["semantic", "error"]
+        assert events[-1]["error"] == "model crashed"
+
+
+class TestBatchTranslateEndpoint:
+    """Test suite for the /adaptive/translate/batch endpoint."""
+    
+    @staticmethod
+    def _post(client, texts):
+        """Post a batch translating each of ``texts``."""
+        return client.post("/adaptive/translate/batch", json={"items": [_translate_request(text) for text in texts]})
+    
+    def test_results_keep_request_order(self, client, controller):
+        """Test results follow request order even when earlier items finish last."""
+        async def translate(request):
+            await asyncio.sleep(0.03 if request.text == "first" else 0)
+            return _result(QualityMetrics.unknown(), translation=f"fr({request.text})", original_text=request.text)
+        
+        controller.translate = translate
+        
+        response = self._post(client, ["first", "second", "third"])
+        
+        assert response.status_code == 200
+        assert [result["translation"] for result in response.json()["results"]] == [
+            "fr(first)", "fr(second)", "fr(third)"
+        ]
+    
+    def test_failed_item_returns_500(self, client, controller):
+        """Test a failing item fails the batch with a 500 naming the item."""
+        async def translate(request):
+            if request.text == "broken":
+                raise RuntimeError("model crashed")
+            return _result(QualityMetrics.unknown())
+        
+        controller.translate = translate
+        
+        response = self._post(client, ["fine", "broken"])
+        
+        assert response.status_code == 500
+        assert "item 1" in response.json()["detail"]
+        assert "model crashed" in response.json()["detail"]
+    
+    def test_item_past_deadline_returns_504(self, client, controller):
+        """Test an item exceeding its deadline fails the batch with a 504, not a 500."""
+        async def translate(request):
+            if request.text == "slow":
+                raise asyncio.TimeoutError()
+            return _result(QualityMetrics.unknown())
+        
+        controller.translate = translate
+        
+        response = self._post(client, ["slow", "fine"])
+        
+        assert response.status_code == 504
+        assert "Item 0" in response.json()["detail"]
+    
+    def test_empty_batch(self, client, controller):
+        """Test an empty batch returns no results without calling the controller."""
+        controller.translate = AsyncMock()
+        
+        response = self._post(client, [])
+        
+        assert response.status_code == 200
+        assert response.json() == {"results": []}
+        controller.translate.assert_not_called()
+
+
+class TestMonitoringSnapshots:
+    """Test suite for the memoized /adaptive/cache/stats and /adaptive/health snapshots."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_snapshots(self):
+        """Start every test without memoized snapshots."""
+        api_endpoints._snapshots.clear()
+        yield
+        api_endpoints._snapshots.clear()
+    
+    @pytest.fixture
+    def cache(self, app):
+        """Mock cache manager reporting fixed statistics."""
+        cache = Mock()
+        cache.get_statistics = AsyncMock(return_value=Mock(
+            hit_rate=0.5, total_requests=4, cache_hits=2, cache_misses=2, memory_usage={"local_entries": 2}
+        ))
+        app.dependency_overrides[get_cache_manager] = lambda: cache
+        return cache
+    
+    def test_cache_stats_etag_and_not_modified(self, client, cache):
+        """Test cache stats carry an ETag and a matching If-None-Match gets an empty 304."""
+        response = client.get("/adaptive/cache/stats")
+        etag = response.headers["etag"]
+        
+        not_modified = client.get("/adaptive/cache/stats", headers={"If-None-Match": etag})
+        other_etag = client.get("/adaptive/cache/stats", headers={"If-None-Match": '"stale"'})
+        
+        assert response.status_code == 200
+        assert response.json()["hit_rate"] == 0.5
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        assert other_etag.status_code == 200
+        assert other_etag.json() == response.json()
+        # Polls within the TTL reuse the snapshot
+        cache.get_statistics.assert_awaited_once()
+    
+    def test_unhealthy_status_is_not_memoized(self, client, monkeypatch):
+        """Test a 503 health check is rebuilt on the next poll instead of being served again."""
+        for component in ("chunker", "quality_engine", "cache_manager", "adaptive_controller"):
+            monkeypatch.setattr(api_endpoints, component, None)
+        
+        unhealthy = client.get("/adaptive/health")
+        
+        monkeypatch.setattr(api_endpoints, "chunker", Mock())
+        monkeypatch.setattr(api_endpoints, "quality_engine", Mock())
+        monkeypatch.setattr(api_endpoints, "cache_manager", Mock(redis_client=None))
+        monkeypatch.setattr(api_endpoints, "adaptive_controller", Mock())
+        healthy = client.get("/adaptive/health")
+        
+        assert unhealthy.status_code == 503
+        assert "etag" not in unhealthy.headers
+        assert healthy.status_code == 200
+        assert healthy.json()["status"] == "healthy"
+        assert "etag" in healthy.headers
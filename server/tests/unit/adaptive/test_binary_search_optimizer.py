@@ -14,7 +14,8 @@ from app.adaptive.binary_search_optimizer import (
     OptimizationStrategy,
     OptimizationPoint,
     OptimizationResult,
-    optimize_chunk_size
+    optimize_chunk_size,
+    _CHUNKER_POOL_SIZE
 )
 from app.adaptive.semantic_chunker import ChunkingResult, ContentType
 from app.adaptive.quality_assessment import QualityMetrics, QualityDimension
@@ -43,6 +44,7 @@ class TestBinarySearchOptimizer:
             optimal_size_estimate=300,
             metadata={}
         ))
+        chunker.with_size_bounds = Mock(return_value=chunker)
         return chunker
     
     @pytest.fixture
@@ -172,6 +174,48 @@ class TestBinarySearchOptimizer:
         assert point.translation is not None
         assert point.processing_time > 0
         assert point.chunking_result is not None
+        assert len(point.translated_chunks) == len(point.chunking_result.chunks)
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_chunk_size_joins_for_target_script(self, optimizer, mock_chunker):
+        """Test evaluated translations join chunks the way the controller does."""
+        mock_chunker.chunk_text.return_value = ChunkingResult(
+            chunks=["ab", "cd"],
+            chunk_boundaries=[(0, 2), (3, 5)],
+            content_type=ContentType.CONVERSATIONAL,
+            coherence_score=0.8,
+            optimal_size_estimate=300,
+            metadata={}
+        )
+        
+        zh_point = await optimizer._evaluate_chunk_size("ab cd", "en", "zh", "test_key", 300)
+        fr_point = await optimizer._evaluate_chunk_size("ab cd", "en", "fr", "test_key", 300)
+        
+        assert zh_point.translation == "badc"
+        assert fr_point.translation == "ba dc"
+    
+    def test_get_chunker_reuses_instances(self, optimizer, mock_chunker):
+        """Test chunkers are pooled by their size bounds and derived from the shared chunker."""
+        mock_chunker.with_size_bounds.side_effect = lambda min_size, max_size: Mock()
+        
+        first = optimizer._get_chunker(250, 300)
+        second = optimizer._get_chunker(250, 300)
+        other = optimizer._get_chunker(350, 400)
+        
+        assert first is second
+        assert first is not other
+        assert mock_chunker.with_size_bounds.call_count == 2
+    
+    def test_get_chunker_pool_is_bounded(self, optimizer, mock_chunker):
+        """Test the chunker pool evicts the least recently used size bounds."""
+        mock_chunker.with_size_bounds.side_effect = lambda min_size, max_size: Mock()
+        
+        first = optimizer._get_chunker(100, 150)
+        for size in range(200, 200 + 10 * _CHUNKER_POOL_SIZE, 10):
+            optimizer._get_chunker(size - 50, size)
+        
+        assert len(optimizer._chunker_pool) == _CHUNKER_POOL_SIZE
+        assert optimizer._get_chunker(100, 150) is not first
     
     def test_identify_optimal_region(self, optimizer):
         """Test optimal region identification."""
@@ -379,6 +423,22 @@ class TestBinarySearchOptimizer:
         assert isinstance(result, OptimizationResult)
         assert result.metadata.get("optimization_failed") is True
     
+    @pytest.mark.asyncio
+    async def test_optimization_stats_are_running_means(self, optimizer):
+        """Test averages weight every optimization equally rather than favouring the latest."""
+        optimizer.optimization_stats.update(
+            total_optimizations=4,
+            successful_optimizations=3,
+            total_improvement=0.3,
+            total_optimization_time=8.0
+        )
+        
+        stats = await optimizer.get_optimization_stats()
+        
+        assert stats["success_rate"] == 0.75
+        assert stats["avg_improvement"] == pytest.approx(0.1)
+        assert stats["avg_optimization_time"] == 2.0
+    
     @pytest.mark.asyncio
     async def test_get_optimization_stats(self, optimizer):
         """Test optimization statistics retrieval."""
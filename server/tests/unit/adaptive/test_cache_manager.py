@@ -16,7 +16,8 @@ from app.adaptive.cache_manager import (
     CacheKey,
     CacheEntry,
     CacheStatistics,
-    create_cache_manager
+    create_cache_manager,
+    quantize_embedding
 )
 from app.adaptive.quality_assessment import QualityMetrics, QualityDimension
 from app.adaptive.semantic_chunker import ChunkingResult, ContentType
@@ -128,6 +129,12 @@ class TestCacheStatistics:
         assert stats.redis_stats == redis_stats
 
 
+async def _async_iter(items):
+    """Yield items as an async iterator, like redis scan_iter."""
+    for item in items:
+        yield item
+
+
 class TestIntelligentCacheManager:
     """Test suite for IntelligentCacheManager class."""
     
@@ -140,6 +147,8 @@ class TestIntelligentCacheManager:
         redis_mock.setex = AsyncMock()
         redis_mock.delete = AsyncMock()
         redis_mock.keys = AsyncMock(return_value=[])
+        redis_mock.scan_iter = Mock(side_effect=lambda **kwargs: _async_iter([]))
+        redis_mock.unlink = AsyncMock(return_value=0)
         redis_mock.info = AsyncMock(return_value={
             "used_memory": 1024,
             "connected_clients": 5,
@@ -260,7 +269,6 @@ class TestIntelligentCacheManager:
         )
         
         manager.local_cache[key_string] = mock_entry
-        manager.local_access_order.append(key_string)
         
         result = await manager.get_translation("test", "en", "fr")
         
@@ -418,6 +426,20 @@ class TestIntelligentCacheManager:
         assert "key_1" in manager.local_cache
         assert "key_2" in manager.local_cache
     
+    @pytest.mark.asyncio
+    async def test_local_hit_refreshes_lru_position(self, cache_manager):
+        """Test a local cache hit protects the entry from the next eviction."""
+        manager, _ = cache_manager
+        manager.local_cache_size = 2
+        
+        for text in ("first", "second"):
+            await manager.store_translation(text, "en", "fr", f"{text}_fr", None, None)
+        
+        await manager.get_translation("first", "en", "fr")
+        await manager.store_translation("third", "en", "fr", "third_fr", None, None)
+        
+        assert [entry.translation for entry in manager.local_cache.values()] == ["first_fr", "third_fr"]
+    
     @pytest.mark.asyncio
     async def test_find_similar_translation(self, cache_manager):
         """Test similarity-based translation finding."""
@@ -492,6 +514,109 @@ class TestIntelligentCacheManager:
         
         assert result is None  # Should not match due to low similarity
     
+    def test_generate_cache_key_normalizes_text(self, cache_manager):
+        """Test whitespace variants share a cache key while case variants do not."""
+        manager, _ = cache_manager
+        
+        key1 = manager._generate_cache_key("Hello   World", "en", "fr")
+        key2 = manager._generate_cache_key(" Hello World\n", "en", "fr")
+        key3 = manager._generate_cache_key("US", "en", "fr")
+        key4 = manager._generate_cache_key("us", "en", "fr")
+        
+        assert key1.text_hash == key2.text_hash
+        assert key3.text_hash != key4.text_hash
+    
+    def test_generate_cache_key_keeps_punctuation(self, cache_manager):
+        """Test punctuation stays part of the exact cache key."""
+        manager, _ = cache_manager
+        
+        for text, other in [("Really?", "Really."), ("C++", "C"), ("$5", "5")]:
+            assert manager._generate_cache_key(text, "en", "fr").text_hash != \
+                manager._generate_cache_key(other, "en", "fr").text_hash
+    
+    @pytest.mark.asyncio
+    async def test_short_phrase_variants_share_entry(self, cache_manager):
+        """Test short phrases differing only in a trailing '.' or '!' fall back to a shared entry."""
+        manager, _ = cache_manager
+        manager.embedder = None
+        manager.redis_client = None
+        
+        await manager.store_translation("Thanks!", "en", "fr", "Merci !")
+        
+        entry = await manager.get_translation("Thanks.", "en", "fr")
+        assert entry is not None
+        assert entry.translation == "Merci !"
+        assert await manager.get_translation("Thanks?", "en", "fr") is None
+        
+        # An entry for the exact text is never replaced by a variant
+        await manager.store_translation("Thanks", "en", "fr", "Merci")
+        await manager.store_translation("Thanks.", "en", "fr", "Merci.")
+        assert (await manager.get_translation("Thanks", "en", "fr")).translation == "Merci"
+    
+    @pytest.mark.asyncio
+    async def test_semantic_lookup(self, cache_manager):
+        """Test semantic lookup against stored entry embeddings."""
+        manager, _ = cache_manager
+        
+        manager.embedder.encode.return_value = np.array([[1.0, 0.0]])
+        await manager.store_translation("stored text", "en", "fr", "stored translation")
+        
+        close = manager.semantic_lookup(np.array([0.99, 0.14]), "en", "fr", threshold=0.95)
+        far = manager.semantic_lookup(np.array([0.0, 1.0]), "en", "fr", threshold=0.95)
+        other_pair = manager.semantic_lookup(np.array([1.0, 0.0]), "en", "de", threshold=0.95)
+        
+        assert close.translation == "stored translation"
+        assert far is None
+        assert other_pair is None
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_sphere(self, cache_manager):
+        """Test invalidation of entries within a similarity radius."""
+        manager, mock_redis = cache_manager
+        
+        manager.embedder.encode.return_value = np.array([[1.0, 0.0]])
+        await manager.store_translation("first text", "en", "fr", "first")
+        manager.embedder.encode.return_value = np.array([[0.0, 1.0]])
+        await manager.store_translation("second text", "en", "fr", "second")
+        
+        removed = await manager.invalidate_sphere(np.array([1.0, 0.0]), 0.9)
+        
+        assert removed == 1
+        assert [entry.translation for entry in manager.local_cache.values()] == ["second"]
+        assert len(manager._embeddings) == 1
+        mock_redis.delete.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_sphere_removes_phrase_variants(self, cache_manager):
+        """Test invalidating a short phrase also removes the variant key it filled."""
+        manager, mock_redis = cache_manager
+        manager.embedder.encode.return_value = np.array([[1.0, 0.0]])
+        
+        await manager.store_translation("Thanks!", "en", "fr", "Merci !")
+        removed = await manager.invalidate_sphere(manager.embed_text("thanks"), 0.9)
+        
+        assert removed == 2
+        assert len(mock_redis.delete.call_args.args) == 2
+        manager.embedder.encode.return_value = np.array([[0.0, 1.0]])
+        assert await manager.get_translation("Thanks.", "en", "fr") is None
+        assert await manager.get_translation("Thanks", "en", "fr") is None
+    
+    def test_quantized_embeddings_preserve_similarity(self, cache_manager):
+        """Test int8-quantized embeddings score close to the full-precision cosine similarity."""
+        manager, _ = cache_manager
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((3, 384)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        
+        for i, vector in enumerate(vectors):
+            codes, _ = quantize_embedding(vector)
+            assert codes.dtype == np.int8
+            manager._embeddings[f"key_{i}"] = quantize_embedding(vector)
+        
+        similarities = manager._similarities(["key_0", "key_1", "key_2"], vectors[0])
+        
+        np.testing.assert_allclose(similarities, vectors @ vectors[0], atol=0.01)
+    
     def test_reconstruct_original_text(self, cache_manager):
         """Test original text reconstruction from cache entry."""
         manager, _ = cache_manager
@@ -664,20 +789,22 @@ class TestIntelligentCacheManager:
         manager.local_cache[key1] = Mock()
         manager.local_cache[key2] = Mock()
         manager.local_cache[key3] = Mock()
-        manager.local_access_order = [key1, key2, key3]
         
         # Mock Redis keys
-        mock_redis.keys.return_value = [key1.encode(), key2.encode()]
+        mock_redis.scan_iter.side_effect = lambda **kwargs: _async_iter([key1.encode(), key2.encode()])
+        mock_redis.unlink.return_value = 2
         
-        await manager.invalidate_pattern("en", "fr")
+        removed = await manager.invalidate_pattern("en", "fr")
         
         # Should remove en->fr entries from local cache
         assert key1 not in manager.local_cache
         assert key2 not in manager.local_cache
         assert key3 in manager.local_cache  # Different language pair
         
-        # Should delete from Redis
-        mock_redis.delete.assert_called_once()
+        # Should unlink from Redis in one batch
+        mock_redis.scan_iter.assert_called_once_with(match="tg_translate:*:en:fr:*", count=500)
+        mock_redis.unlink.assert_called_once_with(key1.encode(), key2.encode())
+        assert removed == 2
     
     def test_key_matches_pattern(self, cache_manager):
         """Test pattern matching for cache keys."""
@@ -101,6 +101,35 @@ class TestQualityMetricsEngine:
         assert "empty" in " ".join(result.improvement_suggestions).lower()
         assert "error" in result.metadata
     
+    @pytest.mark.asyncio
+    async def test_assess_quality_batch_matches_single(self, quality_engine, sample_translation_pairs):
+        """Test batch assessment embeds once and matches per-pair assessment."""
+        quality_engine.embedder.encode.side_effect = lambda texts: np.array(
+            [[float(len(text)), 1.0, 0.5] for text in texts]
+        )
+        chunked = TranslationPair(
+            original="First part. Second part.",
+            translation="Première partie. Deuxième partie.",
+            chunks_translated=["Première partie.", "Deuxième partie."],
+            language_pair=("en", "fr")
+        )
+        pairs = [
+            sample_translation_pairs['good_translation'],
+            sample_translation_pairs['empty_translation'],
+            chunked
+        ]
+        
+        quality_engine.embedder.encode.reset_mock()
+        batch_results = await quality_engine.assess_quality_batch(pairs)
+        assert quality_engine.embedder.encode.call_count == 1
+        
+        single_results = [await quality_engine.assess_quality(pair) for pair in pairs]
+        
+        assert len(batch_results) == len(pairs)
+        for batch_result, single_result in zip(batch_results, single_results):
+            assert batch_result.overall_score == pytest.approx(single_result.overall_score)
+            assert batch_result.dimension_scores == pytest.approx(single_result.dimension_scores)
+    
     def test_assess_confidence(self, quality_engine, sample_translation_pairs):
         """Test confidence assessment."""
         # Test with model confidence
@@ -198,7 +227,7 @@ class TestQualityMetricsEngine:
             chunks_translated=["Première partie.", "Deuxième partie."],
             language_pair=("en", "fr")
         )
-        coherence_score = await quality_engine._assess_boundary_coherence(chunked_pair)
+        coherence_score = quality_engine._assess_boundary_coherence(chunked_pair)
         assert 0.0 <= coherence_score <= 1.0
         
         # Test single chunk (should be perfect)
@@ -208,7 +237,7 @@ class TestQualityMetricsEngine:
             chunks_translated=["Bloc unique"],
             language_pair=("en", "fr")
         )
-        coherence_score = await quality_engine._assess_boundary_coherence(single_pair)
+        coherence_score = quality_engine._assess_boundary_coherence(single_pair)
         assert coherence_score == 1.0
         
         # Test no chunks
@@ -217,7 +246,7 @@ class TestQualityMetricsEngine:
             translation="Pas de blocs",
             language_pair=("en", "fr")
         )
-        coherence_score = await quality_engine._assess_boundary_coherence(no_chunks_pair)
+        coherence_score = quality_engine._assess_boundary_coherence(no_chunks_pair)
         assert coherence_score == 1.0
     
     @pytest.mark.asyncio
@@ -231,12 +260,12 @@ class TestQualityMetricsEngine:
             translation="Bonjour",
             language_pair=("en", "fr")
         )
-        similarity_score = await quality_engine._assess_semantic_similarity(pair)
+        similarity_score = quality_engine._assess_semantic_similarity(pair)
         assert similarity_score > 0.7  # Should be high with mocked similarity
         
         # Test without embedder
         quality_engine.embedder = None
-        similarity_score = await quality_engine._assess_semantic_similarity(pair)
+        similarity_score = quality_engine._assess_semantic_similarity(pair)
         assert similarity_score == 0.7  # Neutral score
     
     def test_assess_fluency(self, quality_engine):
@@ -14,7 +14,8 @@ from app.adaptive.semantic_chunker import (
     ChunkingResult, 
     ContentType, 
     DiscourseFeatures,
-    chunk_text_semantically
+    chunk_text_semantically,
+    join_chunks
 )
 
 
@@ -107,6 +108,14 @@ class TestSemanticChunker:
         # Technical content should preserve structure
         assert all(len(chunk) <= chunker.max_chunk_size for chunk in result.chunks)
     
+    def test_with_size_bounds_shares_embedder(self, chunker):
+        """Test a resized chunker shares the embedding model and leaves the original untouched."""
+        sized = chunker.with_size_bounds(200, 300)
+        
+        assert sized.embedder is chunker.embedder
+        assert (sized.min_chunk_size, sized.max_chunk_size) == (200, 300)
+        assert (chunker.min_chunk_size, chunker.max_chunk_size) == (100, 400)
+    
     def test_discourse_analysis(self, chunker):
         """Test discourse feature analysis."""
         text = "This is amazing! I love it. However, there are some technical issues. The API endpoint doesn't work properly."
@@ -168,7 +177,7 @@ class TestSemanticChunker:
         chunker.embedder.encode.return_value = mock_embeddings
         
         chunks = ["First chunk", "Second chunk", "Third chunk"]
-        coherence = await chunker._calculate_coherence_score(chunks)
+        coherence = chunker._calculate_coherence_score(chunks)
         
         assert 0.0 <= coherence <= 1.0
         assert coherence > 0.5  # High similarity should give good coherence
@@ -176,14 +185,14 @@ class TestSemanticChunker:
     @pytest.mark.asyncio
     async def test_coherence_single_chunk(self, chunker):
         """Test coherence for single chunk."""
-        coherence = await chunker._calculate_coherence_score(["Single chunk"])
+        coherence = chunker._calculate_coherence_score(["Single chunk"])
         assert coherence == 1.0  # Single chunk is perfectly coherent
     
     @pytest.mark.asyncio
     async def test_coherence_no_embedder(self, chunker):
         """Test coherence calculation when embedder is unavailable."""
         chunker.embedder = None
-        coherence = await chunker._calculate_coherence_score(["chunk1", "chunk2"])
+        coherence = chunker._calculate_coherence_score(["chunk1", "chunk2"])
         assert coherence == 0.5  # Neutral score
     
     def test_optimal_size_estimation(self, chunker):
@@ -246,7 +255,7 @@ class TestSemanticChunker:
         ]
         text = " ".join(sentences)
         
-        chunks, boundaries = await chunker._chunk_by_similarity(sentences, text)
+        chunks, boundaries = chunker._chunk_by_similarity(sentences, text)
         
         # Should group similar sentences together
         assert len(chunks) >= 1
@@ -258,7 +267,7 @@ class TestSemanticChunker:
         sentences = ["Short sentence."] * 10
         text = " ".join(sentences)
         
-        chunks, boundaries = await chunker._chunk_by_size(sentences, text)
+        chunks, boundaries = chunker._chunk_by_size(sentences, text)
         
         assert len(chunks) >= 1
         assert all(len(chunk) <= chunker.max_chunk_size for chunk in chunks)
@@ -324,6 +333,23 @@ class TestChunkTextSemanically:
         mock_chunker.chunk_text.assert_called_once_with("test text", "en", "ru")
 
 
+class TestJoinChunks:
+    """Test joining translated chunks for the target script."""
+    
+    def test_join_chunks_by_target_script(self):
+        """Test chunks are joined without spaces for unspaced scripts."""
+        chunks = ["第一句。", "第二句。"]
+        
+        assert join_chunks(chunks, "zh") == "第一句。第二句。"
+        assert join_chunks(chunks, "ja-JP") == "第一句。第二句。"
+        assert join_chunks(["One.", "Two."], "en") == "One. Two."
+    
+    def test_join_chunks_strips_chunk_padding(self):
+        """Test whitespace around chunks never doubles the separator."""
+        assert join_chunks([" One. ", "Two.\n"], "en") == "One. Two."
+        assert join_chunks([" Only chunk "], "en") == " Only chunk "
+
+
 class TestSemanticChunkerEdgeCases:
     """Test edge cases and error conditions."""
     
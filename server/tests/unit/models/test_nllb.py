@@ -332,6 +332,28 @@ class TestNLLBModel:
             # Verify model is not ready after cleanup
             assert mock_instance.is_ready() is False
 
+    @pytest.mark.asyncio
+    async def test_cleanup_fails_queued_batched_calls(self, mock_config, mock_transformers):
+        """Test cleanup fails calls still waiting in a micro-batch queue."""
+        from models.nllb.model import NLLBModel
+        
+        model = NLLBModel({**mock_config, 'batch_size': 4, 'max_wait_ms': 10000})
+        model._generate_batch = Mock(return_value=["Привет"])
+        
+        first = asyncio.ensure_future(model._translate_batched("Hello", "eng_Latn", "rus_Cyrl"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(model._translate_batched("Hi", "eng_Latn", "rus_Cyrl"))
+        await asyncio.sleep(0)
+        
+        await model.cleanup()
+        
+        # One call sat in the worker's partial batch, the other in the queue
+        with pytest.raises(ModelNotReadyError):
+            await asyncio.wait_for(first, timeout=1)
+        with pytest.raises(ModelNotReadyError):
+            await asyncio.wait_for(second, timeout=1)
+        model._generate_batch.assert_not_called()
+
     def test_device_configuration(self, mock_config):
         """Test device configuration and auto-detection."""
         with patch('torch.cuda.is_available', return_value=True):
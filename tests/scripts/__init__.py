@@ -0,0 +1 @@
+"""Script test package."""
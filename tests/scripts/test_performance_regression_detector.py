@@ -0,0 +1,156 @@
+"""
+Unit tests for the performance regression detector script.
+
+Tests metric classification with and without NumPy, lower-is-worse
+thresholds, and routing of each report to a single extractor.
+"""
+
+import json
+import os
+import sys
+import pytest
+from unittest.mock import Mock
+
+# The scripts directory is not a package; import the script as a module
+scripts_path = os.path.join(os.path.dirname(__file__), '../../scripts')
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
+
+import performance_regression_detector as detector_module
+from performance_regression_detector import PerformanceMetric, PerformanceRegressionDetector, _classify
+
+
+def _metric(current, baseline, threshold_percent, name="metric"):
+    """Metric with the given current value, baseline and threshold."""
+    return PerformanceMetric(
+        name=name,
+        current_value=current,
+        baseline_value=baseline,
+        threshold_percent=threshold_percent,
+        unit="ms"
+    )
+
+
+class TestPerformanceMetric:
+    """Test regression checks on single metrics."""
+    
+    def test_higher_is_worse_threshold(self):
+        """Test a positive threshold flags values above the baseline band."""
+        assert _metric(130.0, 100.0, 25.0).is_regression is True
+        assert _metric(120.0, 100.0, 25.0).is_regression is False
+        assert _metric(50.0, 100.0, 25.0).is_regression is False
+    
+    def test_lower_is_worse_threshold(self):
+        """Test a negative threshold (throughput, success rate) flags values below the baseline band."""
+        assert _metric(80.0, 100.0, -15.0, name="throughput").is_regression is True
+        assert _metric(90.0, 100.0, -15.0, name="throughput").is_regression is False
+        assert _metric(150.0, 100.0, -15.0, name="throughput").is_regression is False
+        assert _metric(0.94, 1.0, -5.0, name="success_rate").is_regression is True
+        assert _metric(0.96, 1.0, -5.0, name="success_rate").is_regression is False
+    
+    def test_missing_baseline_is_never_a_regression(self):
+        """Test metrics without a baseline are not flagged and report no change."""
+        metric = _metric(500.0, None, 25.0)
+        
+        assert metric.is_regression is False
+        assert metric.change_percent is None
+
+
+class TestClassify:
+    """Test splitting metrics into regressions, warnings and improvements."""
+    
+    @pytest.fixture(params=["numpy", "no_numpy"])
+    def classify(self, request, monkeypatch):
+        """_classify on the NumPy path and on the pure-Python fallback."""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(detector_module, "np", None)
+        return _classify
+    
+    def test_buckets(self, classify):
+        """Test each metric lands in the right bucket for both threshold signs."""
+        metrics = [
+            _metric(130.0, 100.0, 25.0),    # 0: 30% slower -> regression
+            _metric(115.0, 100.0, 25.0),    # 1: beyond half the threshold -> warning
+            _metric(110.0, 100.0, 25.0),    # 2: within half the threshold -> nothing
+            _metric(90.0, 100.0, 25.0),     # 3: 10% faster -> improvement
+            _metric(80.0, 100.0, -15.0),    # 4: 20% lower throughput -> regression
+            _metric(110.0, 100.0, -15.0),   # 5: 10% higher throughput -> warning
+            _metric(106.0, 100.0, -15.0),   # 6: 6% higher throughput -> improvement
+            _metric(96.0, 100.0, -15.0),    # 7: 4% lower throughput -> nothing
+            _metric(50.0, None, 25.0),      # 8: no baseline -> nothing
+            _metric(50.0, 0.0, 25.0),       # 9: zero baseline -> nothing
+        ]
+        
+        regressions, warnings, improvements = classify(metrics)
+        
+        assert regressions == [0, 4]
+        assert warnings == [1, 5]
+        assert improvements == [3, 6]
+    
+    def test_empty(self, classify):
+        """Test classifying no metrics yields empty buckets."""
+        assert classify([]) == ([], [], [])
+    
+    def test_regressions_agree_with_metric(self, classify):
+        """Test the regression bucket matches PerformanceMetric.is_regression."""
+        metrics = [_metric(current, 100.0, threshold)
+                   for current in (70.0, 84.0, 86.0, 100.0, 124.0, 126.0, 140.0)
+                   for threshold in (25.0, -15.0)]
+        
+        regressions, _, _ = classify(metrics)
+        
+        assert regressions == [i for i, metric in enumerate(metrics) if metric.is_regression]
+
+
+class TestReportRouting:
+    """Test each report is handed to exactly one extractor."""
+    
+    REPORTS = {
+        "model_loading": {"analysis": {"nllb_cpu": {"loading_time_stats": {"mean": 1.0}}}},
+        "inference": {"analysis": {"nllb_en_fr": {"latency_stats": {"mean": 1.0}}}},
+        "batch": {"analysis": {"nllb_batch8": {"duration_stats": {"mean": 1.0}}}},
+        "memory": {"memory_statistics": {"process_memory": {"rss_mb": 512.0}}},
+    }
+    
+    @pytest.fixture
+    def detector(self, tmp_path):
+        """Detector whose extractors are mocks returning no metrics."""
+        detector = PerformanceRegressionDetector(baseline_dir=str(tmp_path / "baselines"))
+        for extractor in PerformanceRegressionDetector._EXTRACTORS.values():
+            setattr(detector, extractor, Mock(return_value=[]))
+        return detector
+    
+    @staticmethod
+    def _write(tmp_path, filename, report):
+        """Write a report file and return its path."""
+        path = tmp_path / filename
+        path.write_text(json.dumps(report))
+        return str(path)
+    
+    @staticmethod
+    def _called(detector):
+        """Report types whose extractor was called."""
+        return [report_type for report_type, extractor in PerformanceRegressionDetector._EXTRACTORS.items()
+                if getattr(detector, extractor).called]
+    
+    @pytest.mark.parametrize("report_type", sorted(REPORTS))
+    def test_routes_by_content(self, detector, tmp_path, report_type):
+        """Test a report with an unrecognizable name is routed by its content alone."""
+        detector.analyze_report(self._write(tmp_path, "results.json", self.REPORTS[report_type]))
+        
+        assert self._called(detector) == [report_type]
+    
+    def test_filename_takes_precedence(self, detector, tmp_path):
+        """Test a recognizable filename picks the extractor even if the content suggests another."""
+        detector.analyze_report(self._write(tmp_path, "memory_report.json", self.REPORTS["inference"]))
+        
+        assert self._called(detector) == ["memory"]
+    
+    def test_unrecognized_report_yields_no_metrics(self, detector, tmp_path):
+        """Test a report matching no type calls no extractor."""
+        metrics = detector.analyze_report(self._write(tmp_path, "results.json", {"analysis": {}}))
+        
+        assert metrics == []
+        assert self._called(detector) == []